@@ -0,0 +1,29 @@
+"""add_research_job_lease
+
+Revision ID: 186894dc10bc
+Revises: 9903893467d4
+Create Date: 2026-10-17 20:15:39.670348
+
+"""
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '186894dc10bc'
+down_revision = '9903893467d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Jobs stored before leases existed are free for any worker to claim
+    op.add_column('researchjob', sa.Column('lease_owner', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True))
+    op.add_column('researchjob', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade():
+    op.drop_column('researchjob', 'lease_expires_at')
+    op.drop_column('researchjob', 'lease_owner')
@@ -0,0 +1,28 @@
+"""add_item_created_at
+
+Revision ID: 8aace5a83916
+Revises: c0aabc1c67ca
+Create Date: 2026-10-17 14:03:52.614207
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8aace5a83916'
+down_revision = 'c0aabc1c67ca'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing items get the migration time; the id breaks the tie when
+    # paginating on (created_at, id)
+    op.add_column('item', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.alter_column('item', 'created_at', server_default=None)
+
+
+def downgrade():
+    op.drop_column('item', 'created_at')
@@ -0,0 +1,39 @@
+"""add_item_updated_at_and_indexes
+
+Revision ID: 9903893467d4
+Revises: 8aace5a83916
+Create Date: 2026-10-17 19:58:24.168915
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9903893467d4'
+down_revision = '8aace5a83916'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('item', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.alter_column('item', 'updated_at', server_default=None)
+    # Build the indexes without blocking writes to large item tables
+    with op.get_context().autocommit_block():
+        op.create_index('ix_item_owner_id_created_at_id', 'item', ['owner_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_item_owner_id_content_type_created_at_id', 'item', ['owner_id', 'content_type', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_item_created_at_id', 'item', ['created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_item_perplexity_created_at_id', 'item', ['created_at', 'id'], unique=False, postgresql_where=sa.text("content_type = 'perplexity'"), postgresql_concurrently=True)
+        op.create_index('ix_item_gemini_created_at_id', 'item', ['created_at', 'id'], unique=False, postgresql_where=sa.text("content_type = 'gemini'"), postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_item_gemini_created_at_id', table_name='item', postgresql_concurrently=True)
+        op.drop_index('ix_item_perplexity_created_at_id', table_name='item', postgresql_concurrently=True)
+        op.drop_index('ix_item_created_at_id', table_name='item', postgresql_concurrently=True)
+        op.drop_index('ix_item_owner_id_content_type_created_at_id', table_name='item', postgresql_concurrently=True)
+        op.drop_index('ix_item_owner_id_created_at_id', table_name='item', postgresql_concurrently=True)
+    op.drop_column('item', 'updated_at')
@@ -1,19 +1,25 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
+from app.core.admission import ConcurrencyLimiter, Provider
+from app.core.auth_cache import cache_token, get_cached_token, get_cached_user
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import async_engine, engine
 from app.models import TokenPayload, User
 from app.services.gemini import GeminiService
+from app.services.gemini_jobs import GeminiJobSupervisor
 from app.services.perplexity import PerplexityService
+from app.services.perplexity_jobs import PerplexityJobManager
 from app.services.tavily import TavilyService
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -26,71 +32,182 @@ def get_db() -> Generator[Session, None, None]:
         yield session
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    # Objects stay loaded after commit: lazy refreshes cannot run implicitly
+    # on an AsyncSession
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 SessionDep = Annotated[Session, Depends(get_db)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_tavily_service() -> TavilyService:
-    """Factory function for TavilyService dependency injection.
+async def get_current_user(session: AsyncSessionDep, token: TokenDep) -> User:
+    # Tokens and users seen recently skip the signature check and the query
+    token_data = get_cached_token(token)
+    if token_data is None:
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+            )
+            token_data = TokenPayload(**payload)
+        except (InvalidTokenError, ValidationError):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Could not validate credentials",
+            )
+        cache_token(token, token_data, payload.get("exp"))
+    user = await get_cached_user(session, token_data.sub) if token_data.sub else None
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+
+CurrentUser = Annotated[User, Depends(get_current_user)]
 
-    Returns:
-        TavilyService: A configured TavilyService instance.
+
+async def get_current_active_superuser(current_user: CurrentUser) -> User:
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=403, detail="The user doesn't have enough privileges"
+        )
+    return current_user
+
+
+@asynccontextmanager
+async def _admitted(
+    request: Request, provider: Provider, current_user: User
+) -> AsyncIterator[None]:
+    """Hold an admission control slot of the provider for the current user."""
+    limiter: ConcurrencyLimiter = request.app.state.concurrency_limiter
+    async with limiter.acquire(provider, str(current_user.id)):
+        yield
+
+
+async def get_tavily_service(
+    request: Request, current_user: CurrentUser
+) -> AsyncGenerator[TavilyService, None]:
+    """Provide the app-scoped TavilyService for dependency injection.
+
+    The service and its connection pool are created once by the application
+    lifespan and shared across all Tavily endpoints. Each request holds a
+    Tavily admission slot of the current user until its response is sent.
+
+    Args:
+        request: The incoming request, used to reach the application state.
+        current_user: Authenticated user the admission slot is counted for.
+
+    Yields:
+        TavilyService: The shared TavilyService instance.
+
+    Raises:
+        AdmissionError: If the user or the provider is at its concurrency limit.
     """
-    return TavilyService()
+    async with _admitted(request, "tavily", current_user):
+        service: TavilyService = request.app.state.tavily_service
+        yield service
 
 
 TavilyDep = Annotated[TavilyService, Depends(get_tavily_service)]
 
 
-def get_perplexity_service() -> PerplexityService:
+async def get_perplexity_service(
+    request: Request, current_user: CurrentUser
+) -> AsyncGenerator[PerplexityService, None]:
     """Factory function for PerplexityService dependency injection.
 
-    Returns:
+    The service is bound to the app-scoped pooled httpx client created by
+    the application lifespan, so connections are reused across requests.
+    Each request holds a Perplexity admission slot of the current user
+    until its response is sent.
+
+    Args:
+        request: The incoming request, used to reach the application state.
+        current_user: Authenticated user the admission slot is counted for.
+
+    Yields:
         PerplexityService: A configured PerplexityService instance.
+
+    Raises:
+        AdmissionError: If the user or the provider is at its concurrency limit.
     """
-    return PerplexityService()
+    async with _admitted(request, "perplexity", current_user):
+        yield PerplexityService(
+            client=request.app.state.perplexity_client,
+            rate_limiter=request.app.state.rate_limiter,
+        )
 
 
 PerplexityDep = Annotated[PerplexityService, Depends(get_perplexity_service)]
 
 
-def get_gemini_service() -> GeminiService:
-    """Factory function for GeminiService dependency injection.
+def get_perplexity_jobs(request: Request) -> PerplexityJobManager:
+    """Provide the app-scoped PerplexityJobManager for dependency injection.
+
+    The manager is created once by the application lifespan so every
+    request shares the same worker pool and job state.
+
+    Args:
+        request: The incoming request, used to reach the application state.
 
     Returns:
+        PerplexityJobManager: The shared job manager instance.
+    """
+    jobs: PerplexityJobManager = request.app.state.perplexity_jobs
+    return jobs
+
+
+PerplexityJobsDep = Annotated[PerplexityJobManager, Depends(get_perplexity_jobs)]
+
+
+async def get_gemini_service(
+    request: Request, current_user: CurrentUser
+) -> AsyncGenerator[GeminiService, None]:
+    """Factory function for GeminiService dependency injection.
+
+    The service is bound to the app-scoped pooled httpx client created by
+    the application lifespan, so connections are reused across requests.
+    Each request holds a Gemini admission slot of the current user until
+    its response is sent.
+
+    Args:
+        request: The incoming request, used to reach the application state.
+        current_user: Authenticated user the admission slot is counted for.
+
+    Yields:
         GeminiService: A configured GeminiService instance.
+
+    Raises:
+        AdmissionError: If the user or the provider is at its concurrency limit.
     """
-    return GeminiService()
+    async with _admitted(request, "gemini", current_user):
+        yield GeminiService(
+            client=request.app.state.gemini_client,
+            rate_limiter=request.app.state.rate_limiter,
+        )
 
 
 GeminiDep = Annotated[GeminiService, Depends(get_gemini_service)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    user = session.get(User, token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return user
+def get_gemini_supervisor(request: Request) -> GeminiJobSupervisor:
+    """Provide the app-scoped GeminiJobSupervisor for dependency injection.
 
+    The supervisor is created once by the application lifespan so every
+    request shares the same background pollers and job state.
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+    Args:
+        request: The incoming request, used to reach the application state.
 
+    Returns:
+        GeminiJobSupervisor: The shared supervisor instance.
+    """
+    supervisor: GeminiJobSupervisor = request.app.state.gemini_supervisor
+    return supervisor
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
-    if not current_user.is_superuser:
-        raise HTTPException(
-            status_code=403, detail="The user doesn't have enough privileges"
-        )
-    return current_user
+
+GeminiSupervisorDep = Annotated[GeminiJobSupervisor, Depends(get_gemini_supervisor)]
@@ -6,74 +6,124 @@ polling workflow where clients submit a job, receive an interaction ID,
 and then poll for status updates until completion.
 
 Routes require JWT authentication via CurrentUser dependency and use
-GeminiDep for service injection.
+GeminiDep for service injection. Job progress is tracked server-side by the
+app-scoped GeminiJobSupervisor (GeminiSupervisorDep): one background poller
+per interaction, whose last known state is shared by every watcher.
 
 Endpoints:
     POST /gemini/deep-research/sync - Execute deep research and wait for completion
     POST /gemini/deep-research - Start async deep research job
     GET /gemini/deep-research/{interaction_id} - Poll for job status
+    GET /gemini/deep-research/{interaction_id}/events - Stream job progress as SSE
     DELETE /gemini/deep-research/{interaction_id} - Cancel running job
 """
 
+import logging
+import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import CurrentUser, GeminiDep
+from app.api.deps import CurrentUser, GeminiDep, GeminiSupervisorDep
+from app.exceptions.admission import AdmissionError
+from app.exceptions.gemini import GeminiAPIError
 from app.schemas.gemini import (
     GeminiDeepResearchJobResponse,
     GeminiDeepResearchRequest,
     GeminiDeepResearchResultResponse,
+    GeminiStreamEventType,
 )
+from app.schemas.tavily import ErrorResponse
+from app.services.gemini import GeminiService
+from app.services.gemini_jobs import GeminiJobSupervisor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/gemini", tags=["gemini"])
 
 
+async def _start_supervised(
+    gemini: GeminiService,
+    supervisor: GeminiJobSupervisor,
+    owner_id: uuid.UUID,
+    request: GeminiDeepResearchRequest,
+) -> GeminiDeepResearchJobResponse:
+    """Start an interaction in a reserved job slot and supervise it."""
+    body = request.model_dump(mode="json")
+    reservation = await supervisor.reserve(owner_id, request=body)
+    try:
+        job = await gemini.start_research(request)
+    except BaseException:
+        # Also on cancellation, so the slot is not held until its lease expires
+        await supervisor.release(reservation)
+        raise
+    await supervisor.track(
+        job.interaction_id,
+        owner_id=owner_id,
+        request=body,
+        status=job.status.value,
+        reservation=reservation,
+    )
+    return job
+
+
 @router.post("/deep-research/sync", response_model=GeminiDeepResearchResultResponse)
 async def deep_research_sync(
-    _current_user: CurrentUser,
+    current_user: CurrentUser,
     gemini: GeminiDep,
+    supervisor: GeminiSupervisorDep,
     request: GeminiDeepResearchRequest,
 ) -> Any:
     """Execute a deep research query and wait for completion.
 
-    Starts a deep research job and blocks until the job reaches a terminal
+    Starts a deep research job and waits until the job reaches a terminal
     state (completed, failed, or cancelled). This is a convenience endpoint
-    for clients that prefer a synchronous workflow.
+    for clients that prefer a synchronous workflow. The request only awaits
+    the supervisor's completion notification; polling happens in the shared
+    background poller.
 
     Note: This endpoint may take 20-60 minutes to complete for complex queries.
     Consider using the async workflow (POST + polling) for better control.
 
     Args:
-        _current_user: Authenticated user (required for authorization).
+        current_user: Authenticated user, recorded as the job owner.
         gemini: Injected GeminiService instance.
+        supervisor: Injected GeminiJobSupervisor instance.
         request: Deep research request with query and optional parameters.
 
     Returns:
         GeminiDeepResearchResultResponse with final status and results.
 
     Raises:
-        GeminiAPIError: If the job fails or polling exceeds max attempts.
+        GeminiAPIError: If the job fails or supervision times out.
+        AdmissionError: If the user already has the maximum number of
+            unfinished jobs.
     """
-    job = await gemini.start_research(request)
-    return await gemini.wait_for_completion(job.interaction_id)
+    job = await _start_supervised(gemini, supervisor, current_user.id, request)
+    return await supervisor.wait(job.interaction_id)
 
 
 @router.post("/deep-research", response_model=GeminiDeepResearchJobResponse)
 async def start_deep_research(
-    _current_user: CurrentUser,
+    current_user: CurrentUser,
     gemini: GeminiDep,
+    supervisor: GeminiSupervisorDep,
     request: GeminiDeepResearchRequest,
 ) -> Any:
     """Start a new deep research job.
 
     Submits a research query to the Gemini API and returns immediately with
-    an interaction ID. Use the poll endpoint to check job status and retrieve
-    results when complete.
+    an interaction ID. The job is recorded in the database and handed to the
+    supervisor, which starts polling it in the background right away and
+    resumes it after a restart. Use the poll endpoint to read job status and
+    retrieve results when complete.
 
     Args:
-        _current_user: Authenticated user (required for authorization).
+        current_user: Authenticated user, recorded as the job owner.
         gemini: Injected GeminiService instance.
+        supervisor: Injected GeminiJobSupervisor instance.
         request: Deep research request with query and optional parameters.
 
     Returns:
@@ -81,8 +131,10 @@ async def start_deep_research(
 
     Raises:
         GeminiAPIError: If the API request fails for any reason.
+        AdmissionError: If the user already has the maximum number of
+            unfinished jobs.
     """
-    return await gemini.start_research(request)
+    return await _start_supervised(gemini, supervisor, current_user.id, request)
 
 
 @router.get(
@@ -91,21 +143,23 @@ async def start_deep_research(
 )
 async def poll_deep_research(
     _current_user: CurrentUser,
-    gemini: GeminiDep,
+    supervisor: GeminiSupervisorDep,
     interaction_id: str,
-    last_event_id: str | None = Query(default=None),
+    _last_event_id: str | None = Query(default=None, alias="last_event_id"),
 ) -> Any:
     """Poll for deep research job status and results.
 
-    Retrieves the current status and any available outputs from a running
-    research job. The last_event_id parameter enables reconnection after
-    network interruption, allowing clients to resume from where they left off.
+    Returns the last known status and outputs recorded by the supervisor's
+    background poller, without calling the Gemini API. Only the first read
+    of an interaction the supervisor is not yet tracking waits for an
+    initial upstream poll.
 
     Args:
         _current_user: Authenticated user (required for authorization).
-        gemini: Injected GeminiService instance.
+        supervisor: Injected GeminiJobSupervisor instance.
         interaction_id: The interaction ID from job creation.
-        last_event_id: Optional ID of last received event for reconnection.
+        _last_event_id: Accepted for compatibility. The supervisor tracks
+            event IDs for upstream reconnection itself.
 
     Returns:
         GeminiDeepResearchResultResponse with current status and outputs.
@@ -113,9 +167,99 @@ async def poll_deep_research(
     Raises:
         GeminiAPIError: If the interaction is not found or polling fails.
     """
-    return await gemini.poll_research(
-        interaction_id=interaction_id,
-        last_event_id=last_event_id,
+    return await supervisor.get_status(interaction_id)
+
+
+def _sse_event(event: str, data: str, event_id: str | None = None) -> str:
+    """Format a server-sent event, tagged with an id when one is known."""
+    id_line = f"id: {event_id}\n" if event_id else ""
+    return f"{id_line}event: {event}\ndata: {data}\n\n"
+
+
+def _error_event(exc: GeminiAPIError | AdmissionError) -> str:
+    """Format an error as a server-sent error event with an ErrorResponse."""
+    error = ErrorResponse(
+        error_code=exc.error_code, message=exc.message, details=exc.details
+    )
+    return _sse_event(GeminiStreamEventType.ERROR.value, error.model_dump_json())
+
+
+@router.get("/deep-research/{interaction_id}/events", response_model=None)
+async def stream_deep_research_events(
+    _current_user: CurrentUser,
+    supervisor: GeminiSupervisorDep,
+    interaction_id: str,
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+    last_event_id: str | None = Query(default=None),
+) -> StreamingResponse:
+    """Stream deep research progress as server-sent events.
+
+    Pushes every update recorded by the supervisor's background poller
+    instead of having each client poll. Each event carries the upstream
+    event_id as its SSE id, so a reconnecting EventSource sends it back in
+    the Last-Event-ID header and only receives newer updates:
+    - thinking_update / research_update / final_result: a
+      GeminiDeepResearchResultResponse with the incremental outputs
+    - status: a GeminiDeepResearchResultResponse for status changes that
+      carry no event type
+    - error: an ErrorResponse when a poll fails. Transient errors (upstream
+      timeouts, rate limits, 5xx) keep the stream open while the poller
+      retries; an error that ends supervision also ends the stream.
+
+    The stream ends once the job reaches a terminal state.
+
+    Args:
+        _current_user: Authenticated user (required for authorization).
+        supervisor: Injected GeminiJobSupervisor instance.
+        interaction_id: The interaction ID from job creation.
+        last_event_id_header: Last-Event-ID header sent by reconnecting
+            EventSource clients.
+        last_event_id: Query fallback for clients that cannot set headers.
+            The header takes precedence.
+
+    Returns:
+        StreamingResponse of server-sent events.
+
+    Raises:
+        GeminiAPIError: If the interaction is not found or supervision
+            ends before the first update.
+    """
+    resume_from = last_event_id_header or last_event_id
+    updates = supervisor.subscribe(interaction_id, last_event_id=resume_from)
+    # Wait for the first update so fatal upstream errors still map to HTTP
+    # statuses; a transient error arrives as an update and is sent as an event
+    try:
+        first_update = await anext(updates, None)
+    except GeminiAPIError:
+        await updates.aclose()
+        raise
+
+    async def relay() -> AsyncIterator[str]:
+        sent: tuple[str | None, str] = (resume_from, "")
+        try:
+            update = first_update
+            while update is not None:
+                if isinstance(update, GeminiAPIError | AdmissionError):
+                    yield _error_event(update)
+                    update = await anext(updates, None)
+                    continue
+                # The poller publishes every poll; only forward actual changes
+                current = (update.event_id or sent[0], update.status.value)
+                if current != sent:
+                    sent = current
+                    event = update.event_type.value if update.event_type else "status"
+                    yield _sse_event(event, update.model_dump_json(), update.event_id)
+                update = await anext(updates, None)
+        except GeminiAPIError as exc:
+            logger.warning("Gemini event stream failed: %s", exc.message)
+            yield _error_event(exc)
+        finally:
+            await updates.aclose()
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -123,6 +267,7 @@ async def poll_deep_research(
 async def cancel_deep_research(
     _current_user: CurrentUser,
     gemini: GeminiDep,
+    supervisor: GeminiSupervisorDep,
     interaction_id: str,
 ) -> dict[str, str]:
     """Cancel a running deep research job.
@@ -133,6 +278,7 @@ async def cancel_deep_research(
     Args:
         _current_user: Authenticated user (required for authorization).
         gemini: Injected GeminiService instance.
+        supervisor: Injected GeminiJobSupervisor instance.
         interaction_id: The interaction ID of the job to cancel.
 
     Returns:
@@ -142,4 +288,5 @@ async def cancel_deep_research(
         GeminiAPIError: If the cancellation request fails.
     """
     await gemini.cancel_research(interaction_id)
+    supervisor.refresh(interaction_id)
     return {"message": "Research job cancelled successfully"}
@@ -2,10 +2,21 @@ import uuid
 from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
-
-from app.api.deps import CurrentUser, SessionDep
-from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
+from sqlalchemy import ColumnElement, tuple_
+from sqlmodel import col, func, select
+
+from app import crud
+from app.api.deps import AsyncSessionDep, CurrentUser
+from app.core.pagination import Cursor, InvalidCursorError
+from app.models import (
+    Item,
+    ItemCreate,
+    ItemPublic,
+    ItemsPublic,
+    ItemUpdate,
+    Message,
+    utc_now,
+)
 
 ContentTypeFilter = Literal["search", "extract", "crawl", "map", "perplexity", "gemini"]
 
@@ -13,45 +24,81 @@ router = APIRouter(prefix="/items", tags=["items"])
 
 
 @router.get("/", response_model=ItemsPublic)
-def read_items(
-    session: SessionDep,
+async def read_items(
+    session: AsyncSessionDep,
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
     content_type: ContentTypeFilter | None = None,
+    cursor: str | None = None,
+    include_count: bool | None = None,
 ) -> Any:
     """
-    Retrieve items with optional content_type filter.
-    """
+    Retrieve items, newest first, with optional content_type filter.
 
-    if current_user.is_superuser:
-        base_count = select(func.count()).select_from(Item)
-        base_query = select(Item)
-    else:
-        base_count = (
-            select(func.count())
-            .select_from(Item)
-            .where(Item.owner_id == current_user.id)
-        )
-        base_query = select(Item).where(Item.owner_id == current_user.id)
-
-    # Apply content_type filter if provided
+    Pages are selected by skip and limit, or by a cursor from the
+    next_cursor/prev_cursor of a previous page, which stays fast however
+    deep the page is (skip is then ignored). The total count is returned
+    without a cursor, and with one only if include_count is true.
+    """
+    filters: list[ColumnElement[bool]] = []
+    if not current_user.is_superuser:
+        filters.append(col(Item.owner_id) == current_user.id)
     if content_type is not None:
-        base_count = base_count.where(Item.content_type == content_type)
-        base_query = base_query.where(Item.content_type == content_type)
+        filters.append(col(Item.content_type) == content_type)
+
+    key = tuple_(col(Item.created_at), col(Item.id))
+    newest_first = (col(Item.created_at).desc(), col(Item.id).desc())
+    oldest_first = (col(Item.created_at).asc(), col(Item.id).asc())
+    statement = select(Item).where(*filters)
+    # One extra row tells whether there is a page beyond this one
+    if cursor is None:
+        statement = statement.order_by(*newest_first).offset(skip)
+    else:
+        try:
+            position = Cursor.decode(cursor)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        cursor_key = tuple_(position.created_at, position.id)
+        if position.direction == "next":
+            statement = statement.where(key < cursor_key).order_by(*newest_first)
+        else:
+            statement = statement.where(key > cursor_key).order_by(*oldest_first)
+    rows = list((await session.exec(statement.limit(limit + 1))).all())
+    items = rows[:limit]
+    has_more = len(rows) > limit
+
+    if cursor is None:
+        has_next, has_prev = has_more, skip > 0
+    elif position.direction == "next":
+        has_next, has_prev = has_more, True
+    else:
+        items.reverse()
+        has_next, has_prev = True, has_more
+    next_cursor = prev_cursor = None
+    if items and has_next:
+        next_cursor = Cursor(items[-1].created_at, items[-1].id, "next").encode()
+    if items and has_prev:
+        prev_cursor = Cursor(items[0].created_at, items[0].id, "prev").encode()
 
-    count = session.exec(base_count).one()
-    items = session.exec(base_query.offset(skip).limit(limit)).all()
+    count = None
+    if include_count if include_count is not None else cursor is None:
+        count_statement = select(func.count()).select_from(Item).where(*filters)
+        count = (await session.exec(count_statement)).one()
 
-    return ItemsPublic(data=items, count=count)
+    return ItemsPublic(
+        data=items, count=count, next_cursor=next_cursor, prev_cursor=prev_cursor
+    )
 
 
 @router.get("/{id}", response_model=ItemPublic)
-def read_item(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) -> Any:
+async def read_item(
+    session: AsyncSessionDep, current_user: CurrentUser, id: uuid.UUID
+) -> Any:
     """
     Get item by ID.
     """
-    item = session.get(Item, id)
+    item = await session.get(Item, id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if not current_user.is_superuser and (item.owner_id != current_user.id):
@@ -60,23 +107,22 @@ def read_item(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) ->
 
 
 @router.post("/", response_model=ItemPublic)
-def create_item(
-    *, session: SessionDep, current_user: CurrentUser, item_in: ItemCreate
+async def create_item(
+    *, session: AsyncSessionDep, current_user: CurrentUser, item_in: ItemCreate
 ) -> Any:
     """
     Create new item.
     """
-    item = Item.model_validate(item_in, update={"owner_id": current_user.id})
-    session.add(item)
-    session.commit()
-    session.refresh(item)
+    item = await crud.create_item_async(
+        session=session, item_in=item_in, owner_id=current_user.id
+    )
     return item
 
 
 @router.put("/{id}", response_model=ItemPublic)
-def update_item(
+async def update_item(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
     current_user: CurrentUser,
     id: uuid.UUID,
     item_in: ItemUpdate,
@@ -84,31 +130,31 @@ def update_item(
     """
     Update an item.
     """
-    item = session.get(Item, id)
+    item = await session.get(Item, id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if not current_user.is_superuser and (item.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
     update_dict = item_in.model_dump(exclude_unset=True)
-    item.sqlmodel_update(update_dict)
+    item.sqlmodel_update(update_dict, update={"updated_at": utc_now()})
     session.add(item)
-    session.commit()
-    session.refresh(item)
+    await session.commit()
+    await session.refresh(item)
     return item
 
 
 @router.delete("/{id}")
-def delete_item(
-    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+async def delete_item(
+    session: AsyncSessionDep, current_user: CurrentUser, id: uuid.UUID
 ) -> Message:
     """
     Delete an item.
     """
-    item = session.get(Item, id)
+    item = await session.get(Item, id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if not current_user.is_superuser and (item.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    session.delete(item)
-    session.commit()
+    await session.delete(item)
+    await session.commit()
     return Message(message="Item deleted successfully")
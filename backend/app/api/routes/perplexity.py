@@ -6,17 +6,32 @@ and use PerplexityDep for service injection.
 
 Endpoints:
     POST /perplexity/deep-research - Execute deep research query
+    POST /perplexity/deep-research/stream - Stream deep research as SSE
+    POST /perplexity/deep-research/jobs - Queue deep research as a background job
+    GET /perplexity/deep-research/jobs/{job_id} - Get job status or result
 """
 
+import json
+import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import CurrentUser, PerplexityDep
+from app.api.deps import CurrentUser, PerplexityDep, PerplexityJobsDep
+from app.exceptions.perplexity import PerplexityAPIError
 from app.schemas.perplexity import (
+    PerplexityDeepResearchJobResponse,
+    PerplexityDeepResearchJobResultResponse,
     PerplexityDeepResearchRequest,
     PerplexityDeepResearchResponse,
+    PerplexityStreamEventType,
 )
+from app.schemas.tavily import ErrorResponse
+from app.services.perplexity import PerplexityStreamAccumulator
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/perplexity", tags=["perplexity"])
 
@@ -44,3 +59,151 @@ async def deep_research(
         PerplexityAPIError: If the Perplexity API request fails.
     """
     return await perplexity.deep_research(request)
+
+
+def _sse_event(event: PerplexityStreamEventType, data: dict[str, Any] | str) -> str:
+    """Format a server-sent event with a JSON data payload."""
+    payload = data if isinstance(data, str) else json.dumps(data)
+    return f"event: {event.value}\ndata: {payload}\n\n"
+
+
+@router.post("/deep-research/stream", response_model=None)
+async def deep_research_stream(
+    _current_user: CurrentUser,
+    perplexity: PerplexityDep,
+    request: PerplexityDeepResearchRequest,
+) -> StreamingResponse:
+    """Stream a deep research query using Perplexity Sonar API.
+
+    Relays the upstream stream as server-sent events (text/event-stream):
+    - token: {"content": "..."} for each content fragment
+    - citations: {"citations": [...], "search_results": [...]} whenever the
+      cited sources change
+    - done: the final PerplexityDeepResearchResponse, accumulated from
+      the stream
+    - error: an ErrorResponse if the upstream fails mid-stream
+
+    Args:
+        _current_user: Authenticated user (required for authorization).
+        perplexity: Injected PerplexityService instance.
+        request: Deep research request with query and optional parameters.
+
+    Returns:
+        StreamingResponse of server-sent events.
+
+    Raises:
+        PerplexityAPIError: If the Perplexity API request fails before the
+            first chunk is received.
+    """
+    chunks = perplexity.stream_deep_research(request)
+    # Wait for the first chunk so upstream errors still map to HTTP statuses
+    first_chunk = await anext(chunks, None)
+
+    async def relay() -> AsyncIterator[str]:
+        accumulator = PerplexityStreamAccumulator()
+        citations: list[str] = []
+        try:
+            chunk = first_chunk
+            while chunk is not None:
+                accumulator.add(chunk)
+                for choice in chunk.get("choices") or []:
+                    content = (choice.get("delta") or {}).get("content")
+                    if content:
+                        yield _sse_event(
+                            PerplexityStreamEventType.TOKEN, {"content": content}
+                        )
+                if chunk.get("citations") and chunk["citations"] != citations:
+                    citations = chunk["citations"]
+                    yield _sse_event(
+                        PerplexityStreamEventType.CITATIONS,
+                        {
+                            "citations": citations,
+                            "search_results": chunk.get("search_results") or [],
+                        },
+                    )
+                chunk = await anext(chunks, None)
+
+            response = PerplexityDeepResearchResponse.model_validate(
+                accumulator.to_dict()
+            )
+            yield _sse_event(PerplexityStreamEventType.DONE, response.model_dump_json())
+        except PerplexityAPIError as exc:
+            logger.warning("Perplexity stream failed: %s", exc.message)
+            error = ErrorResponse(
+                error_code=exc.error_code, message=exc.message, details=exc.details
+            )
+            yield _sse_event(PerplexityStreamEventType.ERROR, error.model_dump_json())
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/deep-research/jobs",
+    response_model=PerplexityDeepResearchJobResponse,
+    status_code=202,
+)
+async def start_deep_research_job(
+    current_user: CurrentUser,
+    jobs: PerplexityJobsDep,
+    request: PerplexityDeepResearchRequest,
+) -> Any:
+    """Queue a deep research query to run in the background.
+
+    Returns immediately with a job ID instead of holding the connection
+    open for the whole research call. The query runs in a bounded worker
+    pool; use the job endpoint to read its status and result, mirroring
+    the Gemini job workflow.
+
+    Args:
+        current_user: Authenticated user, recorded as the job owner.
+        jobs: Injected PerplexityJobManager instance.
+        request: Deep research request with query and optional parameters.
+
+    Returns:
+        PerplexityDeepResearchJobResponse with job_id and initial status.
+
+    Raises:
+        PerplexityAPIError: If the API key is missing or the queue is full.
+        AdmissionError: If the user already has the maximum number of
+            unfinished jobs.
+    """
+    job = await jobs.submit(request, owner_id=current_user.id)
+    return PerplexityDeepResearchJobResponse(
+        job_id=job.job_id, status=job.status, created_at=job.created_at
+    )
+
+
+@router.get(
+    "/deep-research/jobs/{job_id}",
+    response_model=PerplexityDeepResearchJobResultResponse,
+)
+async def get_deep_research_job(
+    current_user: CurrentUser,
+    jobs: PerplexityJobsDep,
+    job_id: str,
+) -> Any:
+    """Get the status of a background deep research job.
+
+    Returns the result once the job has completed, or the error if it
+    failed. Users can only read their own jobs; superusers can read all.
+
+    Args:
+        current_user: Authenticated user; must own the job unless superuser.
+        jobs: Injected PerplexityJobManager instance.
+        job_id: The job ID from job creation.
+
+    Returns:
+        PerplexityDeepResearchJobResultResponse with status and result.
+
+    Raises:
+        PerplexityAPIError: If the job does not exist (404).
+    """
+    owner_id = None if current_user.is_superuser else current_user.id
+    job = await jobs.get(job_id, owner_id=owner_id)
+    return job.to_response()
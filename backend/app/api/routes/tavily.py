@@ -6,21 +6,35 @@ and use TavilyDep for service injection.
 
 Endpoints:
     POST /tavily/search - Perform web search using Tavily API
+    POST /tavily/search/batch - Run several searches concurrently
     POST /tavily/extract - Extract content from URLs
     POST /tavily/crawl - Crawl a website starting from a URL
+    POST /tavily/crawl/stream - Crawl a website, streaming one page per line
     POST /tavily/map - Generate a sitemap of URLs from a website
 """
 
 import asyncio
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from app.api.deps import CurrentUser, TavilyDep
-from app.core.exceptions import TavilyAPIError
+from app.core.cache import CACHE_STATUS_HEADER, get_cache_status
+from app.core.config import settings
+from app.core.exceptions import TavilyAPIError, TavilyErrorCode
+from app.exceptions import AdmissionError
 from app.schemas.tavily import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchResult,
     CrawlRequest,
     CrawlResponse,
+    CrawlResult,
+    ErrorResponse,
     ExtractRequest,
     ExtractResponse,
     MapRequest,
@@ -28,6 +42,7 @@ from app.schemas.tavily import (
     SearchRequest,
     SearchResponse,
 )
+from app.services.tavily import TavilyService
 
 router = APIRouter(prefix="/tavily", tags=["tavily"])
 
@@ -72,21 +87,87 @@ def _handle_tavily_exception(exc: Exception) -> TavilyAPIError:
     )
 
 
+async def _run_search(tavily: TavilyService, request: SearchRequest) -> dict[str, Any]:
+    """Run a validated search request through the Tavily service."""
+    return await tavily.search(
+        query=request.query,
+        search_depth=request.search_depth.value,
+        topic=request.topic.value,
+        max_results=request.max_results,
+        include_images=request.include_images,
+        include_image_descriptions=request.include_image_descriptions,
+        include_answer=request.include_answer,
+        include_raw_content=request.include_raw_content,
+        include_domains=request.include_domains,
+        exclude_domains=request.exclude_domains,
+    )
+
+
+async def _run_crawl(tavily: TavilyService, request: CrawlRequest) -> dict[str, Any]:
+    """Run a validated crawl request through the Tavily service."""
+    return await tavily.crawl(
+        url=request.url,
+        max_depth=request.max_depth,
+        max_breadth=request.max_breadth,
+        limit=request.limit,
+        instructions=request.instructions,
+        select_paths=request.select_paths,
+        select_domains=request.select_domains,
+    )
+
+
+async def _run_batch_search(
+    tavily: TavilyService,
+    semaphore: asyncio.Semaphore,
+    index: int,
+    request: SearchRequest,
+) -> BatchSearchResult:
+    """Run one search of a batch, capturing failures as an error entry."""
+    async with semaphore:
+        try:
+            result = await _run_search(tavily, request)
+            cache_status = get_cache_status()
+            response = SearchResponse.model_validate(result)
+        except Exception as exc:
+            error = (
+                exc
+                if isinstance(exc, TavilyAPIError | AdmissionError)
+                else _handle_tavily_exception(exc)
+            )
+            return BatchSearchResult(
+                index=index,
+                error=ErrorResponse(
+                    error_code=error.error_code,
+                    message=error.message,
+                    details=error.details,
+                ),
+            )
+    return BatchSearchResult(
+        index=index,
+        response=response,
+        cache_status=cache_status.value if cache_status is not None else None,
+    )
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search(
     _current_user: CurrentUser,
     tavily: TavilyDep,
     request: SearchRequest,
+    response: Response,
 ) -> Any:
     """Perform a web search using Tavily API.
 
     Executes a web search with the provided query and parameters, returning
-    relevant search results and optionally an AI-generated answer.
+    relevant search results and optionally an AI-generated answer. Identical
+    requests may be served from the response cache; the X-Cache response
+    header reports HIT, MISS or BYPASS.
 
     Args:
         current_user: Authenticated user (required for authorization).
         tavily: Injected TavilyService instance.
         request: Search request with query and optional parameters.
+        response: Outgoing response, used to set the X-Cache header.
 
     Returns:
         SearchResponse with query, results, and optional answer/images.
@@ -95,40 +176,88 @@ async def search(
         TavilyAPIError: If the Tavily API request fails.
     """
     try:
-        result = await tavily.search(
-            query=request.query,
-            search_depth=request.search_depth.value,
-            topic=request.topic.value,
-            max_results=request.max_results,
-            include_images=request.include_images,
-            include_image_descriptions=request.include_image_descriptions,
-            include_answer=request.include_answer,
-            include_raw_content=request.include_raw_content,
-            include_domains=request.include_domains,
-            exclude_domains=request.exclude_domains,
-        )
+        result = await _run_search(tavily, request)
+        cache_status = get_cache_status()
+        if cache_status is not None:
+            response.headers[CACHE_STATUS_HEADER] = cache_status.value
         return SearchResponse.model_validate(result)
-    except TavilyAPIError:
+    except (TavilyAPIError, AdmissionError):
         raise
     except Exception as exc:
         raise _handle_tavily_exception(exc) from exc
 
 
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_batch(
+    _current_user: CurrentUser,
+    tavily: TavilyDep,
+    request: BatchSearchRequest,
+) -> Any:
+    """Run several web searches concurrently in a single request.
+
+    Searches are fanned out through the shared TavilyService with at most
+    settings.tavily.batch_search_concurrency running at once. A failing
+    search does not fail the batch; it is reported as an error entry in its
+    slot instead.
+
+    When request.stream is True, the response is NDJSON
+    (application/x-ndjson): one BatchSearchResult per line, written as each
+    search completes, so lines may arrive out of request order.
+
+    Args:
+        current_user: Authenticated user (required for authorization).
+        tavily: Injected TavilyService instance.
+        request: Batch of search requests and the streaming flag.
+
+    Returns:
+        BatchSearchResponse with per-search results or errors in request
+        order, or a StreamingResponse of NDJSON lines when streaming.
+    """
+    semaphore = asyncio.Semaphore(settings.tavily.batch_search_concurrency)
+    tasks = [
+        asyncio.create_task(_run_batch_search(tavily, semaphore, index, search))
+        for index, search in enumerate(request.searches)
+    ]
+
+    if not request.stream:
+        try:
+            return BatchSearchResponse(results=list(await asyncio.gather(*tasks)))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def stream_results() -> AsyncIterator[str]:
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                yield item.model_dump_json() + "\n"
+        finally:
+            # Stop outstanding searches if the client disconnects early
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.post("/extract", response_model=ExtractResponse)
 async def extract(
     _current_user: CurrentUser,
     tavily: TavilyDep,
     request: ExtractRequest,
+    response: Response,
 ) -> Any:
     """Extract content from one or more URLs.
 
     Uses Tavily extraction API to retrieve clean, structured content from
-    web pages. Supports both single URL and batch URL extraction.
+    web pages. Supports both single URL and batch URL extraction. Results
+    are cached per URL; the X-Cache response header reports HIT, PARTIAL,
+    MISS or BYPASS.
 
     Args:
         current_user: Authenticated user (required for authorization).
         tavily: Injected TavilyService instance.
         request: Extract request with URL or list of URLs.
+        response: Outgoing response, used to set the X-Cache header.
 
     Returns:
         ExtractResponse with extraction results for each URL.
@@ -138,8 +267,11 @@ async def extract(
     """
     try:
         result = await tavily.extract(urls=request.urls)
+        cache_status = get_cache_status()
+        if cache_status is not None:
+            response.headers[CACHE_STATUS_HEADER] = cache_status.value
         return ExtractResponse.model_validate(result)
-    except TavilyAPIError:
+    except (TavilyAPIError, AdmissionError):
         raise
     except Exception as exc:
         raise _handle_tavily_exception(exc) from exc
@@ -168,21 +300,101 @@ async def crawl(
         TavilyAPIError: If the Tavily API request fails.
     """
     try:
-        result = await tavily.crawl(
-            url=request.url,
-            max_depth=request.max_depth,
-            max_breadth=request.max_breadth,
-            limit=request.limit,
-            instructions=request.instructions,
-            select_paths=request.select_paths,
-            select_domains=request.select_domains,
-        )
+        result = await _run_crawl(tavily, request)
         return CrawlResponse.model_validate(result)
-    except TavilyAPIError:
+    except (TavilyAPIError, AdmissionError):
+        raise
+    except Exception as exc:
+        raise _handle_tavily_exception(exc) from exc
+
+
+def _invalid_page_error(page: Any, exc: ValidationError) -> ErrorResponse:
+    """Describe a crawled page that failed CrawlResult validation."""
+    return ErrorResponse(
+        error_code=TavilyErrorCode.TAVILY_API_ERROR,
+        message="Tavily returned a crawled page that could not be parsed.",
+        details={
+            "url": page.get("url") if isinstance(page, dict) else None,
+            "errors": exc.errors(
+                include_url=False, include_context=False, include_input=False
+            ),
+        },
+    )
+
+
+@router.post("/crawl/stream", response_model=None)
+async def crawl_stream(
+    _current_user: CurrentUser,
+    tavily: TavilyDep,
+    request: CrawlRequest,
+    http_request: Request,
+) -> StreamingResponse:
+    """Crawl a website and stream each crawled page as it is serialized.
+
+    The crawl itself is not streamed: as for POST /tavily/crawl, the whole
+    Tavily response is awaited and held in memory before the first byte is
+    sent. Only the serialization is streamed: instead of rendering a single
+    CrawlResponse document, each page is validated, serialized and released
+    one at a time.
+
+    The default format is NDJSON (application/x-ndjson), one CrawlResult per
+    line. Clients sending "Accept: text/event-stream" receive Server-Sent
+    Events instead: one "page" event per CrawlResult followed by a "done"
+    event carrying base_url and total_pages. A page that fails validation
+    is replaced by an ErrorResponse record, an NDJSON line with error_code
+    or an SSE "error" event, and the stream continues.
+
+    Args:
+        current_user: Authenticated user (required for authorization).
+        tavily: Injected TavilyService instance.
+        request: Crawl request with URL and crawl parameters.
+        http_request: Incoming request, used to negotiate the stream format.
+
+    Returns:
+        StreamingResponse of NDJSON lines or SSE events.
+
+    Raises:
+        TavilyAPIError: If the Tavily API request fails (before streaming).
+    """
+    try:
+        result = await _run_crawl(tavily, request)
+    except (TavilyAPIError, AdmissionError):
         raise
     except Exception as exc:
         raise _handle_tavily_exception(exc) from exc
 
+    base_url = result.get("base_url", request.url)
+    # Keep the pages only in a reversed list so each one can be popped and
+    # freed as soon as it has been sent
+    pages: list[Any] = list(reversed(result.get("results") or []))
+    del result
+    use_sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+    async def stream_pages() -> AsyncIterator[str]:
+        total_pages = 0
+        while pages:
+            raw_page = pages.pop()
+            try:
+                page = CrawlResult.model_validate(raw_page).model_dump_json()
+            except ValidationError as exc:
+                # The status line is already sent; report the page in-band
+                error = _invalid_page_error(raw_page, exc).model_dump_json()
+                yield f"event: error\ndata: {error}\n\n" if use_sse else error + "\n"
+                continue
+            total_pages += 1
+            yield f"event: page\ndata: {page}\n\n" if use_sse else page + "\n"
+        if use_sse:
+            done = json.dumps({"base_url": base_url, "total_pages": total_pages})
+            yield f"event: done\ndata: {done}\n\n"
+
+    if use_sse:
+        return StreamingResponse(
+            stream_pages(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+    return StreamingResponse(stream_pages(), media_type="application/x-ndjson")
+
 
 @router.post("/map", response_model=MapResponse)
 async def map_urls(
@@ -217,7 +429,7 @@ async def map_urls(
             select_domains=request.select_domains,
         )
         return MapResponse.model_validate(result)
-    except TavilyAPIError:
+    except (TavilyAPIError, AdmissionError):
         raise
     except Exception as exc:
         raise _handle_tavily_exception(exc) from exc
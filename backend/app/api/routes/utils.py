@@ -1,7 +1,11 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.circuit_breaker import circuit_breakers
+from app.core.metrics import metrics
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -29,3 +33,24 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get("/health-check/upstreams/")
+async def upstream_health_check() -> dict[str, Any]:
+    """
+    Circuit breaker state of each upstream provider.
+    """
+    return {
+        provider: breaker.snapshot() for provider, breaker in circuit_breakers.items()
+    }
+
+
+@router.get(
+    "/metrics/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def read_metrics() -> dict[str, Any]:
+    """
+    In-process counters and distributions, e.g. polls per Gemini job.
+    """
+    return metrics.snapshot()
@@ -0,0 +1,164 @@
+"""Admission control for upstream research and search providers.
+
+Provides the ConcurrencyLimiter which bounds how many requests to each
+upstream provider (Tavily, Perplexity, Gemini) are in flight at once, both
+per user and across all users. A single client can otherwise open hundreds
+of long-running upstream calls and starve everyone else of event-loop time
+and upstream quota.
+
+A request first takes one of its user's slots for the provider, then one
+of the provider-wide slots, and holds both until it finishes. When a slot
+is not free the request either fails immediately or, with a queue timeout,
+waits up to that long for one. Requests that are not admitted raise
+AdmissionError, which the API turns into 429 with a Retry-After header.
+
+The limiter is created once by the application lifespan (see
+create_concurrency_limiter) and used by the provider dependencies in
+app.api.deps.
+
+Usage:
+    from app.core.admission import create_concurrency_limiter
+
+    limiter = create_concurrency_limiter()
+    async with limiter.acquire("perplexity", user_id):
+        result = await perplexity.deep_research(request)
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Literal
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.exceptions.admission import AdmissionError
+
+# Upstream providers guarded by admission control
+Provider = Literal["tavily", "perplexity", "gemini"]
+
+
+class _UserSlots:
+    """Concurrency slots of one user for one provider."""
+
+    def __init__(self, limit: int) -> None:
+        self.semaphore = asyncio.Semaphore(limit)
+        # Requests holding or waiting for a slot; the entry is dropped at 0
+        self.users = 0
+
+
+class ConcurrencyLimiter:
+    """Bound concurrent requests per provider and per user.
+
+    Attributes:
+        _provider_slots: Provider-wide semaphores.
+        _user_limits: Per-user concurrency limit of each provider.
+        _user_slots: Per-user semaphores keyed by (provider, user_id),
+            created on demand and dropped when idle.
+        _queue_timeout: Seconds to wait for a free slot; 0 rejects at once.
+        _retry_after: Retry-After seconds sent with rejections.
+    """
+
+    def __init__(
+        self,
+        limits: dict[Provider, tuple[int, int]],
+        queue_timeout: float = 0.0,
+        retry_after: int = 5,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits: Mapping of provider to (provider-wide limit, per-user limit).
+            queue_timeout: Seconds a request may wait for a free slot.
+            retry_after: Retry-After seconds sent with rejections.
+        """
+        self._provider_slots = {
+            provider: asyncio.Semaphore(provider_limit)
+            for provider, (provider_limit, _) in limits.items()
+        }
+        self._user_limits = {
+            provider: user_limit for provider, (_, user_limit) in limits.items()
+        }
+        self._user_slots: dict[tuple[Provider, str], _UserSlots] = {}
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+
+    @asynccontextmanager
+    async def acquire(self, provider: Provider, user_id: str) -> AsyncIterator[None]:
+        """Hold one user slot and one provider slot for the enclosed block.
+
+        Args:
+            provider: Upstream provider the request calls.
+            user_id: ID of the requesting user.
+
+        Raises:
+            AdmissionError: If no slot became free within the queue timeout.
+        """
+        key = (provider, user_id)
+        user_slots = self._user_slots.get(key)
+        if user_slots is None:
+            user_slots = self._user_slots[key] = _UserSlots(self._user_limits[provider])
+        user_slots.users += 1
+        try:
+            if not await self._take(user_slots.semaphore):
+                raise self._reject(provider, "user")
+            try:
+                provider_slots = self._provider_slots[provider]
+                if not await self._take(provider_slots):
+                    raise self._reject(provider, "provider")
+                try:
+                    yield
+                finally:
+                    provider_slots.release()
+            finally:
+                user_slots.semaphore.release()
+        finally:
+            user_slots.users -= 1
+            if user_slots.users == 0 and self._user_slots.get(key) is user_slots:
+                del self._user_slots[key]
+
+    async def _take(self, semaphore: asyncio.Semaphore) -> bool:
+        """Acquire a slot, waiting at most the queue timeout."""
+        if self._queue_timeout <= 0:
+            if semaphore.locked():
+                return False
+            await semaphore.acquire()
+            return True
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _reject(self, provider: Provider, scope: str) -> AdmissionError:
+        """Record and build the error for a request that was not admitted."""
+        metrics.increment("admission.rejected", provider=provider, scope=scope)
+        return AdmissionError.concurrency_limit_exceeded(
+            provider=provider, scope=scope, retry_after=self._retry_after
+        )
+
+
+def create_concurrency_limiter() -> ConcurrencyLimiter:
+    """Create the concurrency limiter from the provider settings.
+
+    Returns:
+        ConcurrencyLimiter configured with each provider's limits and the
+        shared ADMISSION_QUEUE_TIMEOUT and ADMISSION_RETRY_AFTER.
+    """
+    return ConcurrencyLimiter(
+        limits={
+            "tavily": (
+                settings.tavily.max_concurrent_requests,
+                settings.tavily.max_concurrent_requests_per_user,
+            ),
+            "perplexity": (
+                settings.perplexity.max_concurrent_requests,
+                settings.perplexity.max_concurrent_requests_per_user,
+            ),
+            "gemini": (
+                settings.gemini.max_concurrent_requests,
+                settings.gemini.max_concurrent_requests_per_user,
+            ),
+        },
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+    )
@@ -0,0 +1,164 @@
+"""Short-lived caches for authenticating requests without the database.
+
+Every authenticated request used to verify the JWT signature and load its
+user from Postgres just to check is_active. This module keeps two bounded,
+in-process TTL caches in front of that work:
+
+- token_cache maps a token (by SHA-256 digest) to its verified
+  TokenPayload, and never outlives the token's exp claim.
+- user_cache maps a user id to a snapshot of the user's columns.
+
+A cached user is handed to the request's session with
+session.merge(load=False), which attaches it as a persistent instance
+without a SELECT, so routes can still modify and commit current_user.
+
+Entries are dropped whenever the ORM updates or deletes a user (profile,
+password and activation changes, deletion), via mapper events. Other
+worker processes keep their copy until it expires, so AUTH_CACHE_TTL
+bounds how long a deactivated user stays authenticated elsewhere; set it
+to 0 to disable both caches.
+
+Usage:
+    from app.core.auth_cache import get_cached_user, invalidate_user
+
+    user = await get_cached_user(session, user_id)
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models import TokenPayload, User
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe bounded cache with per-entry TTL and LRU eviction.
+
+    Unlike the async response cache backends this is also reached from
+    sync code running in a thread pool: mapper events fire on flushes of
+    sync sessions too.
+
+    Attributes:
+        _max_entries: Maximum number of entries retained.
+        _entries: Ordered mapping of key to (expires_at, value).
+        _lock: Guards _entries across threads.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries retained before eviction.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """Store value under key for ttl seconds; a ttl <= 0 stores nothing."""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache: TTLCache[str, TokenPayload] = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+user_cache: TTLCache[str, dict[str, Any]] = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_cached_token(token: str) -> TokenPayload | None:
+    """Return the verified payload of a token seen recently, if any."""
+    return token_cache.get(_token_key(token))
+
+
+def cache_token(token: str, token_data: TokenPayload, expires_at: float | None) -> None:
+    """Remember a verified token payload until the TTL or the token expires.
+
+    Args:
+        token: The encoded JWT.
+        token_data: Its verified payload.
+        expires_at: The token's exp claim as a Unix timestamp, if any.
+    """
+    ttl = settings.AUTH_CACHE_TTL
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time())
+    token_cache.set(_token_key(token), token_data, ttl)
+
+
+async def get_cached_user(session: AsyncSession, user_id: str) -> User | None:
+    """Load a user through the cache and attach it to the session.
+
+    Args:
+        session: The request's database session.
+        user_id: The token subject.
+
+    Returns:
+        The user, persistent in session, or None if no such user exists.
+    """
+    key = str(user_id)
+    columns = user_cache.get(key)
+    if columns is None:
+        user = await session.get(User, user_id)
+        if user is not None:
+            user_cache.set(key, user.model_dump(), settings.AUTH_CACHE_TTL)
+        return user
+
+    cached = User(**columns)
+    # Mark the snapshot as loaded so merge() can attach it without a SELECT
+    make_transient_to_detached(cached)
+    return await session.merge(cached, load=False)
+
+
+def invalidate_user(user_id: uuid.UUID | str) -> None:
+    """Drop the cached snapshot of a user."""
+    user_cache.delete(str(user_id))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(_mapper: Any, _connection: Any, target: User) -> None:
+    invalidate_user(target.id)
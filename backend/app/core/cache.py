@@ -0,0 +1,220 @@
+"""Response caching utilities for upstream API integrations.
+
+Provides pluggable async cache backends (in-process memory or Redis), a
+canonical cache key builder, and a per-request cache status that route
+handlers can report back to clients in a response header.
+
+Backends store opaque bytes with a per-entry TTL; callers are responsible
+for serialization. The memory backend is bounded and evicts least recently
+used entries. The Redis backend delegates eviction to the server's
+maxmemory policy and requires the optional ``redis`` package.
+
+Usage:
+    from app.core.cache import MemoryCacheBackend, make_cache_key
+
+    cache = MemoryCacheBackend(max_entries=1024)
+    key = make_cache_key("tavily:search", {"query": "python"})
+    await cache.set(key, b"...", ttl=300)
+    value = await cache.get(key)
+"""
+
+import hashlib
+import importlib
+import json
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any, Literal, Protocol
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+
+class CacheStatus(StrEnum):
+    """Outcome of a cache lookup for the current request.
+
+    Attributes:
+        HIT: The response was served from cache.
+        MISS: The response was fetched upstream (and stored).
+        PARTIAL: Part of a batched response was served from cache and the
+            rest fetched upstream.
+        BYPASS: Caching is disabled for this request.
+    """
+
+    HIT = "HIT"
+    MISS = "MISS"
+    PARTIAL = "PARTIAL"
+    BYPASS = "BYPASS"
+
+
+_cache_status: ContextVar[CacheStatus | None] = ContextVar("cache_status", default=None)
+
+
+def set_cache_status(status: CacheStatus) -> None:
+    """Record the cache outcome for the current request context."""
+    _cache_status.set(status)
+
+
+def get_cache_status() -> CacheStatus | None:
+    """Return the cache outcome recorded for the current request context."""
+    return _cache_status.get()
+
+
+def make_cache_key(namespace: str, payload: dict[str, Any]) -> str:
+    """Build a stable cache key from a namespace and a canonical payload.
+
+    The payload is serialized as JSON with sorted keys so logically equal
+    requests always hash to the same key.
+
+    Args:
+        namespace: Key prefix identifying the cached operation.
+        payload: Canonical, JSON-serializable request parameters.
+
+    Returns:
+        Cache key of the form "<namespace>:<sha256 hex digest>".
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class CacheBackend(Protocol):
+    """Interface implemented by all cache backends."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for key, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release any resources held by the backend."""
+        ...
+
+
+class MemoryCacheBackend:
+    """Bounded in-process cache with per-entry TTL and LRU eviction.
+
+    Entries are kept in insertion/access order; reads move an entry to the
+    most recently used end and writes evict from the least recently used end
+    once max_entries is exceeded. Expired entries are dropped lazily on read.
+
+    Attributes:
+        _max_entries: Maximum number of entries retained.
+        _entries: Ordered mapping of key to (expires_at, value).
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty memory cache.
+
+        Args:
+            max_entries: Maximum number of entries retained before eviction.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0 or self._max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared across backend replicas.
+
+    TTL is enforced by Redis key expiry. Size bounds and LRU eviction are
+    delegated to the Redis server (configure maxmemory with an LRU policy).
+    Requires the optional ``redis`` package.
+
+    Attributes:
+        _redis: The redis.asyncio client instance.
+    """
+
+    def __init__(self, url: str) -> None:
+        """Initialize the Redis client.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0).
+
+        Raises:
+            RuntimeError: If the redis package (the 'redis' extra) is not
+                installed.
+        """
+        try:
+            redis_asyncio = importlib.import_module("redis.asyncio")
+        except ImportError as exc:
+            raise RuntimeError(
+                "The Redis cache backend requires the 'redis' package; "
+                "install the app with the 'redis' extra (e.g. uv sync --extra redis)."
+            ) from exc
+        self._redis: Any = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self._redis.get(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+def create_cache_backend(
+    backend: Literal["memory", "redis"],
+    *,
+    max_entries: int,
+    redis_url: str | None = None,
+) -> CacheBackend:
+    """Create a cache backend from configuration values.
+
+    Args:
+        backend: Backend type, "memory" or "redis".
+        max_entries: Entry bound for the memory backend.
+        redis_url: Connection URL, required for the redis backend.
+
+    Returns:
+        Configured cache backend.
+
+    Raises:
+        ValueError: If the redis backend is selected without a URL.
+    """
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL must be set to use the redis cache backend.")
+        return RedisCacheBackend(redis_url)
+    return MemoryCacheBackend(max_entries=max_entries)
@@ -0,0 +1,279 @@
+"""Circuit breakers that fail fast while an upstream provider is down.
+
+Provides the CircuitBreaker which tracks consecutive upstream failures of
+one provider. Without it, every request during an outage waits for the full
+client timeout (up to 300 seconds for Perplexity) before failing, tying up
+workers and pooled connections across the fleet.
+
+States:
+- closed: calls pass through; failure_threshold consecutive failures open
+  the circuit.
+- open: calls fail immediately with CircuitOpenError until
+  recovery_timeout seconds have passed.
+- half_open: up to half_open_max_calls probe calls pass through; a success
+  closes the circuit, a failure opens it again.
+
+Only upstream health counts as failure (connection errors, timeouts, 5xx
+responses); client errors such as 400 or 401 prove the upstream is up.
+
+One breaker per provider lives in the process-wide circuit_breakers
+registry. Services translate CircuitOpenError into their provider's 503
+error, and the state is exposed by GET /utils/health-check/upstreams/.
+
+Usage:
+    from app.core.circuit_breaker import CircuitOpenError, circuit_breakers
+
+    breaker = circuit_breakers["perplexity"]
+    try:
+        response = await breaker.call(lambda: client.post(url, json=payload))
+    except CircuitOpenError as exc:
+        raise PerplexityAPIError.service_unavailable(
+            details={"retry_after": exc.retry_after}
+        ) from exc
+"""
+
+import math
+import time
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from typing import Any, TypeVar
+
+import httpx
+
+from app.core.config import settings
+from app.core.deadline import expired as deadline_expired
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open.
+
+    Attributes:
+        provider: Upstream provider whose circuit is open.
+        retry_after: Seconds until the circuit lets a probe call through.
+    """
+
+    def __init__(self, provider: str, retry_after: int) -> None:
+        super().__init__(f"Circuit for {provider} is open")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def is_upstream_failure(outcome: object) -> bool | None:
+    """Default failure classifier for httpx-based calls.
+
+    Args:
+        outcome: The call's result, or the exception it raised.
+
+    Returns:
+        True for transport errors (including timeouts) and 5xx responses,
+        False for other responses, and None for other exceptions, which say
+        nothing about upstream health (e.g. a local rate limit rejection).
+        Timeouts after the request deadline has passed are also None, since
+        the client's patience ran out rather than the upstream's.
+    """
+    if isinstance(outcome, httpx.TimeoutException) and deadline_expired():
+        return None
+    if isinstance(outcome, httpx.TransportError):
+        return True
+    if isinstance(outcome, httpx.HTTPStatusError):
+        return outcome.response.status_code >= 500
+    if isinstance(outcome, httpx.Response):
+        return outcome.status_code >= 500
+    if isinstance(outcome, BaseException):
+        return None
+    return False
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one upstream provider.
+
+    Attributes:
+        provider: Upstream provider name, used in errors and metrics.
+        state: Current circuit state.
+        _failure_threshold: Consecutive failures that open the circuit.
+        _recovery_timeout: Seconds the circuit stays open before probing.
+        _half_open_max_calls: Probe calls allowed at once while half-open.
+        _failures: Consecutive failures while closed.
+        _opened_at: Monotonic time the circuit last opened.
+        _probes: Probe calls in flight while half-open.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            provider: Upstream provider name, used in errors and metrics.
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds the circuit stays open before probing.
+            half_open_max_calls: Probe calls allowed at once while half-open.
+        """
+        self.provider = provider
+        self.state = CircuitState.CLOSED
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        metrics.increment("circuit.transitions", provider=self.provider, state=state)
+
+    def _retry_after(self) -> int:
+        remaining = self._opened_at + self._recovery_timeout - time.monotonic()
+        return max(1, math.ceil(remaining))
+
+    def before_call(self) -> None:
+        """Admit a call or fail fast.
+
+        Must be followed by exactly one of record_success, record_failure
+        or release once the admitted call finishes.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._recovery_timeout:
+                metrics.increment("circuit.rejected", provider=self.provider)
+                raise CircuitOpenError(self.provider, self._retry_after())
+            self._transition(CircuitState.HALF_OPEN)
+            self._probes = 0
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes >= self._half_open_max_calls:
+                metrics.increment("circuit.rejected", provider=self.provider)
+                raise CircuitOpenError(self.provider, 1)
+            self._probes += 1
+
+    def record_success(self) -> None:
+        """Record that an admitted call reached a healthy upstream."""
+        self._failures = 0
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes = 0
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record that an admitted call found the upstream unhealthy."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes = 0
+            self._open()
+            return
+        self._failures += 1
+        if self.state == CircuitState.CLOSED and (
+            self._failures >= self._failure_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Finish an admitted call without an outcome, e.g. when cancelled."""
+        if self.state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        self._failures = 0
+        self._opened_at = time.monotonic()
+        self._transition(CircuitState.OPEN)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        is_failure: Callable[[object], bool | None] = is_upstream_failure,
+    ) -> T:
+        """Run an upstream call through the breaker.
+
+        Args:
+            fn: Zero-argument coroutine function making the call.
+            is_failure: Classifies the call's result or exception as an
+                upstream failure (True), success (False) or neither (None).
+
+        Returns:
+            The call's result, which may itself be a failure (e.g. a 503
+            response) for the caller to map.
+
+        Raises:
+            CircuitOpenError: If the circuit does not admit the call.
+            Exception: Whatever the call raised.
+        """
+        self.before_call()
+        try:
+            result = await fn()
+        except BaseException as exc:
+            self._record(is_failure(exc))
+            raise
+        self._record(is_failure(result))
+        return result
+
+    def _record(self, verdict: bool | None) -> None:
+        if verdict is None:
+            self.release()
+        elif verdict:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self) -> None:
+        """Close the circuit and forget all failures."""
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state for health reporting."""
+        snapshot: dict[str, Any] = {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+        }
+        if self.state == CircuitState.OPEN:
+            snapshot["retry_after"] = self._retry_after()
+        return snapshot
+
+
+def _create_breaker(
+    provider: str, failure_threshold: int, recovery_timeout: float
+) -> CircuitBreaker:
+    return CircuitBreaker(
+        provider,
+        failure_threshold=failure_threshold,
+        recovery_timeout=recovery_timeout,
+        half_open_max_calls=settings.CIRCUIT_HALF_OPEN_MAX_CALLS,
+    )
+
+
+# Process-wide breakers, one per upstream provider
+circuit_breakers: dict[str, CircuitBreaker] = {
+    "tavily": _create_breaker(
+        "tavily",
+        settings.tavily.circuit_failure_threshold,
+        settings.tavily.circuit_recovery_timeout,
+    ),
+    "perplexity": _create_breaker(
+        "perplexity",
+        settings.perplexity.circuit_failure_threshold,
+        settings.perplexity.circuit_recovery_timeout,
+    ),
+    "gemini": _create_breaker(
+        "gemini",
+        settings.gemini.circuit_failure_threshold,
+        settings.gemini.circuit_recovery_timeout,
+    ),
+}
@@ -3,7 +3,9 @@ from enum import StrEnum
 from typing import Annotated, Any, Literal
 
 from pydantic import (
+    AliasChoices,
     AnyUrl,
+    BaseModel,
     BeforeValidator,
     EmailStr,
     Field,
@@ -58,6 +60,31 @@ class GeminiAgent(StrEnum):
     DEFAULT = "default"
 
 
+class GeminiPollBackoff(StrEnum):
+    """Growth schedules for the interval between Gemini job polls."""
+
+    EXPONENTIAL = "exponential"
+    FIBONACCI = "fibonacci"
+
+
+# =============================================================================
+# Shared Settings Models
+# =============================================================================
+
+
+class UpstreamTimeouts(BaseModel):
+    """Timeouts in seconds for one upstream operation.
+
+    connect bounds establishing a connection, read bounds each wait for
+    response data (and sending the body), pool bounds waiting for a free
+    pooled connection.
+    """
+
+    connect: float = Field(default=5.0, gt=0)
+    read: float = Field(gt=0)
+    pool: float = Field(default=5.0, gt=0)
+
+
 # =============================================================================
 # Settings Classes
 # =============================================================================
@@ -70,8 +97,54 @@ class TavilySettings(BaseSettings):
 
     Environment variables:
         TAVILY_API_KEY: Required API key from tavily.com
-        TAVILY_TIMEOUT: Request timeout in seconds (default: 60)
+        TAVILY_TIMEOUT: Request timeout in seconds for endpoints without an
+            entry in TAVILY_TIMEOUTS (default: 60)
+        TAVILY_TIMEOUTS: JSON object of connect/read/pool timeouts by
+            endpoint type (default: read 60 for search and extract, 150 for
+            crawl and map; connect and pool 5)
         TAVILY_PROXY: Optional HTTP proxy URL for API requests
+        TAVILY_MAX_CONNECTIONS: Connection pool size (default: 100)
+        TAVILY_MAX_KEEPALIVE_CONNECTIONS: Idle pooled connections (default: 20)
+        TAVILY_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds (default: 30)
+        TAVILY_HTTP2: Negotiate HTTP/2 with the API (default: true)
+        TAVILY_CACHE_BACKEND: Response cache backend - memory, redis or none
+            (default: memory; redis requires REDIS_URL)
+        TAVILY_CACHE_MAX_ENTRIES: Memory cache size bound (default: 1024)
+        TAVILY_SEARCH_CACHE_TTL: Search response TTL in seconds (default: 300)
+        TAVILY_EXTRACT_CACHE_TTL: Per-URL extract result TTL in seconds
+            (default: 3600)
+        TAVILY_EXTRACT_CACHE_DOMAIN_TTLS: JSON object of per-domain TTL
+            overrides, matching subdomains; 0 disables caching for a domain
+            (e.g. '{"news.ycombinator.com": 60, "python.org": 86400}')
+        TAVILY_EXTRACT_CACHE_COMPRESS: zlib-compress cached extract results
+            (default: false)
+        TAVILY_BATCH_SEARCH_CONCURRENCY: Maximum searches run at once by
+            /tavily/search/batch (default: 10)
+        TAVILY_EXTRACT_CHUNK_SIZE: Maximum URLs per upstream extract call
+            (default: 20, the Tavily per-request limit)
+        TAVILY_EXTRACT_MAX_CONCURRENCY: Maximum extract chunks in flight per
+            request (default: 4)
+        TAVILY_MAX_CONCURRENT_REQUESTS: Tavily requests admitted at once across
+            all users (default: 100)
+        TAVILY_MAX_CONCURRENT_REQUESTS_PER_USER: Tavily requests admitted at
+            once per user (default: 10)
+        TAVILY_RATE_LIMITS: JSON object of requests per minute by endpoint
+            type; endpoints without an entry are not limited
+            (default: '{"search": 100, "extract": 100, "crawl": 100, "map": 100}')
+        TAVILY_RATE_LIMIT_BURST: Calls allowed back to back before the rate
+            applies (default: 10)
+        TAVILY_CIRCUIT_FAILURE_THRESHOLD: Consecutive upstream failures that
+            open the circuit breaker (default: 5)
+        TAVILY_CIRCUIT_RECOVERY_TIMEOUT: Seconds the circuit stays open before
+            a probe call (default: 30)
+        TAVILY_SEARCH_HEDGING: Send a backup request for slow basic searches
+            (default: false)
+        TAVILY_SEARCH_HEDGE_PERCENTILE: Latency percentile after which a
+            search is hedged (default: 95)
+        TAVILY_SEARCH_HEDGE_INITIAL_DELAY: Hedge delay in seconds until enough
+            latencies are known (default: 1)
+        TAVILY_SEARCH_HEDGE_BUDGET: Maximum extra upstream searches from
+            hedging, as a fraction of searches (default: 0.05)
     """
 
     model_config = SettingsConfigDict(
@@ -86,10 +159,58 @@ class TavilySettings(BaseSettings):
 
     # Optional: Request timeout in seconds
     timeout: int = 60
+    timeouts: dict[str, UpstreamTimeouts] = {
+        "search": UpstreamTimeouts(read=60),
+        "extract": UpstreamTimeouts(read=60),
+        "crawl": UpstreamTimeouts(read=150),
+        "map": UpstreamTimeouts(read=150),
+    }
 
     # Optional: HTTP proxy URL for API requests
     proxy: str | None = None
 
+    # Connection pool shared by all Tavily endpoints for the app lifetime
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    # Response cache in front of the Tavily API
+    cache_backend: Literal["memory", "redis", "none"] = "memory"
+    cache_max_entries: int = 1024
+    search_cache_ttl: int = 300
+    extract_cache_ttl: int = 3600
+    extract_cache_domain_ttls: dict[str, int] = {}
+    extract_cache_compress: bool = False
+
+    # Fan-out limit for batch endpoints
+    batch_search_concurrency: int = 10
+    extract_chunk_size: int = Field(default=20, ge=1)
+    extract_max_concurrency: int = Field(default=4, ge=1)
+
+    # Admission control: concurrent requests admitted to the Tavily endpoints
+    max_concurrent_requests: int = Field(default=100, ge=1)
+    max_concurrent_requests_per_user: int = Field(default=10, ge=1)
+
+    # Client-side token buckets mirroring the Tavily quota per endpoint type
+    rate_limits: dict[str, float] = {
+        "search": 100,
+        "extract": 100,
+        "crawl": 100,
+        "map": 100,
+    }
+    rate_limit_burst: int = Field(default=10, ge=1)
+
+    # Circuit breaker: fail fast while the Tavily API keeps failing
+    circuit_failure_threshold: int = Field(default=5, ge=1)
+    circuit_recovery_timeout: float = Field(default=30.0, gt=0)
+
+    # Opt-in hedging of basic searches to cut tail latency
+    search_hedging: bool = False
+    search_hedge_percentile: float = Field(default=95.0, gt=0, le=100)
+    search_hedge_initial_delay: float = Field(default=1.0, gt=0)
+    search_hedge_budget: float = Field(default=0.05, ge=0)
+
 
 # Perplexity API configuration settings
 # Used for AI-powered deep research with citations
@@ -98,10 +219,38 @@ class PerplexitySettings(BaseSettings):
 
     Environment variables:
         PERPLEXITY_API_KEY: API key from perplexity.ai (optional)
-        PERPLEXITY_TIMEOUT: Request timeout in seconds (default: 300)
+        PERPLEXITY_TIMEOUT: Request timeout in seconds for operations without
+            an entry in PERPLEXITY_TIMEOUTS (default: 300)
+        PERPLEXITY_TIMEOUTS: JSON object of connect/read/pool timeouts by
+            operation, deep_research or stream (default: read 300,
+            connect and pool 5)
         PERPLEXITY_DEFAULT_MODEL: Default model to use (default: sonar-pro)
         PERPLEXITY_SEARCH_MODE: Search mode (default: auto)
         PERPLEXITY_REASONING_EFFORT: Reasoning effort level (default: medium)
+        PERPLEXITY_MAX_CONNECTIONS: Connection pool size (default: 50)
+        PERPLEXITY_MAX_KEEPALIVE_CONNECTIONS: Idle pooled connections (default: 10)
+        PERPLEXITY_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds (default: 30)
+        PERPLEXITY_JOB_WORKERS: Background research jobs run at once (default: 4)
+        PERPLEXITY_JOB_QUEUE_SIZE: Jobs allowed to wait for a worker (default: 100)
+        PERPLEXITY_JOB_RETENTION: Seconds finished job state is kept in memory
+            (default: 3600)
+        PERPLEXITY_JOB_LEASE: Seconds a worker process's claim on a stored
+            job lasts without being renewed (default: 60)
+        PERPLEXITY_MAX_ACTIVE_JOBS_PER_USER: Unfinished background jobs
+            allowed per user (default: 5)
+        PERPLEXITY_MAX_CONCURRENT_REQUESTS: Perplexity requests admitted at
+            once across all users (default: 20)
+        PERPLEXITY_MAX_CONCURRENT_REQUESTS_PER_USER: Perplexity requests
+            admitted at once per user (default: 2)
+        PERPLEXITY_RATE_LIMITS: JSON object of requests per minute by model;
+            models without an entry are not limited
+            (default: 50 for each sonar model, 5 for sonar-deep-research)
+        PERPLEXITY_RATE_LIMIT_BURST: Calls allowed back to back before the
+            rate applies (default: 2)
+        PERPLEXITY_CIRCUIT_FAILURE_THRESHOLD: Consecutive upstream failures
+            that open the circuit breaker (default: 5)
+        PERPLEXITY_CIRCUIT_RECOVERY_TIMEOUT: Seconds the circuit stays open
+            before a probe call (default: 60)
     """
 
     model_config = SettingsConfigDict(
@@ -123,6 +272,15 @@ class PerplexitySettings(BaseSettings):
         description="Request timeout in seconds",
     )
 
+    # Per-operation timeouts; a stuck connect should not wait 300 seconds
+    timeouts: dict[str, UpstreamTimeouts] = Field(
+        default={
+            "deep_research": UpstreamTimeouts(read=300),
+            "stream": UpstreamTimeouts(read=300),
+        },
+        description="Connect, read and pool timeouts by operation",
+    )
+
     # Default model for research queries (sonar-deep-research for exhaustive research)
     default_model: PerplexityModel = Field(
         default=PerplexityModel.SONAR_DEEP_RESEARCH,
@@ -141,6 +299,87 @@ class PerplexitySettings(BaseSettings):
         description="Reasoning effort level",
     )
 
+    # Connection pool shared by all Perplexity requests for the app lifetime
+    max_connections: int = Field(
+        default=50,
+        description="Maximum number of pooled connections",
+    )
+    max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum number of idle keep-alive connections",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is retained",
+    )
+
+    # Background job mode: a bounded worker pool runs queued deep research
+    job_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Number of background research jobs run concurrently",
+    )
+    job_queue_size: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of jobs waiting for a worker",
+    )
+    job_retention: float = Field(
+        default=3600.0,
+        description="Seconds a finished job's state is kept in memory",
+    )
+    job_lease: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a worker process's claim on a stored job lasts",
+    )
+    max_active_jobs_per_user: int = Field(
+        default=5,
+        ge=1,
+        description="Unfinished background research jobs allowed per user",
+    )
+
+    # Admission control: concurrent requests admitted to the Perplexity endpoints
+    max_concurrent_requests: int = Field(
+        default=20,
+        ge=1,
+        description="Perplexity requests admitted at once across all users",
+    )
+    max_concurrent_requests_per_user: int = Field(
+        default=2,
+        ge=1,
+        description="Perplexity requests admitted at once per user",
+    )
+
+    # Client-side token buckets mirroring the Perplexity quota per model tier
+    rate_limits: dict[str, float] = Field(
+        default={
+            PerplexityModel.SONAR: 50,
+            PerplexityModel.SONAR_PRO: 50,
+            PerplexityModel.SONAR_REASONING: 50,
+            PerplexityModel.SONAR_REASONING_PRO: 50,
+            PerplexityModel.SONAR_DEEP_RESEARCH: 5,
+        },
+        description="Requests per minute by model",
+    )
+    rate_limit_burst: int = Field(
+        default=2,
+        ge=1,
+        description="Calls allowed back to back before the rate applies",
+    )
+
+    # Circuit breaker: fail fast while the Perplexity API keeps failing
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive upstream failures that open the circuit",
+    )
+    circuit_recovery_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds the circuit stays open before a probe call",
+    )
+
 
 # Gemini API configuration settings
 # Used for long-running research tasks with polling
@@ -149,10 +388,45 @@ class GeminiSettings(BaseSettings):
 
     Environment variables:
         GEMINI_API_KEY: API key from Google AI Studio (optional)
-        GEMINI_TIMEOUT: Request timeout in seconds (default: 120)
-        GEMINI_POLL_INTERVAL: Polling interval in seconds (default: 10)
-        GEMINI_MAX_POLL_ATTEMPTS: Maximum polling attempts (default: 360)
+        GEMINI_TIMEOUT: Request timeout in seconds for operations without an
+            entry in GEMINI_TIMEOUTS (default: 120)
+        GEMINI_TIMEOUTS: JSON object of connect/read/pool timeouts by
+            operation, start, poll or cancel (default: read 60 for start and
+            poll, 30 for cancel; connect and pool 5)
+        GEMINI_MIN_POLL_INTERVAL: Poll interval after a new event in seconds
+            (default: 2)
+        GEMINI_MAX_POLL_INTERVAL: Upper bound for the poll backoff in seconds
+            (default: 30)
+        GEMINI_POLL_BACKOFF: Backoff schedule, exponential or fibonacci
+            (default: exponential)
+        GEMINI_POLL_JITTER: Random +/- fraction applied to each interval
+            (default: 0.1)
+        GEMINI_POLL_DEADLINE: Wall-clock limit for waiting on a job in seconds
+            (default: 3600)
+        GEMINI_POLL_INTERVAL: Deprecated alias of GEMINI_MAX_POLL_INTERVAL
+        GEMINI_MAX_POLL_ATTEMPTS: Deprecated; sets GEMINI_POLL_DEADLINE to
+            this many times GEMINI_MAX_POLL_INTERVAL unless it is set itself
         GEMINI_AGENT: Agent selection (default: default)
+        GEMINI_MAX_CONNECTIONS: Connection pool size (default: 50)
+        GEMINI_MAX_KEEPALIVE_CONNECTIONS: Idle pooled connections (default: 10)
+        GEMINI_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds (default: 60)
+        GEMINI_JOB_RETENTION: Seconds finished job state is kept (default: 3600)
+        GEMINI_JOB_LEASE: Seconds a worker process's claim on a stored job
+            lasts without being renewed (default: 60)
+        GEMINI_MAX_ACTIVE_JOBS_PER_USER: Unfinished research jobs allowed per
+            user (default: 5)
+        GEMINI_MAX_CONCURRENT_REQUESTS: Gemini requests admitted at once across
+            all users (default: 20)
+        GEMINI_MAX_CONCURRENT_REQUESTS_PER_USER: Gemini requests admitted at
+            once per user (default: 3)
+        GEMINI_RATE_LIMITS: JSON object of requests per minute by call type
+            (default: '{"start": 10, "poll": 120, "cancel": 60}')
+        GEMINI_RATE_LIMIT_BURST: Calls allowed back to back before the rate
+            applies (default: 5)
+        GEMINI_CIRCUIT_FAILURE_THRESHOLD: Consecutive upstream failures that
+            open the circuit breaker (default: 5)
+        GEMINI_CIRCUIT_RECOVERY_TIMEOUT: Seconds the circuit stays open before
+            a probe call (default: 30)
     """
 
     model_config = SettingsConfigDict(
@@ -160,6 +434,7 @@ class GeminiSettings(BaseSettings):
         env_ignore_empty=True,
         extra="ignore",
         env_prefix="GEMINI_",
+        populate_by_name=True,
     )
 
     # Optional: Gemini API key (obtain from Google AI Studio)
@@ -174,17 +449,59 @@ class GeminiSettings(BaseSettings):
         description="Request timeout in seconds",
     )
 
-    # Polling interval for long-running tasks
-    poll_interval: int = Field(
-        default=10,
-        description="Polling interval in seconds",
+    # Per-operation timeouts; every call returns quickly, jobs run remotely
+    timeouts: dict[str, UpstreamTimeouts] = Field(
+        default={
+            "start": UpstreamTimeouts(read=60),
+            "poll": UpstreamTimeouts(read=60),
+            "cancel": UpstreamTimeouts(read=30),
+        },
+        description="Connect, read and pool timeouts by operation",
     )
 
-    # Maximum polling attempts (10s * 360 = 1 hour max)
-    max_poll_attempts: int = Field(
-        default=360,
-        description="Maximum number of polling attempts",
+    # Adaptive polling for long-running tasks: start fast, back off while
+    # nothing changes, reset on each new event, give up after the deadline
+    min_poll_interval: float = Field(
+        default=2.0,
+        gt=0,
+        description="Poll interval after a new event in seconds",
+    )
+    max_poll_interval: float = Field(
+        default=30.0,
+        gt=0,
+        # GEMINI_POLL_INTERVAL set the fixed interval before adaptive polling
+        validation_alias=AliasChoices(
+            "GEMINI_MAX_POLL_INTERVAL", "GEMINI_POLL_INTERVAL"
+        ),
+        description="Upper bound for the poll backoff in seconds",
+    )
+    poll_backoff: GeminiPollBackoff = Field(
+        default=GeminiPollBackoff.EXPONENTIAL,
+        description="Growth schedule of the poll interval",
+    )
+    poll_jitter: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Random +/- fraction applied to each poll interval",
+    )
+    poll_deadline: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Wall-clock limit for waiting on a job in seconds",
     )
+    max_poll_attempts: int | None = Field(
+        default=None,
+        ge=1,
+        description="Deprecated: use poll_deadline",
+    )
+
+    @model_validator(mode="after")
+    def _apply_max_poll_attempts(self) -> Self:
+        # Attempts were spaced by the fixed interval, now the backoff cap
+        if self.max_poll_attempts and "poll_deadline" not in self.model_fields_set:
+            self.poll_deadline = self.max_poll_attempts * self.max_poll_interval
+        return self
 
     # Agent selection
     agent: GeminiAgent = Field(
@@ -192,6 +509,74 @@ class GeminiSettings(BaseSettings):
         description="Gemini agent to use",
     )
 
+    # Connection pool shared by all Gemini requests for the app lifetime.
+    # Keep-alive outlives max_poll_interval so successive polls reuse a connection.
+    max_connections: int = Field(
+        default=50,
+        description="Maximum number of pooled connections",
+    )
+    max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum number of idle keep-alive connections",
+    )
+    keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle keep-alive connection is retained",
+    )
+
+    # Server-side job supervisor: one background poller per job
+    job_retention: float = Field(
+        default=3600.0,
+        description="Seconds a finished job's state is kept for readers",
+    )
+    job_lease: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a worker process's claim on a stored job lasts",
+    )
+    max_active_jobs_per_user: int = Field(
+        default=5,
+        ge=1,
+        description="Unfinished research jobs allowed per user",
+    )
+
+    # Admission control: concurrent requests admitted to the Gemini endpoints
+    # that call the API (start, sync wait, cancel); status reads are local
+    max_concurrent_requests: int = Field(
+        default=20,
+        ge=1,
+        description="Gemini requests admitted at once across all users",
+    )
+    max_concurrent_requests_per_user: int = Field(
+        default=3,
+        ge=1,
+        description="Gemini requests admitted at once per user",
+    )
+
+    # Client-side token buckets mirroring the Gemini quota per call type;
+    # polls from the job supervisor draw from the "poll" bucket too
+    rate_limits: dict[str, float] = Field(
+        default={"start": 10, "poll": 120, "cancel": 60},
+        description="Requests per minute by call type",
+    )
+    rate_limit_burst: int = Field(
+        default=5,
+        ge=1,
+        description="Calls allowed back to back before the rate applies",
+    )
+
+    # Circuit breaker: fail fast while the Gemini API keeps failing
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive upstream failures that open the circuit",
+    )
+    circuit_recovery_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds the circuit stays open before a probe call",
+    )
+
 
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
@@ -211,6 +596,14 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     # 60 minutes * 24 hours * 8 days = 8 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
+    # In-process cache of verified tokens and users for get_current_user;
+    # bounds how long a change made by another worker goes unnoticed
+    AUTH_CACHE_TTL: float = Field(default=30.0, ge=0)
+    AUTH_CACHE_MAX_ENTRIES: int = Field(default=10_000, ge=1)
+    # Password hashing runs in its own process pool; changing the rounds
+    # rehashes each stored password on its owner's next login
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
     FRONTEND_HOST: str = "http://localhost:5181"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
@@ -227,11 +620,49 @@ class Settings(BaseSettings):
 
     PROJECT_NAME: str
     SENTRY_DSN: HttpUrl | None = None
+    # Optional Redis connection shared by cross-replica caches and limiters
+    REDIS_URL: str | None = None
+    # Admission control for upstream providers: seconds a request may wait
+    # for a free concurrency slot (0 rejects at once) and the Retry-After
+    # value sent with the resulting 429 responses
+    ADMISSION_QUEUE_TIMEOUT: float = Field(default=0.0, ge=0)
+    ADMISSION_RETRY_AFTER: int = Field(default=5, ge=1)
+    # Client-side rate limiting of upstream calls (see app.core.ratelimit):
+    # where the token buckets live (redis shares them across replicas and
+    # requires REDIS_URL) and how long a call may wait for a token before
+    # it is rejected with 429
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    RATE_LIMIT_MAX_WAIT: float = Field(default=5.0, ge=0)
+    # Retries of transient upstream failures (see app.core.retry): attempts
+    # per call, backoff multiplier and cap in seconds, and the shared retry
+    # budget allowing RATIO retries per call plus MIN_RETRIES per WINDOW
+    RETRY_MAX_ATTEMPTS: int = Field(default=3, ge=1)
+    RETRY_BASE_DELAY: float = Field(default=0.5, ge=0)
+    RETRY_MAX_DELAY: float = Field(default=10.0, ge=0)
+    RETRY_BUDGET_RATIO: float = Field(default=0.1, ge=0)
+    RETRY_BUDGET_MIN_RETRIES: int = Field(default=10, ge=0)
+    RETRY_BUDGET_WINDOW: float = Field(default=10.0, gt=0)
+    # Probe calls let through at once by a half-open circuit breaker
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(default=1, ge=1)
     POSTGRES_SERVER: str
     POSTGRES_PORT: int = 5441
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Connection pool of the async engine serving requests: persistent
+    # connections, extra connections allowed under load, seconds after
+    # which a connection is replaced, and whether to test connections
+    # before handing them out. The sync engine used by scripts and the
+    # research job managers gets a fixed pool of DB_SYNC_POOL_SIZE.
+    # Every worker process has its own pools, so a process opens up to
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_SYNC_POOL_SIZE connections (20 by
+    # default) and uvicorn --workers 4 up to 80: keep that total below the
+    # server's max_connections (100 by default in Postgres).
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_SYNC_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_POOL_RECYCLE: int = Field(default=1800, ge=-1)
+    DB_POOL_PRE_PING: bool = True
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,10 +1,33 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine, select
 
 from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+_pool_options: dict[str, Any] = {
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+# Sync engine for scripts, migrations and the research job managers; its
+# few short queries run in worker threads, so a small fixed pool suffices
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.DB_SYNC_POOL_SIZE,
+    max_overflow=0,
+    **_pool_options,
+)
+
+# Async engine for request handlers; psycopg 3 serves both from the same URL
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    **_pool_options,
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
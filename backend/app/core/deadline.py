@@ -0,0 +1,153 @@
+"""Per-request deadlines that cap the time spent on upstream calls.
+
+A client may send an X-Request-Timeout header with the number of seconds
+it is willing to wait. DeadlineMiddleware turns it into an absolute
+deadline for the request context, and every upstream call made on behalf
+of the request is given at most the time that is left: the per-operation
+timeouts from settings are capped by the remaining time before each
+attempt, and an attempt that would start after the deadline fails at once
+with DeadlineExceeded.
+
+DeadlineExceeded is an httpx.TimeoutException, so services map it like any
+other upstream timeout (504). Timeouts caused by an expired deadline say
+nothing about upstream health, so the circuit breaker ignores them, and
+retries stop once the deadline has passed.
+
+Background work (Perplexity job workers, Gemini job supervision) outlives
+the request that started it and must call clear_deadline() first.
+
+Usage:
+    from app.core.deadline import operation_timeout
+
+    timeout = operation_timeout(settings.gemini.timeouts, "poll", default=120)
+    response = await client.get(url, timeout=timeout)
+"""
+
+import math
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar
+
+import httpx
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import UpstreamTimeouts
+from app.core.http_utils import create_timeout
+
+DEADLINE_HEADER = "X-Request-Timeout"
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised instead of starting an upstream call after the request deadline."""
+
+    def __init__(self) -> None:
+        super().__init__("Request deadline exceeded before the upstream call")
+
+
+def set_deadline(timeout: float) -> None:
+    """Set the deadline of the current request context.
+
+    Args:
+        timeout: Seconds from now until the deadline.
+    """
+    _deadline.set(time.monotonic() + timeout)
+
+
+def clear_deadline() -> None:
+    """Remove the deadline from the current context."""
+    _deadline.set(None)
+
+
+def remaining() -> float | None:
+    """Return the seconds left until the deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """Return whether the current context has a deadline that has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def bound(seconds: float) -> float:
+    """Cap a timeout in seconds by the time left until the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    left = remaining()
+    if left is None:
+        return seconds
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(seconds, left)
+
+
+def operation_timeout(
+    timeouts: Mapping[str, UpstreamTimeouts], operation: str, default: float
+) -> httpx.Timeout:
+    """Build the timeout for one upstream call, capped by the deadline.
+
+    Args:
+        timeouts: Per-operation timeouts from the provider settings.
+        operation: Operation about to be called (e.g. "poll").
+        default: Timeout for every phase of operations without an entry.
+
+    Returns:
+        httpx.Timeout with connect, read/write and pool phases.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    config = timeouts.get(operation)
+    if config is None:
+        config = UpstreamTimeouts(connect=default, read=default, pool=default)
+    return create_timeout(
+        bound(config.read),
+        connect_timeout=bound(config.connect),
+        pool_timeout=bound(config.pool),
+    )
+
+
+def _parse_timeout_header(value: str) -> float | None:
+    """Parse a timeout header value, ignoring anything but positive seconds."""
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(timeout) or timeout <= 0:
+        return None
+    return timeout
+
+
+class DeadlineMiddleware:
+    """Start the request deadline from the X-Request-Timeout header.
+
+    Requests without a valid header have no deadline and only the
+    configured per-operation timeouts apply.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timeout = None
+        if scope["type"] == "http":
+            header = DEADLINE_HEADER.lower().encode()
+            for name, value in scope["headers"]:
+                if name == header:
+                    timeout = _parse_timeout_header(value.decode("latin-1"))
+                    break
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+        token = _deadline.set(time.monotonic() + timeout)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _deadline.reset(token)
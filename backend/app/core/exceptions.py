@@ -33,6 +33,7 @@ class TavilyErrorCode(StrEnum):
         INVALID_API_KEY: API key is invalid or missing.
         REQUEST_TIMEOUT: Request timed out waiting for response.
         INVALID_REQUEST: Request parameters are invalid.
+        SERVICE_UNAVAILABLE: Tavily API is failing and calls are short-circuited.
         TAVILY_API_ERROR: Unexpected error from Tavily API.
     """
 
@@ -40,6 +41,7 @@ class TavilyErrorCode(StrEnum):
     INVALID_API_KEY = "invalid_api_key"
     REQUEST_TIMEOUT = "request_timeout"
     INVALID_REQUEST = "invalid_request"
+    SERVICE_UNAVAILABLE = "service_unavailable"
     TAVILY_API_ERROR = "tavily_api_error"
 
 
@@ -166,6 +168,28 @@ class TavilyAPIError(Exception):
             details=details,
         )
 
+    @classmethod
+    def service_unavailable(
+        cls,
+        message: str = "The Tavily API is currently unavailable. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "TavilyAPIError":
+        """Create a service unavailable error for an open circuit breaker.
+
+        Args:
+            message: Custom error message. Defaults to standard unavailable message.
+            details: Optional additional error details, e.g. retry_after.
+
+        Returns:
+            TavilyAPIError configured for an unavailable upstream (503).
+        """
+        return cls(
+            status_code=503,
+            error_code=TavilyErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            details=details,
+        )
+
     @classmethod
     def api_error(
         cls,
@@ -0,0 +1,174 @@
+"""Hedged requests for cutting the latency tail of idempotent upstream calls.
+
+Provides the HedgePolicy which starts a call and, if it has not answered
+after a delay, fires a second identical call and takes whichever finishes
+first, cancelling the other. The delay tracks a percentile of recently
+observed latencies (e.g. p95), so only the slowest few percent of calls
+are hedged; until enough latencies are known a fixed initial delay is used.
+
+Hedges draw from a RetryBudget so that they add at most a fixed fraction of
+extra upstream calls; when the budget is spent the slow call is simply
+awaited.
+
+Outcomes are recorded in app.core.metrics as
+hedge.calls{operation,outcome} with outcome one of:
+- not_needed: the first call answered before the hedge delay
+- budget_exhausted: the call was slow but no hedge was allowed
+- primary_won / hedge_won: a hedge was sent and that call answered first
+Each successful attempt, primary or hedge, observes its own start-to-finish
+latency as hedge.latency{operation}. A loser cancelled by the winner is
+observed too, as a censored sample: its elapsed time, but at least the
+hedge delay, since it would have taken longer still. Otherwise hedging
+would drop exactly the slow tail the delay percentile is meant to track.
+
+Usage:
+    from app.core.hedging import HedgePolicy
+
+    hedge = HedgePolicy(percentile=95, initial_delay=1.0, budget_ratio=0.05)
+    result = await hedge.call("tavily.search", lambda: client.search(query))
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from app.core.metrics import metrics
+from app.core.retry import RetryBudget
+
+T = TypeVar("T")
+
+# Window over which the hedge budget compares hedges to calls, in seconds
+_HEDGE_BUDGET_WINDOW = 60.0
+
+
+class HedgePolicy:
+    """Hedge slow calls with one backup request.
+
+    Attributes:
+        _percentile: Latency percentile used as the hedge delay.
+        _initial_delay: Hedge delay until min_samples latencies are known.
+        _min_samples: Latencies needed before the percentile is used.
+        _latencies: Most recent latencies in seconds: start-to-finish for
+            successful attempts, censored for cancelled losers.
+        _budget: Limits hedges to a fraction of calls.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        max_samples: int = 1000,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile: Latency percentile used as the hedge delay.
+            initial_delay: Hedge delay until min_samples latencies are known.
+            budget_ratio: Maximum hedges per call (e.g. 0.05 = 5% extra).
+            min_samples: Latencies needed before the percentile is used.
+            max_samples: Number of recent latencies kept.
+        """
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=max_samples)
+        self._budget = RetryBudget(
+            ratio=budget_ratio, min_retries=0, window=_HEDGE_BUDGET_WINDOW
+        )
+
+    def delay(self) -> float:
+        """Return the current hedge delay in seconds."""
+        if len(self._latencies) < self._min_samples:
+            return self._initial_delay
+        ordered = sorted(self._latencies)
+        index = math.ceil(self._percentile / 100 * len(ordered)) - 1
+        return ordered[max(0, index)]
+
+    def _record(self, operation: str, latency: float) -> None:
+        self._latencies.append(latency)
+        metrics.observe("hedge.latency", latency, operation=operation)
+
+    def _start(
+        self, operation: str, fn: Callable[[], Awaitable[T]]
+    ) -> tuple["asyncio.Future[T]", float]:
+        """Start one attempt that records its own latency if it succeeds.
+
+        Returns:
+            The attempt's future and its start time on the monotonic clock.
+        """
+        started_at = time.monotonic()
+
+        async def attempt() -> T:
+            result = await fn()
+            self._record(operation, time.monotonic() - started_at)
+            return result
+
+        return asyncio.ensure_future(attempt()), started_at
+
+    async def call(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, hedging it with a second identical call if it is slow.
+
+        Args:
+            operation: Operation name, used in metric labels.
+            fn: Zero-argument coroutine function making one call. It must be
+                idempotent, since it may run twice.
+
+        Returns:
+            The result of whichever call answered successfully first.
+
+        Raises:
+            Exception: The primary call's error if no call succeeded.
+        """
+        self._budget.record_call()
+        delay = self.delay()
+        primary, started_at = self._start(operation, fn)
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                metrics.increment(
+                    "hedge.calls", operation=operation, outcome="not_needed"
+                )
+                return primary.result()
+
+            if not self._budget.try_spend():
+                metrics.increment(
+                    "hedge.calls", operation=operation, outcome="budget_exhausted"
+                )
+                return await primary
+
+            hedge, hedge_started_at = self._start(operation, fn)
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    winner = "primary_won" if task is primary else "hedge_won"
+                    metrics.increment(
+                        "hedge.calls", operation=operation, outcome=winner
+                    )
+                    loser, loser_started_at = (
+                        (hedge, hedge_started_at)
+                        if task is primary
+                        else (primary, started_at)
+                    )
+                    if not loser.done():
+                        # Cancelled below; record a censored sample of it
+                        elapsed = time.monotonic() - loser_started_at
+                        self._record(operation, max(elapsed, delay))
+                    return task.result()
+            # Both calls failed; report the primary's error
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -1,7 +1,8 @@
 """HTTP client utilities for API integrations.
 
 Provides reusable configuration helpers for httpx clients including
-timeout settings and header builders for consistent API authentication.
+timeout settings, connection pool limits, a pooled AsyncClient factory,
+and header builders for consistent API authentication.
 """
 
 from typing import Any
@@ -12,13 +13,16 @@ import httpx
 def create_timeout(
     timeout_seconds: int | float,
     connect_timeout: int | float | None = None,
+    pool_timeout: int | float | None = None,
 ) -> httpx.Timeout:
     """Create an httpx Timeout configuration.
 
     Args:
-        timeout_seconds: Total timeout for the request in seconds.
+        timeout_seconds: Timeout for reading and writing in seconds.
         connect_timeout: Optional separate timeout for connection establishment.
             If not provided, uses timeout_seconds.
+        pool_timeout: Optional separate timeout for acquiring a pooled
+            connection. If not provided, uses timeout_seconds.
 
     Returns:
         Configured httpx.Timeout instance.
@@ -26,6 +30,96 @@ def create_timeout(
     return httpx.Timeout(
         timeout=timeout_seconds,
         connect=connect_timeout or timeout_seconds,
+        pool=pool_timeout or timeout_seconds,
+    )
+
+
+def create_limits(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> httpx.Limits:
+    """Create an httpx connection pool Limits configuration.
+
+    Args:
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle keep-alive connection is retained.
+
+    Returns:
+        Configured httpx.Limits instance.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def create_async_client(
+    *,
+    timeout: httpx.Timeout,
+    limits: httpx.Limits,
+    http2: bool = False,
+    proxy: str | None = None,
+) -> httpx.AsyncClient:
+    """Create a pooled httpx AsyncClient for long-lived reuse.
+
+    The returned client is intended to be created once per upstream and
+    shared across requests so TCP/TLS connections are kept alive and reused.
+    The caller owns the client and must close it with ``aclose()``.
+
+    Args:
+        timeout: Default timeout configuration for requests.
+        limits: Connection pool limits.
+        http2: Enable HTTP/2 negotiation when the upstream supports it.
+        proxy: Optional HTTP proxy URL for all requests.
+
+    Returns:
+        Configured httpx.AsyncClient instance.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        proxy=proxy,
+    )
+
+
+def create_pooled_client(
+    *,
+    timeout_seconds: int | float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    http2: bool = False,
+    proxy: str | None = None,
+) -> httpx.AsyncClient:
+    """Create a pooled httpx AsyncClient from plain settings values.
+
+    Convenience wrapper used by the service layer to build one long-lived
+    client per upstream from its settings block (e.g. settings.gemini).
+
+    Args:
+        timeout_seconds: Default request timeout in seconds.
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle keep-alive connection is retained.
+        http2: Enable HTTP/2 negotiation when the upstream supports it.
+        proxy: Optional HTTP proxy URL for all requests.
+
+    Returns:
+        Configured httpx.AsyncClient instance.
+    """
+    return create_async_client(
+        timeout=create_timeout(timeout_seconds),
+        limits=create_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        proxy=proxy,
     )
 
 
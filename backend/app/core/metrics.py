@@ -0,0 +1,124 @@
+"""In-process metrics for tuning upstream call behaviour.
+
+Provides a small registry of counters and value distributions that the
+services record into, e.g. how many polls a Gemini job needed. Values live
+in process memory, are reset on restart, and are exposed to superusers via
+GET /utils/metrics/.
+
+Series are identified by a name plus optional labels, rendered as
+"name{label=value,...}" with labels sorted so the same labels always map to
+the same series.
+
+Usage:
+    from app.core.metrics import metrics
+
+    metrics.increment("gemini.polls")
+    metrics.observe("gemini.polls_per_job", job.polls, outcome="completed")
+    snapshot = metrics.snapshot()
+"""
+
+import threading
+from typing import Any
+
+
+def _series_key(name: str, labels: dict[str, Any]) -> str:
+    """Build the identifier of a series from its name and labels."""
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={labels[key]}" for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+class _Distribution:
+    """Running summary of observed values."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count,
+        }
+
+
+class Metrics:
+    """Registry of counters and distributions.
+
+    Safe to record into from worker threads as well as the event loop.
+
+    Attributes:
+        _counters: Counter values keyed by series.
+        _distributions: Observed value summaries keyed by series.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._distributions: dict[str, _Distribution] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add value to a counter.
+
+        Args:
+            name: Metric name, dot-separated by convention.
+            value: Amount to add.
+            **labels: Labels distinguishing series of the same metric.
+        """
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one observation of a distribution.
+
+        Args:
+            name: Metric name, dot-separated by convention.
+            value: Observed value.
+            **labels: Labels distinguishing series of the same metric.
+        """
+        key = _series_key(name, labels)
+        with self._lock:
+            distribution = self._distributions.get(key)
+            if distribution is None:
+                distribution = self._distributions[key] = _Distribution()
+            distribution.add(value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """Return the current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(_series_key(name, labels), 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time copy of every series."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "distributions": {
+                    key: distribution.to_dict()
+                    for key, distribution in self._distributions.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            self._counters.clear()
+            self._distributions.clear()
+
+
+# Process-wide registry
+metrics = Metrics()
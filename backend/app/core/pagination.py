@@ -0,0 +1,83 @@
+"""Opaque cursors for keyset pagination.
+
+Lists paginated by cursor are sorted newest first on (created_at, id), a
+key that is unique and never changes, so pages stay stable while rows are
+added or removed. A cursor holds the key of the row a page ended (or
+started) at and the direction to read from there:
+
+- next: rows after the key in list order (older rows)
+- prev: rows before the key in list order (newer rows)
+
+Fetching a page then costs an index range scan of page size rows no
+matter how deep the page is, unlike OFFSET, which reads and discards
+every skipped row.
+
+Cursors are URL-safe base64 of a small JSON document. They are opaque to
+clients and not signed: a forged cursor only moves the starting point of
+a query that is still filtered by owner.
+
+Usage:
+    from app.core.pagination import Cursor
+
+    next_cursor = Cursor(item.created_at, item.id, "next").encode()
+    cursor = Cursor.decode(next_cursor)
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+CursorDirection = Literal["next", "prev"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor string cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position in a list sorted on (created_at, id), newest first.
+
+    Attributes:
+        created_at: created_at of the row the cursor points at.
+        id: id of the row the cursor points at.
+        direction: Whether to read the rows after (next) or before (prev)
+            that row.
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+    direction: CursorDirection = "next"
+
+    def encode(self) -> str:
+        """Serialize the cursor to an opaque URL-safe string."""
+        payload = json.dumps(
+            {"c": self.created_at.isoformat(), "i": str(self.id), "d": self.direction},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        """Parse a cursor produced by encode().
+
+        Raises:
+            InvalidCursorError: If value is not a valid cursor.
+        """
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            direction = payload["d"]
+            if direction not in ("next", "prev"):
+                raise ValueError(direction)
+            return cls(
+                created_at=datetime.fromisoformat(payload["c"]),
+                id=uuid.UUID(payload["i"]),
+                direction=direction,
+            )
+        except (binascii.Error, KeyError, TypeError, ValueError) as exc:
+            raise InvalidCursorError("Invalid pagination cursor") from exc
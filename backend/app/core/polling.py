@@ -0,0 +1,109 @@
+"""Adaptive poll scheduling for long-running upstream jobs.
+
+Provides poll policies that decide how long to wait before the next status
+poll of a job. Policies start at a minimum interval, grow while nothing
+changes, are capped at a maximum interval, and drop back to the minimum as
+soon as the job reports progress. Optional jitter spreads the polls of jobs
+started together so they do not hit the upstream in lockstep.
+
+Policies are stateful: create one per job.
+
+Usage:
+    from app.core.polling import ExponentialPollPolicy
+
+    policy = ExponentialPollPolicy(min_interval=2, max_interval=30, jitter=0.1)
+    await asyncio.sleep(policy.next_interval(new_event=result_changed))
+"""
+
+import abc
+import random
+from typing import Protocol
+
+
+class PollPolicy(Protocol):
+    """Decides the delay before the next poll of a job."""
+
+    def next_interval(self, *, new_event: bool) -> float:
+        """Return the seconds to wait before the next poll.
+
+        Args:
+            new_event: Whether the last poll reported progress.
+        """
+        ...
+
+
+class BackoffPollPolicy(abc.ABC):
+    """Base class for policies that grow the interval step by step.
+
+    Subclasses define the growth schedule in _base_interval(); this class
+    handles resetting, capping and jitter.
+
+    Attributes:
+        min_interval: Interval after a reset, in seconds.
+        max_interval: Upper bound for any interval, in seconds.
+        jitter: Random +/- fraction applied to each interval.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        jitter: float = 0.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the policy at its minimum interval.
+
+        Args:
+            min_interval: Interval after a reset, in seconds.
+            max_interval: Upper bound for any interval, in seconds.
+            jitter: Random +/- fraction applied to each interval (0 to 1).
+            rng: Random source for jitter, mainly for deterministic tests.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._step = 0
+
+    def reset(self) -> None:
+        """Return to the minimum interval."""
+        self._step = 0
+
+    def next_interval(self, *, new_event: bool) -> float:
+        """Return the next interval, resetting first on a new event."""
+        if new_event:
+            self.reset()
+        interval = self._base_interval(self._step)
+        if interval >= self.max_interval:
+            interval = self.max_interval
+        else:
+            # Stop stepping once capped so the schedule cannot overflow
+            self._step += 1
+        if self.jitter:
+            interval *= self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(interval, self.max_interval)
+
+    @abc.abstractmethod
+    def _base_interval(self, step: int) -> float:
+        """Return the un-jittered interval for the given step."""
+
+
+class ExponentialPollPolicy(BackoffPollPolicy):
+    """Double the interval after every poll without progress."""
+
+    def _base_interval(self, step: int) -> float:
+        return float(self.min_interval * 2**step)
+
+
+class FibonacciPollPolicy(BackoffPollPolicy):
+    """Grow the interval along the Fibonacci sequence (1, 2, 3, 5, 8, ...).
+
+    Grows more gently than exponential backoff, so slow jobs are still
+    polled reasonably often before the cap is reached.
+    """
+
+    def _base_interval(self, step: int) -> float:
+        previous, current = 1, 1
+        for _ in range(step):
+            previous, current = current, previous + current
+        return float(self.min_interval * current)
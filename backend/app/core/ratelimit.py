@@ -0,0 +1,257 @@
+"""Client-side token-bucket rate limiting for upstream API quotas.
+
+Provides the RateLimiter which models each upstream provider's request
+quota locally, so calls that would be answered with an upstream 429 are
+delayed or refused before the request is spent. Every bucket is identified
+by a provider and an endpoint type (e.g. Tavily "search" vs "crawl", or a
+Perplexity model tier) and refills continuously at its configured
+requests-per-minute rate up to a burst capacity.
+
+A call takes one token. When the bucket is empty the call waits until a
+token becomes available, smoothing bursts into the upstream rate; if that
+wait would exceed the limiter's max_wait the call is refused with
+AdmissionError (429 with Retry-After) instead.
+
+Buckets live in process memory by default. The optional Redis backend
+keeps them in Redis so limits hold across multiple backend replicas; it
+requires the optional ``redis`` package.
+
+Usage:
+    from app.core.ratelimit import create_rate_limiter
+
+    limiter = create_rate_limiter()
+    await limiter.acquire("tavily", "search")
+    result = await client.search(query=query)
+"""
+
+import asyncio
+import importlib
+import math
+import time
+from typing import Any, Literal, Protocol
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.exceptions.admission import AdmissionError
+
+
+class TokenBucketBackend(Protocol):
+    """Storage for token buckets."""
+
+    async def take(
+        self, key: str, rate: float, capacity: float, max_wait: float
+    ) -> tuple[bool, float]:
+        """Reserve one token from a bucket.
+
+        Args:
+            key: Bucket identifier.
+            rate: Refill rate in tokens per second.
+            capacity: Maximum number of stored tokens (burst size).
+            max_wait: Longest acceptable wait for the token, in seconds.
+
+        Returns:
+            (reserved, wait): whether a token was reserved, and the seconds
+            until it is available. Nothing is reserved if wait > max_wait.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release backend resources."""
+        ...
+
+
+class MemoryTokenBucketBackend:
+    """In-process token buckets.
+
+    Attributes:
+        _buckets: Mapping of key to (tokens, last refill monotonic time).
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no buckets."""
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def take(
+        self, key: str, rate: float, capacity: float, max_wait: float
+    ) -> tuple[bool, float]:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        wait = max(0.0, (1 - tokens) / rate)
+        if wait > max_wait:
+            self._buckets[key] = (tokens, now)
+            return False, wait
+        # Tokens may go negative: later callers queue behind this reservation
+        self._buckets[key] = (tokens - 1, now)
+        return True, wait
+
+    async def aclose(self) -> None:
+        self._buckets.clear()
+
+
+# Atomic token-bucket reservation using the Redis server clock, so every
+# replica sees the same bucket state. Mirrors MemoryTokenBucketBackend.take.
+_REDIS_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = math.max(0, (1 - tokens) / rate)
+local reserved = 0
+if wait <= max_wait then
+    tokens = tokens - 1
+    reserved = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {reserved, tostring(wait)}
+"""
+
+
+class RedisTokenBucketBackend:
+    """Redis-backed token buckets shared across backend replicas.
+
+    Each reservation runs as one Lua script, so concurrent replicas cannot
+    overdraw a bucket. Requires the optional ``redis`` package.
+
+    Attributes:
+        _redis: The redis.asyncio client instance.
+        _script: The registered reservation script.
+    """
+
+    def __init__(self, url: str) -> None:
+        """Initialize the Redis client.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0).
+
+        Raises:
+            RuntimeError: If the redis package (the 'redis' extra) is not
+                installed.
+        """
+        try:
+            redis_asyncio = importlib.import_module("redis.asyncio")
+        except ImportError as exc:
+            raise RuntimeError(
+                "The Redis rate limit backend requires the 'redis' package; "
+                "install the app with the 'redis' extra (e.g. uv sync --extra redis)."
+            ) from exc
+        self._redis: Any = redis_asyncio.from_url(url)
+        self._script: Any = self._redis.register_script(_REDIS_TAKE_SCRIPT)
+
+    async def take(
+        self, key: str, rate: float, capacity: float, max_wait: float
+    ) -> tuple[bool, float]:
+        reserved, wait = await self._script(
+            keys=[f"ratelimit:{key}"], args=[rate, capacity, max_wait]
+        )
+        return bool(int(reserved)), float(wait)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+class RateLimiter:
+    """Token-bucket limiter keyed by provider and endpoint type.
+
+    Attributes:
+        _backend: Bucket storage.
+        _limits: (requests per minute, burst) keyed by (provider, endpoint).
+            Endpoints without an entry are not limited.
+        _max_wait: Longest a call may wait for a token, in seconds.
+    """
+
+    def __init__(
+        self,
+        backend: TokenBucketBackend,
+        limits: dict[tuple[str, str], tuple[float, int]],
+        max_wait: float = 5.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            backend: Bucket storage.
+            limits: (requests per minute, burst) keyed by (provider, endpoint).
+            max_wait: Longest a call may wait for a token, in seconds.
+        """
+        self._backend = backend
+        self._limits = limits
+        self._max_wait = max_wait
+
+    async def aclose(self) -> None:
+        """Close the bucket backend."""
+        await self._backend.aclose()
+
+    async def acquire(self, provider: str, endpoint: str) -> None:
+        """Take a token for one upstream call, waiting if the bucket is empty.
+
+        Args:
+            provider: Upstream provider, e.g. "tavily".
+            endpoint: Endpoint type or model tier, e.g. "search".
+
+        Raises:
+            AdmissionError: If no token becomes available within max_wait.
+        """
+        limit = self._limits.get((provider, endpoint))
+        if limit is None:
+            return
+        requests_per_minute, burst = limit
+        reserved, wait = await self._backend.take(
+            f"{provider}:{endpoint}",
+            rate=requests_per_minute / 60,
+            capacity=max(1, burst),
+            max_wait=self._max_wait,
+        )
+        if not reserved:
+            metrics.increment(
+                "ratelimit.rejected", provider=provider, endpoint=endpoint
+            )
+            raise AdmissionError.rate_limit_exceeded(
+                provider=provider, endpoint=endpoint, retry_after=math.ceil(wait)
+            )
+        if wait > 0:
+            metrics.increment("ratelimit.delayed", provider=provider, endpoint=endpoint)
+            await asyncio.sleep(wait)
+
+
+def create_rate_limiter(
+    backend: Literal["memory", "redis"] | None = None,
+) -> RateLimiter:
+    """Create the rate limiter from the provider settings.
+
+    Args:
+        backend: Bucket backend; defaults to settings.RATE_LIMIT_BACKEND.
+
+    Returns:
+        RateLimiter with every provider's per-endpoint limits and burst.
+
+    Raises:
+        ValueError: If the redis backend is selected without REDIS_URL.
+    """
+    limits: dict[tuple[str, str], tuple[float, int]] = {}
+    for provider, provider_settings in (
+        ("tavily", settings.tavily),
+        ("perplexity", settings.perplexity),
+        ("gemini", settings.gemini),
+    ):
+        for endpoint, requests_per_minute in provider_settings.rate_limits.items():
+            limits[(provider, endpoint)] = (
+                requests_per_minute,
+                provider_settings.rate_limit_burst,
+            )
+
+    bucket_backend: TokenBucketBackend
+    if (backend or settings.RATE_LIMIT_BACKEND) == "redis":
+        if not settings.REDIS_URL:
+            raise ValueError("REDIS_URL must be set to use the redis rate limiter.")
+        bucket_backend = RedisTokenBucketBackend(settings.REDIS_URL)
+    else:
+        bucket_backend = MemoryTokenBucketBackend()
+    return RateLimiter(
+        bucket_backend, limits=limits, max_wait=settings.RATE_LIMIT_MAX_WAIT
+    )
@@ -0,0 +1,325 @@
+"""Retries with exponential backoff and a retry budget for upstream calls.
+
+Provides the RetryPolicy which re-runs an upstream call after a transient
+failure: a connection error, or a 429/502/503/504 response. Delays grow
+exponentially with full jitter, and a Retry-After header sent by the
+upstream is honored as the minimum delay (a Retry-After longer than the
+policy's max_delay ends the retries instead).
+
+All policies share one RetryBudget, which allows retries only up to a
+fraction of recent calls (plus a small floor). During an upstream outage
+every call fails, so the budget runs out quickly and further failures are
+returned at once instead of multiplying the load on a struggling provider.
+Retries also stop once the request deadline (app.core.deadline) has passed.
+
+Retry counts are recorded in app.core.metrics:
+- retry.attempts{provider,operation,reason}: retries scheduled
+- retry.exhausted{provider,operation}: calls that failed after retrying
+- retry.budget_exhausted{provider,operation}: retries refused by the budget
+
+Usage:
+    from app.core.retry import create_retry_policy
+
+    retry = create_retry_policy("gemini")
+    response = await retry.call("poll", lambda: client.get(url))
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    retry_if_result,
+    wait_random_exponential,
+)
+
+from app.core.config import settings
+from app.core.deadline import expired as deadline_expired
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+# Failures an idempotent call can safely be repeated after
+IDEMPOTENT_RETRY_STATUSES: frozenset[int] = frozenset({429, 502, 503, 504})
+IDEMPOTENT_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+# Failures that guarantee the upstream did not process the request, so
+# even a non-idempotent call can be repeated
+UNPROCESSED_RETRY_STATUSES: frozenset[int] = frozenset({429, 503})
+UNPROCESSED_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (httpx.ConnectError,)
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Read a Retry-After header as seconds from now.
+
+    Args:
+        response: Upstream response that may carry Retry-After.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed.
+        Both delta-seconds and HTTP-date forms are accepted.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Limit retries to a fraction of recent calls across all policies.
+
+    Attributes:
+        _ratio: Retries allowed per call in the window.
+        _min_retries: Retries always allowed per window, for low traffic.
+        _window: Sliding window length in seconds.
+        _calls: Start times of calls in the window.
+        _retries: Times of retries in the window.
+    """
+
+    def __init__(self, ratio: float, min_retries: int, window: float) -> None:
+        """Initialize an empty budget.
+
+        Args:
+            ratio: Retries allowed per call in the window (e.g. 0.1 = 10%).
+            min_retries: Retries always allowed per window.
+            window: Sliding window length in seconds.
+        """
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._window = window
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for times in (self._calls, self._retries):
+            while times and now - times[0] > self._window:
+                times.popleft()
+
+    def record_call(self) -> None:
+        """Count a first attempt towards the budget."""
+        now = time.monotonic()
+        self._prune(now)
+        self._calls.append(now)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+        """
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) >= self._min_retries + self._ratio * len(self._calls):
+            return False
+        self._retries.append(now)
+        return True
+
+    def reset(self) -> None:
+        """Forget all recorded calls and retries."""
+        self._calls.clear()
+        self._retries.clear()
+
+
+# Process-wide budget shared by every retry policy
+retry_budget = RetryBudget(
+    ratio=settings.RETRY_BUDGET_RATIO,
+    min_retries=settings.RETRY_BUDGET_MIN_RETRIES,
+    window=settings.RETRY_BUDGET_WINDOW,
+)
+
+
+class RetryPolicy:
+    """Retry transient upstream failures of one provider.
+
+    A call may return an httpx.Response (raw httpx services) or raise
+    (SDK-based services, e.g. httpx.HTTPStatusError); both are classified
+    with the same status codes. When retries end on a failed response,
+    that response is returned so the caller's usual error mapping applies.
+
+    Attributes:
+        _provider: Upstream provider, used in metric labels.
+        _retry_statuses: Response status codes that are retried.
+        _retry_exceptions: Exception types that are retried.
+        _max_attempts: Total attempts including the first.
+        _base_delay: Backoff multiplier in seconds.
+        _max_delay: Upper bound for one delay in seconds.
+        _budget: Retry budget shared across policies.
+        _sleep: Sleep function used between attempts.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        retry_statuses: frozenset[int] = IDEMPOTENT_RETRY_STATUSES,
+        retry_exceptions: tuple[type[Exception], ...] = IDEMPOTENT_RETRY_EXCEPTIONS,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        budget: RetryBudget | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            provider: Upstream provider, used in metric labels.
+            retry_statuses: Response status codes that are retried.
+            retry_exceptions: Exception types that are retried.
+            max_attempts: Total attempts including the first.
+            base_delay: Backoff multiplier in seconds.
+            max_delay: Upper bound for one delay in seconds.
+            budget: Retry budget; defaults to the process-wide retry_budget.
+            sleep: Sleep function used between attempts.
+        """
+        self._provider = provider
+        self._retry_statuses = retry_statuses
+        self._retry_exceptions = retry_exceptions
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget or retry_budget
+        self._sleep = sleep
+
+    def _failed_response(self, state: RetryCallState) -> httpx.Response | None:
+        """Return the response of a failed attempt, if it carried one."""
+        if state.outcome is None:
+            return None
+        if state.outcome.failed:
+            exc = state.outcome.exception()
+            if isinstance(exc, httpx.HTTPStatusError):
+                return exc.response
+            return None
+        result = state.outcome.result()
+        return result if isinstance(result, httpx.Response) else None
+
+    def _is_retriable_response(self, response: httpx.Response) -> bool:
+        if response.status_code not in self._retry_statuses:
+            return False
+        retry_after = parse_retry_after(response)
+        # The upstream asked for more patience than this call has
+        return retry_after is None or retry_after <= self._max_delay
+
+    def _is_retriable_exception(self, exc: BaseException) -> bool:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return self._is_retriable_response(exc.response)
+        return isinstance(exc, self._retry_exceptions)
+
+    def _is_retriable_result(self, result: object) -> bool:
+        return isinstance(result, httpx.Response) and self._is_retriable_response(
+            result
+        )
+
+    def _wait(self, state: RetryCallState) -> float:
+        """Exponential backoff with full jitter, at least the Retry-After."""
+        delay = wait_random_exponential(
+            multiplier=self._base_delay, max=self._max_delay
+        )(state)
+        response = self._failed_response(state)
+        retry_after = parse_retry_after(response) if response is not None else None
+        return max(delay, retry_after or 0.0)
+
+    async def call(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run an upstream call, retrying transient failures.
+
+        Args:
+            operation: Service operation name, used in metric labels.
+            fn: Zero-argument coroutine function making one attempt.
+
+        Returns:
+            The result of the first attempt that is not retried.
+
+        Raises:
+            Exception: Whatever the last attempt raised.
+        """
+        provider = self._provider
+
+        def stop(state: RetryCallState) -> bool:
+            if state.attempt_number >= self._max_attempts or deadline_expired():
+                return True
+            if self._budget.try_spend():
+                return False
+            metrics.increment(
+                "retry.budget_exhausted", provider=provider, operation=operation
+            )
+            return True
+
+        def before_sleep(state: RetryCallState) -> None:
+            response = self._failed_response(state)
+            if response is not None:
+                reason = str(response.status_code)
+            elif state.outcome is not None and state.outcome.failed:
+                reason = type(state.outcome.exception()).__name__
+            else:
+                reason = "unknown"
+            metrics.increment(
+                "retry.attempts", provider=provider, operation=operation, reason=reason
+            )
+
+        def give_up(state: RetryCallState) -> T:
+            if state.attempt_number > 1:
+                metrics.increment(
+                    "retry.exhausted", provider=provider, operation=operation
+                )
+            assert state.outcome is not None
+            result: T = state.outcome.result()
+            return result
+
+        self._budget.record_call()
+        retrying = AsyncRetrying(
+            sleep=self._sleep,
+            stop=stop,
+            wait=self._wait,
+            retry=(
+                retry_if_exception(self._is_retriable_exception)
+                | retry_if_result(self._is_retriable_result)
+            ),
+            before_sleep=before_sleep,
+            retry_error_callback=give_up,
+        )
+        result: T = await retrying(fn)
+        return result
+
+
+def create_retry_policy(provider: str, *, idempotent: bool = True) -> RetryPolicy:
+    """Create a retry policy from the RETRY_* settings.
+
+    Args:
+        provider: Upstream provider, used in metric labels.
+        idempotent: Whether the calls may be repeated after any transient
+            failure. Non-idempotent calls are only retried when the
+            upstream cannot have processed them (connect error, 429, 503).
+
+    Returns:
+        RetryPolicy sharing the process-wide retry budget.
+    """
+    if idempotent:
+        statuses, exceptions = IDEMPOTENT_RETRY_STATUSES, IDEMPOTENT_RETRY_EXCEPTIONS
+    else:
+        statuses, exceptions = UNPROCESSED_RETRY_STATUSES, UNPROCESSED_RETRY_EXCEPTIONS
+    return RetryPolicy(
+        provider,
+        retry_statuses=statuses,
+        retry_exceptions=exceptions,
+        max_attempts=settings.RETRY_MAX_ATTEMPTS,
+        base_delay=settings.RETRY_BASE_DELAY,
+        max_delay=settings.RETRY_MAX_DELAY,
+    )
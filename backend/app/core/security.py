@@ -1,16 +1,29 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 ALGORITHM = "HS256"
 
+# bcrypt takes ~250 ms of CPU per call; running it in a dedicated process
+# pool keeps logins from blocking the event loop or starving the AnyIO
+# thread pool shared by all sync routes
+_password_executor: ProcessPoolExecutor | None = None
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
@@ -25,3 +38,61 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if the hash uses outdated settings.
+
+    Returns:
+        Whether the password matches, and a new hash to store when the
+        stored one was made with different bcrypt rounds (else None).
+    """
+    verified, new_hash = pwd_context.verify_and_update(plain_password, hashed_password)
+    return verified, new_hash
+
+
+def _get_password_executor() -> ProcessPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _password_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _password_executor
+
+
+async def _run_in_password_executor(fn: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_executor(), fn, *args)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the password hashing process pool."""
+    return await _run_in_password_executor(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the password hashing process pool."""
+    return await _run_in_password_executor(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Run verify_and_update_password in the password hashing process pool."""
+    return await _run_in_password_executor(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def shutdown_password_executor() -> None:
+    """Stop the password hashing processes, if any were started."""
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(cancel_futures=True)
+        _password_executor = None
@@ -0,0 +1,92 @@
+"""In-flight request coalescing for upstream API calls.
+
+Provides the SingleFlight helper which ensures that concurrent callers
+asking for the same key share one in-progress upstream call instead of
+each issuing their own. The first caller starts the call; later callers
+with the same key await the same task until it finishes.
+
+Semantics:
+    - Results and exceptions from the shared call are delivered to every
+      waiter.
+    - Cancelling one waiter does not affect the others. The shared call is
+      only cancelled when every waiter has been cancelled.
+    - Keys are forgotten as soon as the call finishes, so results are never
+      reused after completion (use a cache for that).
+
+Usage:
+    from app.core.singleflight import SingleFlight
+
+    inflight: SingleFlight[dict[str, Any]] = SingleFlight()
+    result = await inflight.do(key, lambda: client.search(query=query))
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A shared in-flight call and the number of callers awaiting it."""
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share the same key.
+
+    Attributes:
+        _calls: Mapping of key to the currently running shared call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, _Call[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run fn once for all concurrent callers using the same key.
+
+        Args:
+            key: Canonical identifier of the upstream request.
+            fn: Zero-argument callable returning the coroutine to share.
+                Only invoked by the first caller for a given key.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised, for every waiter.
+            asyncio.CancelledError: If this waiter or the shared call was
+                cancelled.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(partial(self._forget, key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            # Cancel the shared call only when no other caller still needs it
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _Call[T], _task: "asyncio.Task[T]") -> None:
+        """Drop a finished call and mark its exception as retrieved."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # Avoid "exception was never retrieved" when every waiter left
+            call.task.exception()
@@ -1,10 +1,27 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, func, or_, update
+from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
-from app.models import Item, ItemCreate, User, UserCreate, UserUpdate
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_and_update_password_async,
+    verify_password,
+)
+from app.models import (
+    Item,
+    ItemCreate,
+    ResearchJob,
+    ResearchProvider,
+    User,
+    UserCreate,
+    UserUpdate,
+    utc_now,
+)
 
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
@@ -37,6 +54,39 @@ def get_user_by_email(*, session: Session, email: str) -> User | None:
     return session_user
 
 
+async def create_user_async(*, session: AsyncSession, user_create: UserCreate) -> User:
+    hashed_password = await get_password_hash_async(user_create.password)
+    db_obj = User.model_validate(
+        user_create, update={"hashed_password": hashed_password}
+    )
+    session.add(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    return db_obj
+
+
+async def update_user_async(
+    *, session: AsyncSession, db_user: User, user_in: UserUpdate
+) -> Any:
+    user_data = user_in.model_dump(exclude_unset=True)
+    extra_data = {}
+    if "password" in user_data:
+        password = user_data["password"]
+        hashed_password = await get_password_hash_async(password)
+        extra_data["hashed_password"] = hashed_password
+    db_user.sqlmodel_update(user_data, update=extra_data)
+    session.add(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+    return db_user
+
+
+async def get_user_by_email_async(*, session: AsyncSession, email: str) -> User | None:
+    statement = select(User).where(User.email == email)
+    session_user = (await session.exec(statement)).first()
+    return session_user
+
+
 def authenticate(*, session: Session, email: str, password: str) -> User | None:
     db_user = get_user_by_email(session=session, email=email)
     if not db_user:
@@ -46,9 +96,249 @@ def authenticate(*, session: Session, email: str, password: str) -> User | None:
     return db_user
 
 
+async def authenticate_async(
+    *, session: AsyncSession, email: str, password: str
+) -> User | None:
+    db_user = await get_user_by_email_async(session=session, email=email)
+    if not db_user:
+        return None
+    verified, new_hash = await verify_and_update_password_async(
+        password, db_user.hashed_password
+    )
+    if not verified:
+        return None
+    if new_hash is not None:
+        # Hashed with other bcrypt rounds than configured: upgrade in place
+        db_user.hashed_password = new_hash
+        session.add(db_user)
+        await session.commit()
+        await session.refresh(db_user)
+    return db_user
+
+
 def create_item(*, session: Session, item_in: ItemCreate, owner_id: uuid.UUID) -> Item:
     db_item = Item.model_validate(item_in, update={"owner_id": owner_id})
     session.add(db_item)
     session.commit()
     session.refresh(db_item)
     return db_item
+
+
+async def create_item_async(
+    *, session: AsyncSession, item_in: ItemCreate, owner_id: uuid.UUID
+) -> Item:
+    db_item = Item.model_validate(item_in, update={"owner_id": owner_id})
+    session.add(db_item)
+    await session.commit()
+    await session.refresh(db_item)
+    return db_item
+
+
+def create_research_job(
+    *,
+    session: Session,
+    interaction_id: str,
+    owner_id: uuid.UUID,
+    request: dict[str, Any],
+    status: str,
+    provider: ResearchProvider = "gemini",
+    lease_owner: str | None = None,
+    lease_expires_at: datetime | None = None,
+) -> ResearchJob:
+    db_job = ResearchJob(
+        provider=provider,
+        interaction_id=interaction_id,
+        owner_id=owner_id,
+        request=request,
+        status=status,
+        lease_owner=lease_owner,
+        lease_expires_at=lease_expires_at,
+    )
+    session.add(db_job)
+    session.commit()
+    session.refresh(db_job)
+    return db_job
+
+
+def get_research_job(*, session: Session, interaction_id: str) -> ResearchJob | None:
+    statement = select(ResearchJob).where(ResearchJob.interaction_id == interaction_id)
+    return session.exec(statement).first()
+
+
+def update_research_job(
+    *, session: Session, db_job: ResearchJob, job_data: dict[str, Any]
+) -> ResearchJob:
+    db_job.sqlmodel_update(job_data, update={"updated_at": utc_now()})
+    session.add(db_job)
+    session.commit()
+    session.refresh(db_job)
+    return db_job
+
+
+def get_active_research_jobs(
+    *, session: Session, provider: ResearchProvider, terminal_statuses: list[str]
+) -> list[ResearchJob]:
+    statement = select(ResearchJob).where(
+        ResearchJob.provider == provider,
+        ResearchJob.status.not_in(terminal_statuses),  # type: ignore[attr-defined]
+    )
+    return list(session.exec(statement).all())
+
+
+def count_active_research_jobs(
+    *,
+    session: Session,
+    provider: ResearchProvider,
+    owner_id: uuid.UUID,
+    terminal_statuses: list[str],
+) -> int:
+    statement = (
+        select(func.count())
+        .select_from(ResearchJob)
+        .where(
+            ResearchJob.provider == provider,
+            ResearchJob.owner_id == owner_id,
+            col(ResearchJob.status).not_in(terminal_statuses),
+        )
+    )
+    return session.exec(statement).one()
+
+
+def create_research_job_within_limit(
+    *,
+    session: Session,
+    interaction_id: str,
+    owner_id: uuid.UUID,
+    request: dict[str, Any],
+    status: str,
+    provider: ResearchProvider,
+    terminal_statuses: list[str],
+    limit: int,
+    lease_owner: str | None = None,
+    lease_expires_at: datetime | None = None,
+) -> ResearchJob | None:
+    # Lock the owner's row so that concurrent creates for one user, from any
+    # worker process, count and insert one at a time
+    session.exec(select(User.id).where(User.id == owner_id).with_for_update()).first()
+    active = count_active_research_jobs(
+        session=session,
+        provider=provider,
+        owner_id=owner_id,
+        terminal_statuses=terminal_statuses,
+    )
+    if active >= limit:
+        session.rollback()
+        return None
+    return create_research_job(
+        session=session,
+        interaction_id=interaction_id,
+        owner_id=owner_id,
+        request=request,
+        status=status,
+        provider=provider,
+        lease_owner=lease_owner,
+        lease_expires_at=lease_expires_at,
+    )
+
+
+def delete_research_job(*, session: Session, interaction_id: str) -> None:
+    statement = delete(ResearchJob).where(
+        col(ResearchJob.interaction_id) == interaction_id
+    )
+    session.execute(statement)
+    session.commit()
+
+
+def claim_research_jobs(
+    *,
+    session: Session,
+    provider: ResearchProvider,
+    terminal_statuses: list[str],
+    lease_owner: str,
+    lease_expires_at: datetime,
+    limit: int | None = None,
+) -> list[ResearchJob]:
+    # Rows another transaction is claiming right now are skipped, not waited on
+    statement = (
+        select(ResearchJob)
+        .where(
+            ResearchJob.provider == provider,
+            col(ResearchJob.status).not_in(terminal_statuses),
+            or_(
+                col(ResearchJob.lease_expires_at).is_(None),
+                col(ResearchJob.lease_expires_at) < utc_now(),
+            ),
+        )
+        .order_by(col(ResearchJob.created_at))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    db_jobs = list(session.exec(statement).all())
+    for db_job in db_jobs:
+        db_job.lease_owner = lease_owner
+        db_job.lease_expires_at = lease_expires_at
+        session.add(db_job)
+    session.commit()
+    return db_jobs
+
+
+def claim_research_job(
+    *,
+    session: Session,
+    interaction_id: str,
+    terminal_statuses: list[str],
+    lease_owner: str,
+    lease_expires_at: datetime,
+) -> ResearchJob | None:
+    statement = (
+        select(ResearchJob)
+        .where(ResearchJob.interaction_id == interaction_id)
+        .with_for_update()
+    )
+    db_job = session.exec(statement).first()
+    # Take the lease if it is ours, free or expired; a live lease is kept
+    if (
+        db_job is not None
+        and db_job.status not in terminal_statuses
+        and (
+            db_job.lease_owner == lease_owner
+            or db_job.lease_expires_at is None
+            or db_job.lease_expires_at < utc_now()
+        )
+    ):
+        db_job.lease_owner = lease_owner
+        db_job.lease_expires_at = lease_expires_at
+        session.add(db_job)
+    session.commit()
+    if db_job is not None:
+        session.refresh(db_job)
+    return db_job
+
+
+def renew_research_job_leases(
+    *,
+    session: Session,
+    interaction_ids: list[str],
+    lease_owner: str,
+    lease_expires_at: datetime,
+) -> None:
+    statement = (
+        update(ResearchJob)
+        .where(
+            col(ResearchJob.interaction_id).in_(interaction_ids),
+            col(ResearchJob.lease_owner) == lease_owner,
+        )
+        .values(lease_expires_at=lease_expires_at)
+    )
+    session.execute(statement)
+    session.commit()
+
+
+def release_research_job_leases(*, session: Session, lease_owner: str) -> None:
+    statement = (
+        update(ResearchJob)
+        .where(col(ResearchJob.lease_owner) == lease_owner)
+        .values(lease_owner=None, lease_expires_at=None)
+    )
+    session.execute(statement)
+    session.commit()
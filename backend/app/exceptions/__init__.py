@@ -4,6 +4,7 @@ This package contains custom exception classes and error codes for handling
 errors from external API integrations in a structured way.
 """
 
+from app.exceptions.admission import AdmissionError, AdmissionErrorCode
 from app.exceptions.gemini import GeminiAPIError, GeminiErrorCode
 from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
 
@@ -14,4 +15,7 @@ __all__ = [
     # Gemini
     "GeminiAPIError",
     "GeminiErrorCode",
+    # Admission control
+    "AdmissionError",
+    "AdmissionErrorCode",
 ]
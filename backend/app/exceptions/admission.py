@@ -0,0 +1,155 @@
+"""Custom exceptions for admission control of upstream API calls.
+
+This module defines the exception raised when a request is turned away
+before it reaches an upstream provider because a local limit is exhausted.
+Every AdmissionError maps to 429 Too Many Requests and carries the number
+of seconds after which the client should retry, which the exception handler
+sends as the Retry-After header.
+
+Usage:
+    from app.exceptions.admission import AdmissionError
+
+    raise AdmissionError.concurrency_limit_exceeded(
+        provider="perplexity", scope="user", retry_after=5
+    )
+"""
+
+from enum import StrEnum
+from typing import Any
+
+
+class AdmissionErrorCode(StrEnum):
+    """Error codes for admission control errors.
+
+    Attributes:
+        CONCURRENCY_LIMIT_EXCEEDED: Too many requests to a provider are
+            already in flight, for this user or for everyone.
+        JOB_LIMIT_EXCEEDED: The user already has as many unfinished
+            background research jobs with a provider as allowed.
+        RATE_LIMIT_EXCEEDED: The local token bucket modelling a provider's
+            quota has no token available soon enough.
+    """
+
+    CONCURRENCY_LIMIT_EXCEEDED = "concurrency_limit_exceeded"
+    JOB_LIMIT_EXCEEDED = "job_limit_exceeded"
+    RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
+
+
+class AdmissionError(Exception):
+    """Exception raised when a request is not admitted to an upstream provider.
+
+    Attributes:
+        status_code: HTTP status code for the error response (always 429).
+        error_code: Machine-readable error code from AdmissionErrorCode.
+        message: Human-readable error message.
+        retry_after: Seconds after which the client should retry.
+        details: Optional additional error details.
+    """
+
+    def __init__(
+        self,
+        error_code: AdmissionErrorCode,
+        message: str,
+        retry_after: int,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize AdmissionError.
+
+        Args:
+            error_code: Machine-readable error code from AdmissionErrorCode.
+            message: Human-readable error message.
+            retry_after: Seconds after which the client should retry.
+            details: Optional additional error details.
+        """
+        super().__init__(message)
+        self.status_code = 429
+        self.error_code = error_code
+        self.message = message
+        self.retry_after = retry_after
+        self.details = details
+
+    @classmethod
+    def concurrency_limit_exceeded(
+        cls,
+        provider: str,
+        scope: str,
+        retry_after: int,
+    ) -> "AdmissionError":
+        """Create a concurrency limit exceeded error.
+
+        Args:
+            provider: Upstream provider whose limit is exhausted.
+            scope: Which limit is exhausted, "user" or "provider".
+            retry_after: Seconds after which the client should retry.
+
+        Returns:
+            AdmissionError configured for an exhausted concurrency limit.
+        """
+        name = provider.capitalize()
+        if scope == "user":
+            message = (
+                f"Too many concurrent {name} requests for this user. "
+                "Wait for running requests to finish and try again."
+            )
+        else:
+            message = f"The {name} integration is at capacity. Please try again later."
+        return cls(
+            error_code=AdmissionErrorCode.CONCURRENCY_LIMIT_EXCEEDED,
+            message=message,
+            retry_after=retry_after,
+            details={"provider": provider, "scope": scope},
+        )
+
+    @classmethod
+    def job_limit_exceeded(
+        cls,
+        provider: str,
+        limit: int,
+        retry_after: int,
+    ) -> "AdmissionError":
+        """Create an active job limit exceeded error.
+
+        Args:
+            provider: Provider the background jobs run against.
+            limit: Unfinished jobs allowed per user.
+            retry_after: Seconds after which the client should retry.
+
+        Returns:
+            AdmissionError configured for an exhausted per-user job limit.
+        """
+        return cls(
+            error_code=AdmissionErrorCode.JOB_LIMIT_EXCEEDED,
+            message=(
+                f"This user already has {limit} unfinished {provider.capitalize()} "
+                "research jobs. Wait for one to finish and try again."
+            ),
+            retry_after=retry_after,
+            details={"provider": provider, "limit": limit},
+        )
+
+    @classmethod
+    def rate_limit_exceeded(
+        cls,
+        provider: str,
+        endpoint: str,
+        retry_after: int,
+    ) -> "AdmissionError":
+        """Create a rate limit exceeded error.
+
+        Args:
+            provider: Upstream provider whose quota is exhausted.
+            endpoint: Endpoint type or model tier of the exhausted bucket.
+            retry_after: Seconds after which the client should retry.
+
+        Returns:
+            AdmissionError configured for an exhausted rate limit.
+        """
+        return cls(
+            error_code=AdmissionErrorCode.RATE_LIMIT_EXCEEDED,
+            message=(
+                f"The {provider.capitalize()} {endpoint} rate limit is exhausted. "
+                "Please try again later."
+            ),
+            retry_after=max(1, retry_after),
+            details={"provider": provider, "endpoint": endpoint},
+        )
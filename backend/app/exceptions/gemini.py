@@ -41,6 +41,7 @@ class GeminiErrorCode(StrEnum):
         INTERACTION_NOT_FOUND: Requested interaction ID does not exist.
         MAX_POLLS_EXCEEDED: Maximum polling attempts reached.
         POLLING_TIMEOUT: Total polling duration exceeded limit.
+        SERVICE_UNAVAILABLE: Gemini API is failing and calls are short-circuited.
         GEMINI_API_ERROR: Unexpected error from Gemini API.
     """
 
@@ -52,6 +53,7 @@ class GeminiErrorCode(StrEnum):
     INTERACTION_NOT_FOUND = "interaction_not_found"
     MAX_POLLS_EXCEEDED = "max_polls_exceeded"
     POLLING_TIMEOUT = "polling_timeout"
+    SERVICE_UNAVAILABLE = "service_unavailable"
     GEMINI_API_ERROR = "gemini_api_error"
 
 
@@ -282,6 +284,28 @@ class GeminiAPIError(Exception):
             details=details,
         )
 
+    @classmethod
+    def service_unavailable(
+        cls,
+        message: str = "The Gemini API is currently unavailable. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "GeminiAPIError":
+        """Create a service unavailable error for an open circuit breaker.
+
+        Args:
+            message: Custom error message. Defaults to standard unavailable message.
+            details: Optional additional error details, e.g. retry_after.
+
+        Returns:
+            GeminiAPIError configured for an unavailable upstream (503).
+        """
+        return cls(
+            status_code=503,
+            error_code=GeminiErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            details=details,
+        )
+
     @classmethod
     def api_error(
         cls,
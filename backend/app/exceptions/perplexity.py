@@ -34,6 +34,9 @@ class PerplexityErrorCode(StrEnum):
         REQUEST_TIMEOUT: Request timed out waiting for response.
         INVALID_REQUEST: Request parameters are invalid.
         CONTENT_FILTER: Content was filtered due to policy violation.
+        JOB_NOT_FOUND: Requested research job ID does not exist.
+        JOB_QUEUE_FULL: Too many research jobs are already waiting to run.
+        SERVICE_UNAVAILABLE: Perplexity API is failing and calls are short-circuited.
         PERPLEXITY_API_ERROR: Unexpected error from Perplexity API.
     """
 
@@ -42,6 +45,9 @@ class PerplexityErrorCode(StrEnum):
     REQUEST_TIMEOUT = "request_timeout"
     INVALID_REQUEST = "invalid_request"
     CONTENT_FILTER = "content_filter"
+    JOB_NOT_FOUND = "job_not_found"
+    JOB_QUEUE_FULL = "job_queue_full"
+    SERVICE_UNAVAILABLE = "service_unavailable"
     PERPLEXITY_API_ERROR = "perplexity_api_error"
 
 
@@ -190,6 +196,72 @@ class PerplexityAPIError(Exception):
             details=details,
         )
 
+    @classmethod
+    def job_not_found(
+        cls,
+        message: str = "Research job not found. The job ID may be invalid or expired.",
+        details: dict[str, Any] | None = None,
+    ) -> "PerplexityAPIError":
+        """Create a job not found error.
+
+        Args:
+            message: Custom error message. Defaults to standard not found message.
+            details: Optional additional error details.
+
+        Returns:
+            PerplexityAPIError configured for job not found (404).
+        """
+        return cls(
+            status_code=404,
+            error_code=PerplexityErrorCode.JOB_NOT_FOUND,
+            message=message,
+            details=details,
+        )
+
+    @classmethod
+    def job_queue_full(
+        cls,
+        message: str = "Too many research jobs are queued. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "PerplexityAPIError":
+        """Create a job queue full error.
+
+        Args:
+            message: Custom error message. Defaults to standard queue full message.
+            details: Optional additional error details.
+
+        Returns:
+            PerplexityAPIError configured for a full job queue (503).
+        """
+        return cls(
+            status_code=503,
+            error_code=PerplexityErrorCode.JOB_QUEUE_FULL,
+            message=message,
+            details=details,
+        )
+
+    @classmethod
+    def service_unavailable(
+        cls,
+        message: str = "The Perplexity API is currently unavailable. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "PerplexityAPIError":
+        """Create a service unavailable error for an open circuit breaker.
+
+        Args:
+            message: Custom error message. Defaults to standard unavailable message.
+            details: Optional additional error details, e.g. retry_after.
+
+        Returns:
+            PerplexityAPIError configured for an unavailable upstream (503).
+        """
+        return cls(
+            status_code=503,
+            error_code=PerplexityErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            details=details,
+        )
+
     @classmethod
     def api_error(
         cls,
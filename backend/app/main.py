@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -5,11 +8,22 @@ from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.admission import create_concurrency_limiter
 from app.core.config import settings
+from app.core.db import async_engine, engine
+from app.core.deadline import DeadlineMiddleware
 from app.core.exceptions import TavilyAPIError
+from app.core.ratelimit import create_rate_limiter
+from app.core.security import shutdown_password_executor
+from app.exceptions.admission import AdmissionError
 from app.exceptions.gemini import GeminiAPIError
 from app.exceptions.perplexity import PerplexityAPIError
 from app.schemas.tavily import ErrorResponse
+from app.services.gemini import create_gemini_client
+from app.services.gemini_jobs import GeminiJobSupervisor
+from app.services.perplexity import create_perplexity_client
+from app.services.perplexity_jobs import PerplexityJobManager
+from app.services.tavily import TavilyService
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -19,12 +33,58 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage app-scoped upstream clients and background job runners.
+
+    On startup, creates the shared TavilyService, the pooled Perplexity and
+    Gemini httpx clients, the admission control and rate limiters, the
+    Perplexity job manager and the Gemini job supervisor. Both job runners
+    then claim the research jobs whose lease expired. On shutdown, closes
+    all of them, the password hashing process pool and the async database
+    engine's connections.
+    """
+    app.state.concurrency_limiter = create_concurrency_limiter()
+    app.state.rate_limiter = create_rate_limiter()
+    app.state.tavily_service = TavilyService(rate_limiter=app.state.rate_limiter)
+    app.state.perplexity_client = create_perplexity_client()
+    app.state.gemini_client = create_gemini_client()
+    app.state.perplexity_jobs = PerplexityJobManager(
+        client=app.state.perplexity_client,
+        engine=engine,
+        rate_limiter=app.state.rate_limiter,
+    )
+    await app.state.perplexity_jobs.resume()
+    app.state.gemini_supervisor = GeminiJobSupervisor(
+        client=app.state.gemini_client,
+        engine=engine,
+        rate_limiter=app.state.rate_limiter,
+    )
+    await app.state.gemini_supervisor.resume()
+    try:
+        yield
+    finally:
+        await app.state.gemini_supervisor.aclose()
+        await app.state.gemini_client.aclose()
+        await app.state.perplexity_jobs.aclose()
+        await app.state.perplexity_client.aclose()
+        await app.state.tavily_service.aclose()
+        await app.state.rate_limiter.aclose()
+        shutdown_password_executor()
+        await async_engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
+# Cap upstream time by the client's X-Request-Timeout header, if sent
+app.add_middleware(DeadlineMiddleware)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -117,4 +177,32 @@ async def gemini_exception_handler(
     )
 
 
+@app.exception_handler(AdmissionError)
+async def admission_exception_handler(
+    _request: Request,
+    exc: AdmissionError,
+) -> JSONResponse:
+    """Handle AdmissionError exceptions.
+
+    Converts AdmissionError to a 429 JSON error response whose Retry-After
+    header tells clients when to try again.
+
+    Args:
+        _request: The incoming request that caused the exception (unused).
+        exc: The AdmissionError that was raised.
+
+    Returns:
+        JSONResponse with ErrorResponse body, 429 status and Retry-After.
+    """
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=ErrorResponse(
+            error_code=exc.error_code,
+            message=exc.message,
+            details=exc.details,
+        ).model_dump(),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
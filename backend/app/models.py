@@ -1,14 +1,19 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Literal
 
 from pydantic import EmailStr
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import JSON, DateTime, Index, String, Text, text
 from sqlmodel import Field, Relationship, SQLModel
 
 # Content type for Tavily results and deep research - validated at Pydantic level, stored as string in DB
 ContentType = Literal["search", "extract", "crawl", "map", "perplexity", "gemini"]
 
 
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 # Shared properties
 class UserBase(SQLModel):
     email: EmailStr = Field(unique=True, index=True, max_length=255)
@@ -82,24 +87,100 @@ class ItemUpdate(ItemBase):
     title: str | None = Field(default=None, min_length=1, max_length=255)  # type: ignore
 
 
+# Deep research results are saved rarely, so listing them across all owners
+# would walk most of ix_item_created_at_id without an index of their own
+RARE_ITEM_CONTENT_TYPES = ("perplexity", "gemini")
+
+
 # Database model, database table inferred from class name
 class Item(ItemBase, table=True):
+    __table_args__ = (
+        # Lists of a user's items, newest first; also serves the owner FK
+        Index("ix_item_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        # The same lists filtered by content type
+        Index(
+            "ix_item_owner_id_content_type_created_at_id",
+            "owner_id",
+            "content_type",
+            "created_at",
+            "id",
+        ),
+        # Superuser lists across all owners
+        Index("ix_item_created_at_id", "created_at", "id"),
+        *(
+            Index(
+                f"ix_item_{content_type}_created_at_id",
+                "created_at",
+                "id",
+                postgresql_where=text(f"content_type = '{content_type}'"),
+            )
+            for content_type in RARE_ITEM_CONTENT_TYPES
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     owner_id: uuid.UUID = Field(
         foreign_key="user.id", nullable=False, ondelete="CASCADE"
     )
     owner: User | None = Relationship(back_populates="items")
+    created_at: datetime = Field(
+        default_factory=utc_now,
+        sa_type=DateTime(timezone=True),
+    )
+    updated_at: datetime = Field(
+        default_factory=utc_now,
+        sa_type=DateTime(timezone=True),
+    )
 
 
 # Properties to return via API, id is always required
 class ItemPublic(ItemBase):
     id: uuid.UUID
     owner_id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
 
 
 class ItemsPublic(SQLModel):
     data: list[ItemPublic]
-    count: int
+    # None when the count was not requested (cursor pagination)
+    count: int | None = None
+    # Opaque cursors of the neighbouring pages, None at either end
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+# Research providers whose long-running jobs are tracked in the database
+ResearchProvider = Literal["gemini", "perplexity"]
+
+
+# Database model for long-running deep research jobs, so they survive restarts
+class ResearchJob(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    provider: ResearchProvider = Field(default="gemini", sa_type=String(50))
+    interaction_id: str = Field(unique=True, index=True, max_length=255)
+    owner_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+    )
+    request: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    status: str = Field(index=True, max_length=50)
+    last_event_id: str | None = Field(default=None, max_length=255)
+    result: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    error_message: str | None = Field(default=None, sa_type=Text)
+    created_at: datetime = Field(
+        default_factory=utc_now,
+        sa_type=DateTime(timezone=True),
+    )
+    updated_at: datetime = Field(
+        default_factory=utc_now,
+        sa_type=DateTime(timezone=True),
+    )
+    # Worker process currently running the job and until when its claim holds
+    lease_owner: str | None = Field(default=None, max_length=255)
+    lease_expires_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+    )
 
 
 # Generic message
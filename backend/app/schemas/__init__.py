@@ -23,9 +23,12 @@ from app.schemas.perplexity import (
     # Nested Result Models
     PerplexityChoice,
     # Request Schemas
+    PerplexityDeepResearchJobResponse,
+    PerplexityDeepResearchJobResultResponse,
     PerplexityDeepResearchRequest,
     # Response Schemas
     PerplexityDeepResearchResponse,
+    PerplexityJobStatus,
     PerplexityMessage,
     # Enums
     PerplexityReasoningEffort,
@@ -33,11 +36,15 @@ from app.schemas.perplexity import (
     PerplexitySearchContextSize,
     PerplexitySearchMode,
     PerplexitySearchResult,
+    PerplexityStreamEventType,
     PerplexityUsage,
     PerplexityVideo,
 )
 from app.schemas.tavily import (
     # Request Schemas
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchResult,
     CrawlRequest,
     # Response Schemas
     CrawlResponse,
@@ -71,16 +78,21 @@ __all__ = [
     "ExtractRequest",
     "CrawlRequest",
     "MapRequest",
+    "BatchSearchRequest",
     # Tavily Response Schemas
     "SearchResponse",
     "ExtractResponse",
     "CrawlResponse",
     "MapResponse",
+    "BatchSearchResult",
+    "BatchSearchResponse",
     # Perplexity Enums
     "PerplexitySearchMode",
     "PerplexityReasoningEffort",
     "PerplexitySearchContextSize",
     "PerplexityRecencyFilter",
+    "PerplexityStreamEventType",
+    "PerplexityJobStatus",
     # Perplexity Nested Result Models
     "PerplexitySearchResult",
     "PerplexityVideo",
@@ -91,6 +103,8 @@ __all__ = [
     "PerplexityDeepResearchRequest",
     # Perplexity Response Schemas
     "PerplexityDeepResearchResponse",
+    "PerplexityDeepResearchJobResponse",
+    "PerplexityDeepResearchJobResultResponse",
     # Gemini Enums
     "GeminiInteractionStatus",
     "GeminiStreamEventType",
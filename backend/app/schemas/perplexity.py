@@ -6,18 +6,23 @@ request validation, response serialization, and OpenAPI documentation generation
 for the FastAPI routes.
 
 Schema Organization:
-    1. Enums - SearchMode, ReasoningEffort, SearchContextSize, RecencyFilter
+    1. Enums - SearchMode, ReasoningEffort, SearchContextSize, RecencyFilter,
+       StreamEventType, JobStatus
     2. Nested Result Models - SearchResult, Video, Usage, Choice, Message
     3. Request Models - PerplexityDeepResearchRequest
-    4. Response Models - PerplexityDeepResearchResponse
+    4. Response Models - PerplexityDeepResearchResponse,
+       PerplexityDeepResearchJobResponse, PerplexityDeepResearchJobResultResponse
 """
 
 import re
+from datetime import datetime
 from enum import StrEnum
 from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.schemas.tavily import ErrorResponse
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -91,6 +96,38 @@ class PerplexityRecencyFilter(StrEnum):
     MONTH = "month"
 
 
+class PerplexityStreamEventType(StrEnum):
+    """Server-sent event types relayed by the deep research stream endpoint.
+
+    Attributes:
+        TOKEN: Incremental content fragment of the answer.
+        CITATIONS: Updated citations and search results.
+        DONE: Final accumulated PerplexityDeepResearchResponse.
+        ERROR: Error raised after the stream started.
+    """
+
+    TOKEN = "token"
+    CITATIONS = "citations"
+    DONE = "done"
+    ERROR = "error"
+
+
+class PerplexityJobStatus(StrEnum):
+    """Status states for background Perplexity deep research jobs.
+
+    Attributes:
+        PENDING: Job queued and waiting for a worker.
+        IN_PROGRESS: A worker is running the research query.
+        COMPLETED: Job finished successfully with a result available.
+        FAILED: The research query failed; see the job error.
+    """
+
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 # =============================================================================
 # Nested Result Models
 # =============================================================================
@@ -418,3 +455,42 @@ class PerplexityDeepResearchResponse(BaseModel):
         default=None,
         description="Token usage information",
     )
+
+
+class PerplexityDeepResearchJobResponse(BaseModel):
+    """Response schema for background deep research job creation.
+
+    Returned immediately after queueing a deep research request. Contains
+    the job ID needed to retrieve the result.
+    """
+
+    job_id: str = Field(
+        description="Unique identifier for this research job",
+    )
+    status: PerplexityJobStatus = Field(
+        default=PerplexityJobStatus.PENDING,
+        description="Current status of the job (typically pending)",
+    )
+    created_at: datetime = Field(
+        description="Timestamp when the job was created",
+    )
+
+
+class PerplexityDeepResearchJobResultResponse(PerplexityDeepResearchJobResponse):
+    """Response schema for background deep research job retrieval.
+
+    When status is COMPLETED, result is populated; when FAILED, error is.
+    """
+
+    result: PerplexityDeepResearchResponse | None = Field(
+        default=None,
+        description="Research result once the job has completed",
+    )
+    error: ErrorResponse | None = Field(
+        default=None,
+        description="Error details if the job failed",
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        description="Timestamp when the job finished",
+    )
@@ -8,8 +8,10 @@ and OpenAPI documentation generation for the FastAPI routes.
 Schema Organization:
     1. Enums - SearchDepth, SearchTopic
     2. Nested Result Models - SearchResult, ExtractResult, CrawlResult
-    3. Request Models - SearchRequest, ExtractRequest, CrawlRequest, MapRequest
-    4. Response Models - SearchResponse, ExtractResponse, CrawlResponse, MapResponse
+    3. Request Models - SearchRequest, ExtractRequest, CrawlRequest, MapRequest,
+       BatchSearchRequest
+    4. Response Models - SearchResponse, ExtractResponse, CrawlResponse, MapResponse,
+       BatchSearchResult, BatchSearchResponse
 """
 
 from enum import StrEnum
@@ -332,6 +334,27 @@ class MapRequest(BaseModel):
         return v
 
 
+class BatchSearchRequest(BaseModel):
+    """Request schema for running several Tavily searches in one call.
+
+    Each entry is validated exactly like a standalone search request. The
+    searches run concurrently and results are returned in request order, or
+    streamed as NDJSON lines in completion order when stream is True.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    searches: list[SearchRequest] = Field(
+        min_length=1,
+        max_length=50,
+        description="Search requests to run concurrently (1-50)",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream each result as an NDJSON line as soon as it completes",
+    )
+
+
 # =============================================================================
 # Response Schemas
 # =============================================================================
@@ -479,6 +502,43 @@ class MapResponse(BaseModel):
         return data
 
 
+class BatchSearchResult(BaseModel):
+    """Outcome of a single search within a batch.
+
+    Exactly one of response or error is set.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    index: int = Field(description="Position of the search in the batch request")
+    response: SearchResponse | None = Field(
+        default=None,
+        description="Search response if the search succeeded",
+    )
+    error: "ErrorResponse | None" = Field(
+        default=None,
+        description="Error details if the search failed",
+    )
+    cache_status: str | None = Field(
+        default=None,
+        description="Response cache outcome (HIT, MISS or BYPASS)",
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """Response schema for a batch of Tavily searches.
+
+    Results are listed in the same order as the requested searches.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    results: list[BatchSearchResult] = Field(
+        default_factory=list,
+        description="Per-search results or errors, in request order",
+    )
+
+
 # =============================================================================
 # Error Response Schema
 # =============================================================================
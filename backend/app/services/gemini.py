@@ -9,20 +9,44 @@ Research jobs can run for extended periods (typically 20 minutes, up to 60 minut
 The service handles authentication via x-goog-api-key headers, request payload
 construction with agent configuration, and error mapping to typed exceptions.
 
+The httpx client is created once by the application lifespan (see
+create_gemini_client) and injected into each GeminiService, so repeated
+polls of the same job reuse pooled connections instead of new TLS handshakes.
+
+Waiting for a job follows an adaptive poll policy (see app.core.polling and
+create_gemini_poll_policy): fast polls while the job reports new events,
+backing off while it is quiet, bounded by a wall-clock deadline. The number
+of polls each job needed is recorded in the gemini.polls_per_job metric.
+
 Usage:
-    from app.services.gemini import GeminiService
+    from app.services.gemini import GeminiService, create_gemini_client
 
-    service = GeminiService()
+    client = create_gemini_client()
+    service = GeminiService(client=client)
     job = await service.start_research(request)
     result = await service.wait_for_completion(job.interaction_id)
 """
 
 import asyncio
+import time
 from typing import Any
 
 import httpx
 
-from app.core.config import settings
+from app.core.circuit_breaker import CircuitOpenError, circuit_breakers
+from app.core.config import GeminiPollBackoff, settings
+from app.core.deadline import operation_timeout
+from app.core.http_utils import create_pooled_client
+from app.core.metrics import metrics
+from app.core.polling import (
+    BackoffPollPolicy,
+    ExponentialPollPolicy,
+    FibonacciPollPolicy,
+    PollPolicy,
+)
+from app.core.ratelimit import RateLimiter
+from app.core.retry import create_retry_policy
+from app.exceptions.admission import AdmissionError
 from app.exceptions.gemini import GeminiAPIError
 from app.schemas.gemini import (
     GeminiDeepResearchJobResponse,
@@ -32,6 +56,43 @@ from app.schemas.gemini import (
 )
 
 
+def create_gemini_client() -> httpx.AsyncClient:
+    """Create the pooled httpx client used for Gemini API requests.
+
+    Pool limits and the default timeout come from settings.gemini.
+    The caller owns the client and must close it with ``aclose()``.
+
+    Returns:
+        Configured httpx.AsyncClient instance.
+    """
+    gemini_settings = settings.gemini
+    return create_pooled_client(
+        timeout_seconds=gemini_settings.timeout,
+        max_connections=gemini_settings.max_connections,
+        max_keepalive_connections=gemini_settings.max_keepalive_connections,
+        keepalive_expiry=gemini_settings.keepalive_expiry,
+    )
+
+
+def create_gemini_poll_policy() -> BackoffPollPolicy:
+    """Create a poll policy for one Gemini job from settings.gemini.
+
+    Returns:
+        A fresh exponential or Fibonacci backoff policy, per poll_backoff.
+    """
+    gemini_settings = settings.gemini
+    policy_class: type[BackoffPollPolicy] = (
+        FibonacciPollPolicy
+        if gemini_settings.poll_backoff == GeminiPollBackoff.FIBONACCI
+        else ExponentialPollPolicy
+    )
+    return policy_class(
+        min_interval=gemini_settings.min_poll_interval,
+        max_interval=gemini_settings.max_poll_interval,
+        jitter=gemini_settings.poll_jitter,
+    )
+
+
 class GeminiService:
     """Service layer for Google Gemini Deep Research API operations.
 
@@ -43,27 +104,43 @@ class GeminiService:
     - x-goog-api-key header authentication
     - Request payload formatting with agent_config structure
     - Response parsing for job creation and polling
-    - Polling loop with configurable interval and max attempts
+    - Polling loop with an adaptive poll policy and a wall-clock deadline
+    - Per-operation connect/read/pool timeouts, capped by the request deadline
     - Error mapping from HTTP status codes to typed exceptions
 
     Attributes:
         BASE_URL: The Gemini API v1beta base URL.
+        _client: Pooled httpx.AsyncClient used for all requests.
+        _owns_client: Whether aclose() should close _client.
         _api_key: The API key for authentication.
-        _timeout: Request timeout in seconds.
-        _poll_interval: Polling interval in seconds.
-        _max_poll_attempts: Maximum number of polling attempts.
+        _timeout: Request timeout in seconds for operations without an entry
+            in _timeouts.
+        _timeouts: Connect, read and pool timeouts by operation.
+        _poll_deadline: Maximum time to wait for a job, in seconds.
+        _rate_limiter: Client-side limiter for the Gemini quota, or None.
+        _retry: Retry policy for poll and cancel calls.
     """
 
     BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize GeminiService with configuration from settings.
 
         Reads configuration from settings.gemini:
         - api_key: Optional Gemini API key
         - timeout: Request timeout in seconds (default: 120)
-        - poll_interval: Polling interval in seconds (default: 10)
-        - max_poll_attempts: Maximum polling attempts (default: 360)
+        - timeouts: Connect, read and pool timeouts by operation
+        - poll_deadline: Maximum time to wait for a job (default: 3600)
+
+        Args:
+            client: Shared pooled httpx client. When omitted, the service
+                creates its own client and closes it in aclose().
+            rate_limiter: Optional limiter consulted before each API call
+                with the call type ("start", "poll", "cancel").
 
         Raises:
             GeminiAPIError: If API key is not configured.
@@ -77,8 +154,25 @@ class GeminiService:
 
         self._api_key: str = gemini_settings.api_key
         self._timeout: int = gemini_settings.timeout
-        self._poll_interval: int = gemini_settings.poll_interval
-        self._max_poll_attempts: int = gemini_settings.max_poll_attempts
+        self._timeouts = gemini_settings.timeouts
+        self._poll_deadline: float = gemini_settings.poll_deadline
+
+        self._owns_client: bool = client is None
+        self._client: httpx.AsyncClient = client or create_gemini_client()
+        self._rate_limiter: RateLimiter | None = rate_limiter
+        # Polls and cancels are idempotent; start_research is never retried
+        # since a repeated POST would start a second billed job
+        self._retry = create_retry_policy("gemini")
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by this service."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _throttle(self, call: str) -> None:
+        """Take a rate limit token for one API call of the given type."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire("gemini", call)
 
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for Gemini API requests.
@@ -258,37 +352,44 @@ class GeminiService:
             GeminiDeepResearchJobResponse with interaction_id and initial status.
 
         Raises:
-            GeminiAPIError: If the API request fails for any reason.
+            GeminiAPIError: If the API request fails for any reason, or with
+                503 while the Gemini circuit breaker is open.
+            AdmissionError: If the call type's rate limit has no token available.
         """
         headers = self._build_headers()
         payload = self._build_payload(request)
         url = f"{self.BASE_URL}/interactions"
+        await self._throttle("start")
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.post(
+            response = await circuit_breakers["gemini"].call(
+                lambda: self._client.post(
                     url,
                     headers=headers,
                     json=payload,
+                    timeout=operation_timeout(self._timeouts, "start", self._timeout),
                 )
+            )
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                )
 
-                response_data = response.json()
-                return self._parse_job_response(response_data)
+            response_data = response.json()
+            return self._parse_job_response(response_data)
 
         except GeminiAPIError:
             # Re-raise our own exceptions
             raise
+        except CircuitOpenError as exc:
+            raise GeminiAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Request timed out after {self._timeout} seconds.",
+                message="Request to Gemini API timed out.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
@@ -321,7 +422,9 @@ class GeminiService:
             GeminiDeepResearchResultResponse with current status and outputs.
 
         Raises:
-            GeminiAPIError: If the API request fails for any reason.
+            GeminiAPIError: If the API request fails for any reason, or with
+                503 while the Gemini circuit breaker is open.
+            AdmissionError: If the call type's rate limit has no token available.
         """
         headers = self._build_headers()
         url = f"{self.BASE_URL}/interactions/{interaction_id}"
@@ -331,31 +434,39 @@ class GeminiService:
         if last_event_id:
             params["last_event_id"] = last_event_id
 
+        async def attempt() -> httpx.Response:
+            await self._throttle("poll")
+            return await self._client.get(
+                url,
+                headers=headers,
+                params=params if params else None,
+                timeout=operation_timeout(self._timeouts, "poll", self._timeout),
+            )
+
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    params=params if params else None,
-                )
+            response = await circuit_breakers["gemini"].call(
+                lambda: self._retry.call("poll", attempt)
+            )
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                )
 
-                response_data = response.json()
-                return self._parse_poll_response(response_data)
+            response_data = response.json()
+            return self._parse_poll_response(response_data)
 
-        except GeminiAPIError:
+        except (GeminiAPIError, AdmissionError):
             # Re-raise our own exceptions
             raise
+        except CircuitOpenError as exc:
+            raise GeminiAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Poll request timed out after {self._timeout} seconds.",
+                message="Poll request to Gemini API timed out.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
@@ -372,72 +483,83 @@ class GeminiService:
     async def wait_for_completion(
         self,
         interaction_id: str,
-        poll_interval: int | None = None,
-        max_attempts: int | None = None,
+        policy: PollPolicy | None = None,
+        deadline: float | None = None,
     ) -> GeminiDeepResearchResultResponse:
         """Wait for a deep research job to complete.
 
-        Polls the job status at regular intervals until a terminal status
-        is reached (completed, failed, or cancelled) or the maximum number
-        of polling attempts is exceeded.
+        Polls the job status until a terminal status is reached (completed,
+        failed, or cancelled) or the deadline passes. The wait between polls
+        comes from the poll policy, which is told whether each poll brought
+        a new event_id so it can return to fast polling.
 
         Args:
             interaction_id: The interaction ID from job creation.
-            poll_interval: Optional override for polling interval in seconds.
-            max_attempts: Optional override for maximum polling attempts.
+            policy: Optional poll policy; defaults to a fresh policy from
+                create_gemini_poll_policy().
+            deadline: Optional override for the wall-clock limit in seconds.
 
         Returns:
             GeminiDeepResearchResultResponse with final status and results.
 
         Raises:
-            GeminiAPIError: If polling fails, max attempts exceeded, or job failed.
+            GeminiAPIError: If polling fails, the deadline passes, or the
+                job failed or was cancelled.
         """
-        interval = poll_interval or self._poll_interval
-        attempts = max_attempts or self._max_poll_attempts
+        poll_policy = policy or create_gemini_poll_policy()
+        limit = deadline or self._poll_deadline
+        started_at = time.monotonic()
 
         last_event_id: str | None = None
+        polls = 0
+        outcome = "error"
 
-        for _attempt in range(attempts):
-            result = await self.poll_research(
-                interaction_id=interaction_id,
-                last_event_id=last_event_id,
-            )
-
-            # Update last_event_id for potential reconnection
-            if result.event_id:
-                last_event_id = result.event_id
-
-            # Check for terminal status
-            if self._is_terminal_status(result.status):
-                # Handle failure status
-                if result.status == GeminiInteractionStatus.FAILED:
-                    raise GeminiAPIError.research_failed(
-                        message=result.error_message or "Deep research job failed.",
-                        details={"interaction_id": interaction_id},
-                    )
-
-                # Handle cancelled status
-                if result.status == GeminiInteractionStatus.CANCELLED:
-                    raise GeminiAPIError.api_error(
-                        message="Deep research job was cancelled.",
-                        details={"interaction_id": interaction_id},
+        try:
+            while True:
+                result = await self.poll_research(
+                    interaction_id=interaction_id,
+                    last_event_id=last_event_id,
+                )
+                polls += 1
+
+                # Update last_event_id for potential reconnection
+                new_event = bool(result.event_id) and result.event_id != last_event_id
+                if result.event_id:
+                    last_event_id = result.event_id
+
+                # Check for terminal status
+                if self._is_terminal_status(result.status):
+                    outcome = result.status.value
+
+                    # Handle failure status
+                    if result.status == GeminiInteractionStatus.FAILED:
+                        raise GeminiAPIError.research_failed(
+                            message=result.error_message or "Deep research job failed.",
+                            details={"interaction_id": interaction_id},
+                        )
+
+                    # Handle cancelled status
+                    if result.status == GeminiInteractionStatus.CANCELLED:
+                        raise GeminiAPIError.api_error(
+                            message="Deep research job was cancelled.",
+                            details={"interaction_id": interaction_id},
+                        )
+
+                    # Return completed result
+                    return result
+
+                # Wait before next poll, without sleeping past the deadline
+                remaining = limit - (time.monotonic() - started_at)
+                if remaining <= 0:
+                    outcome = "timeout"
+                    raise GeminiAPIError.polling_timeout(
+                        message=f"Research job did not finish within {limit:.0f} seconds.",
+                        details={"interaction_id": interaction_id, "polls": polls},
                     )
-
-                # Return completed result
-                return result
-
-            # Wait before next poll
-            await asyncio.sleep(interval)
-
-        # Max attempts exceeded
-        raise GeminiAPIError.max_polls_exceeded(
-            message=f"Maximum polling attempts ({attempts}) exceeded.",
-            details={
-                "interaction_id": interaction_id,
-                "attempts": attempts,
-                "poll_interval": interval,
-            },
-        )
+                interval = poll_policy.next_interval(new_event=new_event)
+                await asyncio.sleep(min(interval, remaining))
+        finally:
+            metrics.observe("gemini.polls_per_job", polls, outcome=outcome)
 
     async def cancel_research(
         self,
@@ -453,33 +575,43 @@ class GeminiService:
             interaction_id: The interaction ID of the job to cancel.
 
         Raises:
-            GeminiAPIError: If the cancellation request fails.
+            GeminiAPIError: If the cancellation request fails, or with 503
+                while the Gemini circuit breaker is open.
+            AdmissionError: If the cancel rate limit has no token available.
         """
         headers = self._build_headers()
         url = f"{self.BASE_URL}/interactions/{interaction_id}"
 
+        async def attempt() -> httpx.Response:
+            await self._throttle("cancel")
+            return await self._client.delete(
+                url,
+                headers=headers,
+                timeout=operation_timeout(self._timeouts, "cancel", self._timeout),
+            )
+
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.delete(
-                    url,
-                    headers=headers,
-                )
+            response = await circuit_breakers["gemini"].call(
+                lambda: self._retry.call("cancel", attempt)
+            )
 
-                # 204 No Content is expected on success
-                if response.status_code not in (200, 204):
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            # 204 No Content is expected on success
+            if response.status_code not in (200, 204):
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                )
 
-        except GeminiAPIError:
+        except (GeminiAPIError, AdmissionError):
             # Re-raise our own exceptions
             raise
+        except CircuitOpenError as exc:
+            raise GeminiAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Cancel request timed out after {self._timeout} seconds.",
+                message="Cancel request to Gemini API timed out.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
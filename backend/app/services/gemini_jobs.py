@@ -0,0 +1,893 @@
+"""Background supervision of Gemini deep research jobs.
+
+This module provides the GeminiJobSupervisor which owns polling of running
+Gemini interactions on the server side. Each interaction gets exactly one
+background poller no matter how many clients are watching it; clients read
+the last known state locally and are notified when it changes, instead of
+each client request turning into an upstream poll.
+
+The poller follows the same adaptive poll policy as
+GeminiService.wait_for_completion (see create_gemini_poll_policy): it starts
+at min_poll_interval, backs off up to max_poll_interval while nothing
+changes, drops back to the minimum whenever a new event_id arrives, and
+gives up after poll_deadline. Transient upstream errors (timeouts, rate
+limits, 5xx) are retried with the same backoff; errors that cannot resolve
+themselves (invalid key, unknown interaction) end the job. Polls per job are
+recorded in the gemini.polls_per_job metric.
+
+The supervisor is created once by the application lifespan and shares the
+app-scoped Gemini httpx client. When given a database engine it mirrors
+every job into the ResearchJob table (status, last_event_id and the final
+result), and resume() restarts polling for jobs that were still running
+when the process stopped, continuing from their stored last_event_id.
+
+Every uvicorn worker process runs its own supervisor against the same
+table, so only the supervisor holding a job's lease polls it upstream, in
+the same way as PerplexityJobManager: leases are renewed by a heartbeat,
+and resume() claims only jobs whose lease expired. A request for a job
+leased to another worker process follows the stored record instead of
+starting a second poller, and takes the job over if that lease expires.
+
+Each user may have at most max_active_jobs_per_user unfinished jobs. Routes
+reserve() a job slot before starting a new interaction upstream, then hand
+the reservation to track() once it started, or to release() if it did not.
+With a database engine a reservation is a placeholder ResearchJob record,
+so it counts against the limit in every worker process.
+
+Usage:
+    from app.services.gemini_jobs import GeminiJobSupervisor
+
+    supervisor = GeminiJobSupervisor(client=client, engine=engine)
+    await supervisor.resume()
+    reservation = await supervisor.reserve(user.id, request=body)
+    await supervisor.track(
+        interaction_id,
+        owner_id=user.id,
+        request=body,
+        status=status,
+        reservation=reservation,
+    )
+    status = await supervisor.get_status(interaction_id)
+    result = await supervisor.wait(interaction_id)
+    await supervisor.aclose()
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.deadline import clear_deadline
+from app.core.metrics import metrics
+from app.core.ratelimit import RateLimiter
+from app.exceptions.admission import AdmissionError
+from app.exceptions.gemini import GeminiAPIError, GeminiErrorCode
+from app.models import ResearchJob, utc_now
+from app.schemas.gemini import (
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
+from app.services.gemini import GeminiService, create_gemini_poll_policy
+
+logger = logging.getLogger(__name__)
+
+# Upstream errors that polling again cannot fix
+_FATAL_STATUS_CODES: frozenset[int] = frozenset({400, 401, 403, 404})
+
+# Interaction statuses after which no further polling is needed
+_TERMINAL_STATUSES: frozenset[GeminiInteractionStatus] = frozenset(
+    {
+        GeminiInteractionStatus.COMPLETED,
+        GeminiInteractionStatus.FAILED,
+        GeminiInteractionStatus.CANCELLED,
+    }
+)
+
+# Seconds a user over the active job limit is asked to wait before retrying
+_JOB_LIMIT_RETRY_AFTER = 60
+
+# Prefix of the placeholder interaction_id of a reserved job slot
+_RESERVATION_PREFIX = "reservation:"
+
+# What watchers receive: a poll result, or a transient error being retried
+GeminiJobUpdate = GeminiDeepResearchResultResponse | GeminiAPIError | AdmissionError
+
+
+def _record_result(db_job: ResearchJob) -> GeminiDeepResearchResultResponse:
+    """Rebuild the last known poll result from a stored job."""
+    if db_job.result is not None:
+        return GeminiDeepResearchResultResponse.model_validate(db_job.result)
+    return GeminiDeepResearchResultResponse(
+        status=GeminiInteractionStatus(db_job.status),
+        event_id=db_job.last_event_id,
+        error_message=db_job.error_message,
+    )
+
+
+def _outcome(job: "GeminiJob") -> str:
+    """Label a finished job for metrics: terminal status, timeout or error."""
+    if job.error is not None:
+        if job.error.error_code == GeminiErrorCode.POLLING_TIMEOUT:
+            return "timeout"
+        return "error"
+    return job.latest().status.value
+
+
+class GeminiJob:
+    """Locally tracked state of one supervised Gemini interaction.
+
+    Attributes:
+        interaction_id: The Gemini interaction being supervised.
+        owner_id: ID of the user who started the job, if it was tracked
+            by this process.
+        result: Last poll result received from upstream, if any.
+        error: Error that ended supervision, if any.
+        last_error: Transient error of the latest poll while it is being
+            retried; cleared by the next successful poll.
+        last_event_id: Most recent event_id seen, used for reconnection.
+        polls: Number of upstream polls made for this job.
+        updated_at: Monotonic time of the last state change.
+        first_update: Set once the first result or error is available.
+        done: Set once the job reached a terminal state or failed.
+        wake: Set to cut the current backoff sleep short.
+        task: Background poller task.
+    """
+
+    def __init__(self, interaction_id: str, last_event_id: str | None = None) -> None:
+        """Initialize an empty job record.
+
+        Args:
+            interaction_id: The Gemini interaction being supervised.
+            last_event_id: Event to continue from when resuming a stored job.
+        """
+        self.interaction_id = interaction_id
+        self.owner_id: uuid.UUID | None = None
+        self.result: GeminiDeepResearchResultResponse | None = None
+        self.error: GeminiAPIError | None = None
+        self.last_error: GeminiAPIError | AdmissionError | None = None
+        self.last_event_id = last_event_id
+        self.polls = 0
+        self.updated_at = time.monotonic()
+        self.first_update = asyncio.Event()
+        self.done = asyncio.Event()
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self._subscribers: set[asyncio.Queue[GeminiJobUpdate]] = set()
+
+    def subscribe(self) -> asyncio.Queue[GeminiJobUpdate]:
+        """Register a watcher queue that receives every result and report."""
+        queue: asyncio.Queue[GeminiJobUpdate] = asyncio.Queue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[GeminiJobUpdate]) -> None:
+        """Remove a watcher queue registered with subscribe()."""
+        self._subscribers.discard(queue)
+
+    def raise_error(self) -> None:
+        """Re-raise the error that ended supervision, if any."""
+        if self.error is not None:
+            raise self.error
+
+    def latest(self) -> GeminiDeepResearchResultResponse:
+        """Return the last poll result, or raise if none was received.
+
+        Without a result, the error that ended supervision is raised, else
+        the transient error the poller is currently retrying.
+        """
+        if self.result is None:
+            raise (
+                self.error
+                or self.last_error
+                or GeminiAPIError.api_error(
+                    message="No status is available yet for this research job.",
+                    details={"interaction_id": self.interaction_id},
+                )
+            )
+        return self.result
+
+    def publish(self, result: GeminiDeepResearchResultResponse) -> None:
+        """Record a new poll result and fan it out to all subscribers."""
+        self.result = result
+        self.last_error = None
+        if result.event_id:
+            self.last_event_id = result.event_id
+        self.updated_at = time.monotonic()
+        self.first_update.set()
+        for queue in self._subscribers:
+            queue.put_nowait(result)
+
+    def report(self, error: GeminiAPIError | AdmissionError) -> None:
+        """Record a transient poll error that the poller will retry.
+
+        Wakes readers still waiting for a first update, so they get the
+        error at once instead of waiting for polling to recover, and fans
+        the error out to all subscribers.
+        """
+        self.last_error = error
+        self.updated_at = time.monotonic()
+        self.first_update.set()
+        for queue in self._subscribers:
+            queue.put_nowait(error)
+
+    def fail(self, error: GeminiAPIError) -> None:
+        """End supervision with an error and wake every watcher."""
+        self.error = error
+        self.updated_at = time.monotonic()
+        self.first_update.set()
+        self.finish()
+
+    def finish(self) -> None:
+        """Mark the job as finished and wake every watcher."""
+        self.done.set()
+
+
+class GeminiJobSupervisor:
+    """Run one background poller per Gemini interaction and share its state.
+
+    Attributes:
+        _client: App-scoped httpx client used for upstream polls.
+        _engine: Database engine for persisting jobs, or None to keep
+            state in memory only.
+        _jobs: Supervised jobs keyed by interaction_id.
+        _reservations: Owners of the job slots reserved by reserve() and
+            not yet tracked or released, keyed by reservation.
+        _deadline: Maximum wall-clock supervision time per job, in seconds.
+        _retention: Seconds a finished job's state is kept for readers.
+        _rate_limiter: Client-side limiter for the Gemini quota, or None.
+        _lease_owner: Unique name of this supervisor in the lease_owner column.
+        _lease: Seconds a claim on a stored job lasts without a renewal.
+        _heartbeat_task: Background task renewing and taking over leases.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        engine: Engine | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """Initialize the supervisor from settings.gemini.
+
+        Args:
+            client: Shared pooled httpx client for the Gemini API.
+            engine: Database engine used to persist jobs. Without one, jobs
+                are only tracked in memory and lost on restart.
+            rate_limiter: Optional limiter for upstream polls. A poll refused
+                by the limiter is skipped and retried after the next interval.
+        """
+        gemini_settings = settings.gemini
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._engine = engine
+        self._jobs: dict[str, GeminiJob] = {}
+        self._reservations: dict[str, uuid.UUID] = {}
+        self._deadline: float = gemini_settings.poll_deadline
+        self._retention: float = gemini_settings.job_retention
+        self._lease_owner = uuid.uuid4().hex
+        self._lease: float = gemini_settings.job_lease
+        self._heartbeat_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def aclose(self) -> None:
+        """Cancel all background pollers and release their leases."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        if self._heartbeat_task is not None:
+            tasks.append(self._heartbeat_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._heartbeat_task = None
+        self._jobs.clear()
+        self._reservations.clear()
+        if self._engine is not None:
+            try:
+                await asyncio.to_thread(self._release_leases)
+            except Exception:
+                logger.exception("Failed to release Gemini job leases")
+
+    def watch(self, interaction_id: str, last_event_id: str | None = None) -> GeminiJob:
+        """Return the supervised job for an interaction, starting it if needed.
+
+        Args:
+            interaction_id: The Gemini interaction to supervise.
+            last_event_id: Event to continue from if supervision starts now.
+
+        Returns:
+            The GeminiJob tracking this interaction.
+
+        Raises:
+            GeminiAPIError: If the Gemini API key is not configured.
+        """
+        job = self._jobs.get(interaction_id)
+        if job is not None:
+            return job
+
+        self._ensure_heartbeat()
+        service = GeminiService(client=self._client, rate_limiter=self._rate_limiter)
+        job = GeminiJob(interaction_id, last_event_id=last_event_id)
+        job.task = asyncio.create_task(self._supervise(service, job))
+        self._jobs[interaction_id] = job
+        return job
+
+    async def reserve(self, owner_id: uuid.UUID, *, request: dict[str, Any]) -> str:
+        """Reserve one of the user's job slots before an interaction starts.
+
+        With a database engine the slot is a placeholder record, counted
+        and inserted in one transaction holding a lock on the owner's user
+        row, so concurrent starts from any worker process cannot all pass
+        the check. Without one, this process's jobs and reservations are
+        counted, with nothing awaited in between.
+
+        Args:
+            owner_id: ID of the user about to start a job.
+            request: The request body, stored with the placeholder record.
+
+        Returns:
+            The reservation, to pass to track() or release().
+
+        Raises:
+            AdmissionError: If the user already has the maximum number of
+                unfinished jobs (429).
+        """
+        limit = settings.gemini.max_active_jobs_per_user
+        reservation = f"{_RESERVATION_PREFIX}{uuid.uuid4().hex}"
+        if self._engine is not None:
+            # Keeps the placeholder's lease alive while the interaction starts
+            self._ensure_heartbeat()
+            admitted = await asyncio.to_thread(
+                self._reserve_record, reservation, owner_id, request, limit
+            )
+        else:
+            active = sum(
+                job.owner_id == owner_id and not job.done.is_set()
+                for job in self._jobs.values()
+            ) + sum(owner == owner_id for owner in self._reservations.values())
+            admitted = active < limit
+        if not admitted:
+            raise AdmissionError.job_limit_exceeded(
+                provider="gemini", limit=limit, retry_after=_JOB_LIMIT_RETRY_AFTER
+            )
+        self._reservations[reservation] = owner_id
+        return reservation
+
+    async def release(self, reservation: str) -> None:
+        """Free a reserved job slot whose interaction did not start.
+
+        If the placeholder record cannot be deleted (e.g. the request was
+        cancelled), its lease is no longer renewed and resume() deletes it
+        once the lease expired.
+
+        Args:
+            reservation: The reservation returned by reserve().
+        """
+        self._reservations.pop(reservation, None)
+        if self._engine is None:
+            return
+        try:
+            await asyncio.to_thread(self._delete_record, reservation)
+        except Exception:
+            logger.exception("Failed to release Gemini job slot %s", reservation)
+
+    async def track(
+        self,
+        interaction_id: str,
+        *,
+        owner_id: uuid.UUID,
+        request: dict[str, Any],
+        status: str,
+        reservation: str | None = None,
+    ) -> GeminiJob:
+        """Record a newly started interaction and begin supervising it.
+
+        Args:
+            interaction_id: The Gemini interaction that was started.
+            owner_id: ID of the user who started the job.
+            request: The original request body, kept for auditing and resume.
+            status: Initial status reported by the Gemini API.
+            reservation: Job slot reserved for the interaction by reserve(),
+                whose placeholder record becomes the job's record.
+
+        Returns:
+            The GeminiJob tracking this interaction.
+        """
+        if self._engine is not None:
+            try:
+                await asyncio.to_thread(
+                    self._create_record,
+                    interaction_id,
+                    owner_id,
+                    request,
+                    status,
+                    reservation,
+                )
+            except Exception:
+                logger.exception("Failed to persist Gemini job %s", interaction_id)
+        job = self.watch(interaction_id)
+        job.owner_id = owner_id
+        if reservation is not None:
+            self._reservations.pop(reservation, None)
+        return job
+
+    async def resume(self) -> int:
+        """Claim and restart supervision of jobs whose lease has expired.
+
+        These are jobs of a process that stopped, or of a worker process
+        that stopped renewing its leases. Each claimed job is polled again
+        starting from its last_event_id. Does nothing without a database
+        engine or a Gemini API key.
+
+        Returns:
+            Number of jobs resumed.
+        """
+        if self._engine is None or not settings.gemini.api_key:
+            return 0
+        self._ensure_heartbeat()
+        try:
+            records = await asyncio.to_thread(self._claim_records)
+        except Exception:
+            logger.exception("Failed to claim unfinished Gemini jobs")
+            return 0
+        resumed = 0
+        for interaction_id, last_event_id in records:
+            if interaction_id.startswith(_RESERVATION_PREFIX):
+                # Reserved by a process that stopped before the job started
+                try:
+                    await asyncio.to_thread(self._delete_record, interaction_id)
+                except Exception:
+                    logger.exception(
+                        "Failed to release Gemini job slot %s", interaction_id
+                    )
+                continue
+            self.watch(interaction_id, last_event_id=last_event_id)
+            resumed += 1
+        if resumed:
+            logger.info("Resumed %d unfinished Gemini jobs", resumed)
+        return resumed
+
+    def refresh(self, interaction_id: str) -> None:
+        """Ask the poller of a tracked interaction to poll again now.
+
+        Used after actions that change job state upstream (e.g. cancel), so
+        watchers see the change without waiting out the backoff interval.
+
+        Args:
+            interaction_id: The Gemini interaction to refresh.
+        """
+        job = self._jobs.get(interaction_id)
+        if job is not None:
+            job.wake.set()
+
+    async def get_status(self, interaction_id: str) -> GeminiDeepResearchResultResponse:
+        """Return the last known status of an interaction.
+
+        Reads local state; only the first call for an unknown interaction
+        waits for the initial upstream poll. If that poll failed with a
+        transient error, the error is raised while polling is retried.
+
+        Args:
+            interaction_id: The Gemini interaction to read.
+
+        Returns:
+            The most recent poll result.
+
+        Raises:
+            GeminiAPIError: If supervision failed, or the last poll failed,
+                before any result arrived.
+            AdmissionError: If the last poll was refused by the local rate
+                limiter before any result arrived.
+        """
+        job = self.watch(interaction_id)
+        await job.first_update.wait()
+        return job.latest()
+
+    async def wait(self, interaction_id: str) -> GeminiDeepResearchResultResponse:
+        """Wait until an interaction reaches a terminal state.
+
+        Args:
+            interaction_id: The Gemini interaction to wait for.
+
+        Returns:
+            The completed result.
+
+        Raises:
+            GeminiAPIError: If the job failed, was cancelled, or supervision
+                ended with an error.
+        """
+        job = self.watch(interaction_id)
+        await job.done.wait()
+        job.raise_error()
+        result = job.latest()
+        if result.status == GeminiInteractionStatus.FAILED:
+            raise GeminiAPIError.research_failed(
+                message=result.error_message or "Deep research job failed.",
+                details={"interaction_id": interaction_id},
+            )
+        if result.status == GeminiInteractionStatus.CANCELLED:
+            raise GeminiAPIError.api_error(
+                message="Deep research job was cancelled.",
+                details={"interaction_id": interaction_id},
+            )
+        return result
+
+    async def subscribe(
+        self, interaction_id: str, last_event_id: str | None = None
+    ) -> AsyncGenerator[GeminiJobUpdate, None]:
+        """Yield the current state and every subsequent update of a job.
+
+        Transient poll errors are yielded rather than raised, since the
+        poller keeps retrying; the iterator ends once the job is finished.
+
+        Args:
+            interaction_id: The Gemini interaction to follow.
+            last_event_id: Last event the caller already received. The
+                current state is not replayed if it carries this event, and
+                supervision of an untracked job resumes from it.
+
+        Yields:
+            Poll results and transient errors in the order they occurred.
+
+        Raises:
+            GeminiAPIError: If supervision ended with an error.
+        """
+        job = self.watch(interaction_id, last_event_id=last_event_id)
+        queue = job.subscribe()
+        try:
+            if job.result is not None and not (
+                last_event_id and job.result.event_id == last_event_id
+            ):
+                yield job.result
+            elif job.result is None and job.last_error is not None:
+                yield job.last_error
+            while not (job.done.is_set() and queue.empty()):
+                next_update = asyncio.ensure_future(queue.get())
+                finished = asyncio.ensure_future(job.done.wait())
+                await asyncio.wait(
+                    {next_update, finished}, return_when=asyncio.FIRST_COMPLETED
+                )
+                finished.cancel()
+                if next_update.done():
+                    yield next_update.result()
+                else:
+                    next_update.cancel()
+            job.raise_error()
+        finally:
+            job.unsubscribe(queue)
+
+    def _ensure_heartbeat(self) -> None:
+        """Start the lease heartbeat on first use."""
+        if self._engine is not None and self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        """Renew the leases of unfinished jobs and take over expired ones."""
+        clear_deadline()
+        while True:
+            await asyncio.sleep(self._lease / 3)
+            interaction_ids = [
+                interaction_id
+                for interaction_id, job in self._jobs.items()
+                if not job.done.is_set()
+            ]
+            interaction_ids.extend(self._reservations)
+            if interaction_ids:
+                try:
+                    await asyncio.to_thread(self._renew_leases, interaction_ids)
+                except Exception:
+                    logger.exception("Failed to renew Gemini job leases")
+            await self.resume()
+
+    async def _supervise(self, service: GeminiService, job: GeminiJob) -> None:
+        """Poll one interaction until it is terminal, then expire its state."""
+        # Supervision outlives the request that started it and its deadline
+        clear_deadline()
+        polled = False
+        try:
+            polled = await self._follow_record(job)
+            if polled:
+                await self._poll_until_done(service, job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("Gemini supervisor for %s crashed", job.interaction_id)
+            job.fail(
+                GeminiAPIError.api_error(
+                    message="Unexpected error while supervising research job.",
+                    details={
+                        "interaction_id": job.interaction_id,
+                        "original_error": str(exc),
+                    },
+                )
+            )
+        # A job followed from its record is accounted for by the worker
+        # process that polled it
+        if polled:
+            metrics.observe("gemini.polls_per_job", job.polls, outcome=_outcome(job))
+        if polled and job.error is not None:
+            await self._persist(
+                job,
+                {
+                    "status": GeminiInteractionStatus.FAILED.value,
+                    "error_message": job.error.message,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                },
+            )
+        # Keep finished state around for late readers, then drop it
+        asyncio.get_running_loop().call_later(
+            self._retention, self._expire, job.interaction_id, job
+        )
+
+    async def _follow_record(self, job: GeminiJob) -> bool:
+        """Follow the stored record while another worker process polls the job.
+
+        Returns once this supervisor holds the job's lease, or the job has
+        no stored record, so it can poll upstream itself; or once the record
+        reached a terminal status, which finishes the job.
+
+        Returns:
+            True if the job should be polled upstream by this supervisor.
+        """
+        if self._engine is None:
+            return True
+        while True:
+            try:
+                record = await asyncio.to_thread(self._claim_record, job.interaction_id)
+            except Exception:
+                logger.exception("Failed to claim Gemini job %s", job.interaction_id)
+                return True
+            if record is None:
+                return True
+            lease_owner, result = record
+            if lease_owner == self._lease_owner:
+                job.last_event_id = result.event_id or job.last_event_id
+                return True
+            if job.result is None or (result.event_id, result.status) != (
+                job.result.event_id,
+                job.result.status,
+            ):
+                job.publish(result)
+            if result.status in _TERMINAL_STATUSES:
+                job.finish()
+                return False
+            job.wake.clear()
+            try:
+                await asyncio.wait_for(
+                    job.wake.wait(), timeout=settings.gemini.max_poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_until_done(self, service: GeminiService, job: GeminiJob) -> None:
+        """Poll with adaptive backoff until a terminal status or deadline."""
+        started_at = time.monotonic()
+        policy = create_gemini_poll_policy()
+
+        while True:
+            is_new_event = False
+            try:
+                result = await service.poll_research(
+                    interaction_id=job.interaction_id,
+                    last_event_id=job.last_event_id,
+                )
+            except AdmissionError as exc:
+                # Poll quota exhausted locally; nothing was sent upstream
+                job.report(exc)
+            except GeminiAPIError as exc:
+                job.polls += 1
+                if exc.status_code in _FATAL_STATUS_CODES:
+                    job.fail(exc)
+                    return
+                job.report(exc)
+                logger.warning(
+                    "Transient error polling Gemini job %s: %s",
+                    job.interaction_id,
+                    exc.message,
+                )
+            else:
+                job.polls += 1
+                is_new_event = bool(result.event_id) and (
+                    result.event_id != job.last_event_id
+                )
+                is_new_status = job.result is None or (
+                    result.status != job.result.status
+                )
+                job.publish(result)
+                if result.status in _TERMINAL_STATUSES:
+                    await self._persist(
+                        job,
+                        {
+                            "status": result.status.value,
+                            "last_event_id": job.last_event_id,
+                            "result": result.model_dump(mode="json"),
+                            "error_message": result.error_message,
+                            "lease_owner": None,
+                            "lease_expires_at": None,
+                        },
+                    )
+                    job.finish()
+                    return
+                if is_new_event or is_new_status:
+                    await self._persist(
+                        job,
+                        {
+                            "status": result.status.value,
+                            "last_event_id": job.last_event_id,
+                        },
+                    )
+
+            if time.monotonic() - started_at >= self._deadline:
+                job.fail(
+                    GeminiAPIError.polling_timeout(
+                        message=(
+                            f"Research job did not finish within {self._deadline:.0f}"
+                            " seconds."
+                        ),
+                        details={
+                            "interaction_id": job.interaction_id,
+                            "polls": job.polls,
+                        },
+                    )
+                )
+                return
+
+            job.wake.clear()
+            try:
+                await asyncio.wait_for(
+                    job.wake.wait(),
+                    timeout=policy.next_interval(new_event=is_new_event),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _persist(self, job: GeminiJob, job_data: dict[str, Any]) -> None:
+        """Write job changes to the database without blocking the loop.
+
+        Persistence failures are logged and never interrupt supervision.
+        """
+        if self._engine is None:
+            return
+        try:
+            await asyncio.to_thread(self._update_record, job.interaction_id, job_data)
+        except Exception:
+            logger.exception("Failed to persist Gemini job %s", job.interaction_id)
+
+    def _reserve_record(
+        self,
+        reservation: str,
+        owner_id: uuid.UUID,
+        request: dict[str, Any],
+        limit: int,
+    ) -> bool:
+        with Session(self._engine) as session:
+            db_job = crud.create_research_job_within_limit(
+                session=session,
+                interaction_id=reservation,
+                owner_id=owner_id,
+                request=request,
+                status=GeminiInteractionStatus.PENDING.value,
+                provider="gemini",
+                terminal_statuses=[status.value for status in _TERMINAL_STATUSES],
+                limit=limit,
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+            return db_job is not None
+
+    def _create_record(
+        self,
+        interaction_id: str,
+        owner_id: uuid.UUID,
+        request: dict[str, Any],
+        status: str,
+        reservation: str | None,
+    ) -> None:
+        with Session(self._engine) as session:
+            db_job = (
+                crud.get_research_job(session=session, interaction_id=reservation)
+                if reservation is not None
+                else None
+            )
+            if db_job is not None:
+                # Turn the reserved slot's placeholder into the job's record
+                crud.update_research_job(
+                    session=session,
+                    db_job=db_job,
+                    job_data={
+                        "interaction_id": interaction_id,
+                        "request": request,
+                        "status": status,
+                        "lease_owner": self._lease_owner,
+                        "lease_expires_at": self._lease_expiry(),
+                    },
+                )
+                return
+            crud.create_research_job(
+                session=session,
+                interaction_id=interaction_id,
+                owner_id=owner_id,
+                request=request,
+                status=status,
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+
+    def _delete_record(self, interaction_id: str) -> None:
+        with Session(self._engine) as session:
+            crud.delete_research_job(session=session, interaction_id=interaction_id)
+
+    def _update_record(self, interaction_id: str, job_data: dict[str, Any]) -> None:
+        with Session(self._engine) as session:
+            db_job = crud.get_research_job(
+                session=session, interaction_id=interaction_id
+            )
+            if db_job is not None:
+                crud.update_research_job(
+                    session=session, db_job=db_job, job_data=job_data
+                )
+
+    def _claim_records(self) -> list[tuple[str, str | None]]:
+        with Session(self._engine) as session:
+            db_jobs = crud.claim_research_jobs(
+                session=session,
+                provider="gemini",
+                terminal_statuses=[status.value for status in _TERMINAL_STATUSES],
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+            return [(db_job.interaction_id, db_job.last_event_id) for db_job in db_jobs]
+
+    def _claim_record(
+        self, interaction_id: str
+    ) -> tuple[str | None, GeminiDeepResearchResultResponse] | None:
+        """Claim a stored job unless another live lease holds it.
+
+        Returns:
+            The lease owner after the claim and the stored state, or None if
+            the job has no record.
+        """
+        with Session(self._engine) as session:
+            db_job = crud.claim_research_job(
+                session=session,
+                interaction_id=interaction_id,
+                terminal_statuses=[status.value for status in _TERMINAL_STATUSES],
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+            if db_job is None:
+                return None
+            return db_job.lease_owner, _record_result(db_job)
+
+    def _renew_leases(self, interaction_ids: list[str]) -> None:
+        with Session(self._engine) as session:
+            crud.renew_research_job_leases(
+                session=session,
+                interaction_ids=interaction_ids,
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+
+    def _release_leases(self) -> None:
+        with Session(self._engine) as session:
+            crud.release_research_job_leases(
+                session=session, lease_owner=self._lease_owner
+            )
+
+    def _lease_expiry(self) -> datetime:
+        """Return when a lease taken or renewed now runs out."""
+        return utc_now() + timedelta(seconds=self._lease)
+
+    def _expire(self, interaction_id: str, job: GeminiJob) -> None:
+        """Drop a finished job's state if it has not been replaced."""
+        if self._jobs.get(interaction_id) is job:
+            del self._jobs[interaction_id]
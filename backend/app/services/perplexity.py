@@ -4,18 +4,42 @@ This module provides the PerplexityService class which encapsulates all interact
 with the Perplexity Sonar API for deep research queries. It uses httpx AsyncClient
 for HTTP requests with Bearer token authentication.
 
+The httpx client is created once by the application lifespan (see
+create_perplexity_client) and injected into each PerplexityService, so
+connections to the Perplexity API are pooled and reused across requests.
+
+Streaming requests are consumed as server-sent events via
+stream_deep_research and can be folded back into a final response with
+PerplexityStreamAccumulator.
+
 Usage:
-    from app.services.perplexity import PerplexityService
+    from app.services.perplexity import PerplexityService, create_perplexity_client
 
-    service = PerplexityService()
+    client = create_perplexity_client()
+    service = PerplexityService(client=client)
     result = await service.deep_research(request)
+
+    async for chunk in service.stream_deep_research(request):
+        ...
 """
 
+import json
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import httpx
 
+from app.core.circuit_breaker import (
+    CircuitOpenError,
+    circuit_breakers,
+    is_upstream_failure,
+)
 from app.core.config import settings
+from app.core.deadline import operation_timeout
+from app.core.http_utils import create_pooled_client
+from app.core.ratelimit import RateLimiter
+from app.core.retry import create_retry_policy
+from app.exceptions.admission import AdmissionError
 from app.exceptions.perplexity import PerplexityAPIError
 from app.schemas.perplexity import (
     PerplexityDeepResearchRequest,
@@ -23,6 +47,105 @@ from app.schemas.perplexity import (
 )
 
 
+def create_perplexity_client() -> httpx.AsyncClient:
+    """Create the pooled httpx client used for Perplexity API requests.
+
+    Pool limits and the default timeout come from settings.perplexity.
+    The caller owns the client and must close it with ``aclose()``.
+
+    Returns:
+        Configured httpx.AsyncClient instance.
+    """
+    perplexity_settings = settings.perplexity
+    return create_pooled_client(
+        timeout_seconds=perplexity_settings.timeout,
+        max_connections=perplexity_settings.max_connections,
+        max_keepalive_connections=perplexity_settings.max_keepalive_connections,
+        keepalive_expiry=perplexity_settings.keepalive_expiry,
+    )
+
+
+class PerplexityStreamAccumulator:
+    """Fold streamed chat.completion.chunk objects into a final response.
+
+    Content deltas are concatenated per choice index. Citations, search
+    results and other list fields are resent in full by the API, so the
+    latest non-empty value wins. Usage is reported on the last chunk.
+
+    Attributes:
+        _response: Top-level fields (id, model, lists, usage) seen so far.
+        _contents: Accumulated content fragments per choice index.
+        _roles: Message role per choice index.
+        _finish_reasons: Finish reason per choice index.
+    """
+
+    _LIST_FIELDS: tuple[str, ...] = (
+        "citations",
+        "search_results",
+        "images",
+        "videos",
+        "related_questions",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self._response: dict[str, Any] = {}
+        self._contents: dict[int, list[str]] = {}
+        self._roles: dict[int, str] = {}
+        self._finish_reasons: dict[int, str | None] = {}
+
+    @property
+    def content(self) -> str:
+        """Return the content accumulated so far for the first choice."""
+        return "".join(self._contents.get(0, []))
+
+    def add(self, chunk: dict[str, Any]) -> None:
+        """Merge one streamed chunk into the accumulated response.
+
+        Args:
+            chunk: Parsed chat.completion.chunk object from the stream.
+        """
+        for field in ("id", "model", "created"):
+            if chunk.get(field) is not None:
+                self._response[field] = chunk[field]
+        for field in self._LIST_FIELDS:
+            if chunk.get(field):
+                self._response[field] = chunk[field]
+        if chunk.get("usage"):
+            self._response["usage"] = chunk["usage"]
+
+        for choice in chunk.get("choices") or []:
+            index = choice.get("index", 0)
+            delta = choice.get("delta") or {}
+            if delta.get("role"):
+                self._roles[index] = delta["role"]
+            if delta.get("content"):
+                self._contents.setdefault(index, []).append(delta["content"])
+            if choice.get("finish_reason") is not None:
+                self._finish_reasons[index] = choice["finish_reason"]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the accumulated response in chat.completion format."""
+        indexes = sorted(
+            set(self._contents) | set(self._roles) | set(self._finish_reasons)
+        )
+        return {
+            **self._response,
+            "object": "chat.completion",
+            "choices": [
+                {
+                    "index": index,
+                    "message": {
+                        "role": self._roles.get(index, "assistant"),
+                        "content": "".join(self._contents.get(index, [])),
+                    },
+                    "finish_reason": self._finish_reasons.get(index),
+                }
+                for index in indexes
+            ],
+        }
+
+
 class PerplexityService:
     """Service layer for Perplexity Sonar API operations.
 
@@ -34,25 +157,43 @@ class PerplexityService:
     - Bearer token authentication
     - Request payload formatting with web_search_options nesting
     - Response parsing and error mapping
-    - 300-second timeout for deep research queries
+    - Per-operation connect/read/pool timeouts, capped by the request
+      deadline (300-second read timeout for deep research queries)
 
     Attributes:
         BASE_URL: The Perplexity API base URL for chat completions.
+        _client: Pooled httpx.AsyncClient used for all requests.
+        _owns_client: Whether aclose() should close _client.
         _api_key: The API key for authentication.
-        _timeout: Request timeout in seconds.
+        _timeout: Request timeout in seconds for operations without an entry
+            in _timeouts.
+        _timeouts: Connect, read and pool timeouts by operation.
         _default_model: Default model for requests.
+        _rate_limiter: Client-side limiter for the Perplexity quota, or None.
+        _retry: Retry policy for non-streaming deep research calls.
     """
 
     BASE_URL: str = "https://api.perplexity.ai/chat/completions"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize PerplexityService with configuration from settings.
 
         Reads configuration from settings.perplexity:
         - api_key: Optional Perplexity API key
         - timeout: Request timeout in seconds (default: 300)
+        - timeouts: Connect, read and pool timeouts by operation
         - default_model: Default model for research queries
 
+        Args:
+            client: Shared pooled httpx client. When omitted, the service
+                creates its own client and closes it in aclose().
+            rate_limiter: Optional limiter consulted before each API call
+                with the model, since Perplexity quotas are per model tier.
+
         Raises:
             PerplexityAPIError: If API key is not configured.
         """
@@ -65,8 +206,26 @@ class PerplexityService:
 
         self._api_key: str = perplexity_settings.api_key
         self._timeout: int = perplexity_settings.timeout
+        self._timeouts = perplexity_settings.timeouts
         self._default_model: str = perplexity_settings.default_model.value
 
+        self._owns_client: bool = client is None
+        self._client: httpx.AsyncClient = client or create_perplexity_client()
+        self._rate_limiter: RateLimiter | None = rate_limiter
+        # Completions are not idempotent: only retry requests the API
+        # cannot have processed (connect errors, 429, 503)
+        self._retry = create_retry_policy("perplexity", idempotent=False)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by this service."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _throttle(self, model: str) -> None:
+        """Take a rate limit token for one API call with the model."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire("perplexity", model)
+
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for Perplexity API requests.
 
@@ -234,7 +393,8 @@ class PerplexityService:
 
         Makes a POST request to the Perplexity chat completions endpoint
         with the provided query and parameters. Handles authentication,
-        timeout, and error mapping.
+        timeout, and error mapping. When request.stream is set, the SSE
+        stream is consumed and accumulated into the same response.
 
         Args:
             request: Deep research request with query and optional parameters.
@@ -243,45 +403,158 @@ class PerplexityService:
             PerplexityDeepResearchResponse with model response and citations.
 
         Raises:
-            PerplexityAPIError: If the API request fails for any reason.
+            PerplexityAPIError: If the API request fails for any reason, or
+                with 503 while the Perplexity circuit breaker is open.
+            AdmissionError: If the model's rate limit has no token available.
         """
+        if request.stream:
+            # Streaming payloads return SSE, not a JSON body
+            accumulator = PerplexityStreamAccumulator()
+            async for chunk in self.stream_deep_research(request):
+                accumulator.add(chunk)
+            return self._parse_response(accumulator.to_dict())
+
         headers = self._build_headers()
         payload = self._build_payload(request)
 
+        async def attempt() -> httpx.Response:
+            await self._throttle(str(payload["model"]))
+            return await self._client.post(
+                self.BASE_URL,
+                headers=headers,
+                json=payload,
+                timeout=operation_timeout(
+                    self._timeouts, "deep_research", self._timeout
+                ),
+            )
+
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=payload,
+            response = await circuit_breakers["perplexity"].call(
+                lambda: self._retry.call("deep_research", attempt)
+            )
+
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
                 )
 
+            response_data = response.json()
+            return self._parse_response(response_data)
+
+        except (PerplexityAPIError, AdmissionError):
+            # Re-raise our own exceptions
+            raise
+        except CircuitOpenError as exc:
+            raise PerplexityAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
+        except Exception as exc:
+            raise self._handle_transport_error(exc) from exc
+
+    async def stream_deep_research(
+        self,
+        request: PerplexityDeepResearchRequest,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream a deep research query as parsed SSE chunks.
+
+        Sends the request with stream enabled and yields each
+        chat.completion.chunk object as soon as it arrives, so the first
+        tokens are available long before the full answer. The stream ends
+        at the "[DONE]" sentinel or when the connection closes.
+
+        Args:
+            request: Deep research request with query and optional parameters.
+                The stream flag is forced on.
+
+        Yields:
+            Parsed chunk dictionaries with choices[].delta content and the
+            citations/search_results known so far.
+
+        Raises:
+            PerplexityAPIError: If the API request fails for any reason, or
+                with 503 while the Perplexity circuit breaker is open.
+            AdmissionError: If the model's rate limit has no token available.
+        """
+        headers = self._build_headers()
+        headers["Accept"] = "text/event-stream"
+        payload = self._build_payload(request)
+        payload["stream"] = True
+        await self._throttle(str(payload["model"]))
+
+        breaker = circuit_breakers["perplexity"]
+        try:
+            breaker.before_call()
+        except CircuitOpenError as exc:
+            raise PerplexityAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
+        # The breaker verdict is taken once the response status is known
+        recorded = False
+
+        try:
+            async with self._client.stream(
+                "POST",
+                self.BASE_URL,
+                headers=headers,
+                json=payload,
+                timeout=operation_timeout(self._timeouts, "stream", self._timeout),
+            ) as response:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                recorded = True
+
                 if response.status_code != 200:
+                    await response.aread()
                     raise self._handle_error(
                         status_code=response.status_code,
                         response_body=response.text,
                     )
 
-                response_data = response.json()
-                return self._parse_response(response_data)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+                    if data:
+                        chunk: dict[str, Any] = json.loads(data)
+                        yield chunk
 
         except PerplexityAPIError:
             # Re-raise our own exceptions
             raise
-        except httpx.TimeoutException as exc:
-            raise PerplexityAPIError.request_timeout(
-                message=f"Request timed out after {self._timeout} seconds.",
+        except Exception as exc:
+            if not recorded and is_upstream_failure(exc):
+                breaker.record_failure()
+                recorded = True
+            raise self._handle_transport_error(exc) from exc
+        finally:
+            if not recorded:
+                breaker.release()
+
+    def _handle_transport_error(self, exc: Exception) -> PerplexityAPIError:
+        """Map timeouts, HTTP and unexpected errors to PerplexityAPIError.
+
+        Args:
+            exc: The exception raised while calling the API.
+
+        Returns:
+            Appropriate PerplexityAPIError subtype.
+        """
+        if isinstance(exc, httpx.TimeoutException):
+            return PerplexityAPIError.request_timeout(
+                message="Request to Perplexity API timed out.",
                 details={"original_error": str(exc)},
-            ) from exc
-        except httpx.HTTPError as exc:
-            raise PerplexityAPIError.api_error(
+            )
+        if isinstance(exc, httpx.HTTPError):
+            return PerplexityAPIError.api_error(
                 message="HTTP error occurred while communicating with Perplexity API.",
                 details={"original_error": str(exc)},
-            ) from exc
-        except Exception as exc:
-            raise PerplexityAPIError.api_error(
-                message="Unexpected error occurred.",
-                details={"original_error": str(exc)},
-            ) from exc
+            )
+        return PerplexityAPIError.api_error(
+            message="Unexpected error occurred.",
+            details={"original_error": str(exc)},
+        )
@@ -0,0 +1,523 @@
+"""Background job mode for Perplexity deep research.
+
+This module provides the PerplexityJobManager which runs deep research
+queries in a bounded pool of background workers. sonar-deep-research calls
+routinely take minutes; running them as jobs lets the HTTP request return a
+job ID immediately instead of holding a connection open that proxies and
+load balancers in front of the API would cut.
+
+Jobs wait in a bounded queue until one of settings.perplexity.job_workers
+workers picks them up, so at most that many upstream calls run at once.
+Each user may have at most max_active_jobs_per_user unfinished jobs; with a
+database engine they are counted across all worker processes.
+Finished jobs are kept in memory for job_retention seconds. When given a
+database engine the manager also mirrors every job into the ResearchJob
+table (provider "perplexity"), so results can still be retrieved after the
+in-memory state expired or the process restarted. Jobs that were queued or
+running when the process stopped are re-run by resume().
+
+Every uvicorn worker process runs its own manager against the same table,
+so a stored job is leased to the manager running it: lease_owner names the
+manager and lease_expires_at says until when the claim holds. A heartbeat
+renews the leases of running jobs every third of job_lease seconds, and
+resume() claims only jobs whose lease expired, with SELECT ... FOR UPDATE
+SKIP LOCKED so two managers never claim the same row. The heartbeat also
+calls resume(), so jobs of a worker that died are taken over by the others
+once their lease runs out.
+
+The manager is created once by the application lifespan and shares the
+app-scoped Perplexity httpx client, mirroring GeminiJobSupervisor.
+
+Usage:
+    from app.services.perplexity_jobs import PerplexityJobManager
+
+    manager = PerplexityJobManager(client=client, engine=engine)
+    await manager.resume()
+    job = await manager.submit(request, owner_id=user.id)
+    job = await manager.get(job.job_id, owner_id=user.id)
+    await manager.aclose()
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.deadline import clear_deadline
+from app.core.ratelimit import RateLimiter
+from app.exceptions.admission import AdmissionError
+from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
+from app.models import ResearchJob, utc_now
+from app.schemas.perplexity import (
+    PerplexityDeepResearchJobResultResponse,
+    PerplexityDeepResearchRequest,
+    PerplexityDeepResearchResponse,
+    PerplexityJobStatus,
+)
+from app.schemas.tavily import ErrorResponse
+from app.services.perplexity import PerplexityService
+
+logger = logging.getLogger(__name__)
+
+# Seconds a user over the active job limit is asked to wait before retrying
+_JOB_LIMIT_RETRY_AFTER = 30
+
+# Job statuses after which a worker no longer touches the job
+_TERMINAL_STATUSES: frozenset[PerplexityJobStatus] = frozenset(
+    {PerplexityJobStatus.COMPLETED, PerplexityJobStatus.FAILED}
+)
+
+
+class PerplexityJob:
+    """State of one background Perplexity deep research job.
+
+    Attributes:
+        job_id: Unique identifier returned to the client.
+        owner_id: ID of the user who submitted the job.
+        request: The deep research request to run.
+        status: Current job status.
+        result: Research result once completed.
+        error: Error details once failed.
+        created_at: When the job was submitted.
+        completed_at: When the job reached a terminal status.
+        done: Set once the job reached a terminal status.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        owner_id: uuid.UUID,
+        request: PerplexityDeepResearchRequest,
+        created_at: datetime | None = None,
+    ) -> None:
+        """Initialize a pending job.
+
+        Args:
+            job_id: Unique identifier returned to the client.
+            owner_id: ID of the user who submitted the job.
+            request: The deep research request to run.
+            created_at: Submission time, when restoring a stored job.
+        """
+        self.job_id = job_id
+        self.owner_id = owner_id
+        self.request = request
+        self.status = PerplexityJobStatus.PENDING
+        self.result: PerplexityDeepResearchResponse | None = None
+        self.error: ErrorResponse | None = None
+        self.created_at = created_at or utc_now()
+        self.completed_at: datetime | None = None
+        self.done = asyncio.Event()
+
+    @classmethod
+    def from_record(cls, db_job: ResearchJob) -> "PerplexityJob":
+        """Rebuild a job from its ResearchJob row."""
+        job = cls(
+            job_id=db_job.interaction_id,
+            owner_id=db_job.owner_id,
+            request=PerplexityDeepResearchRequest.model_validate(db_job.request),
+            created_at=db_job.created_at,
+        )
+        job.status = PerplexityJobStatus(db_job.status)
+        if db_job.result is not None:
+            job.result = PerplexityDeepResearchResponse.model_validate(db_job.result)
+        if db_job.error_message is not None:
+            job.error = ErrorResponse(
+                error_code=PerplexityErrorCode.PERPLEXITY_API_ERROR,
+                message=db_job.error_message,
+            )
+        if job.status in _TERMINAL_STATUSES:
+            job.completed_at = db_job.updated_at
+            job.done.set()
+        return job
+
+    def to_response(self) -> PerplexityDeepResearchJobResultResponse:
+        """Return the job as an API response."""
+        return PerplexityDeepResearchJobResultResponse(
+            job_id=self.job_id,
+            status=self.status,
+            created_at=self.created_at,
+            result=self.result,
+            error=self.error,
+            completed_at=self.completed_at,
+        )
+
+
+class PerplexityJobManager:
+    """Run Perplexity deep research jobs in a bounded background worker pool.
+
+    Attributes:
+        _client: App-scoped httpx client used for upstream calls.
+        _engine: Database engine for persisting jobs, or None to keep
+            state in memory only.
+        _jobs: Jobs keyed by job_id, kept until retention expires.
+        _queue: Jobs waiting for a worker.
+        _workers: Background worker tasks, started on first use.
+        _worker_count: Number of workers to run.
+        _retention: Seconds a finished job's state is kept in memory.
+        _rate_limiter: Client-side limiter for the Perplexity quota, or None.
+        _lease_owner: Unique name of this manager in the lease_owner column.
+        _lease: Seconds a claim on a stored job lasts without a renewal.
+        _heartbeat_task: Background task renewing and taking over leases.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        engine: Engine | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """Initialize the manager from settings.perplexity.
+
+        Args:
+            client: Shared pooled httpx client for the Perplexity API.
+            engine: Database engine used to persist jobs. Without one, jobs
+                are only tracked in memory and lost on restart.
+            rate_limiter: Optional limiter for upstream calls. Jobs wait out
+                rate limit rejections instead of failing.
+        """
+        perplexity_settings = settings.perplexity
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._engine = engine
+        self._jobs: dict[str, PerplexityJob] = {}
+        self._queue: asyncio.Queue[PerplexityJob] = asyncio.Queue(
+            maxsize=perplexity_settings.job_queue_size
+        )
+        self._workers: list[asyncio.Task[None]] = []
+        self._worker_count: int = perplexity_settings.job_workers
+        self._retention: float = perplexity_settings.job_retention
+        self._lease_owner = uuid.uuid4().hex
+        self._lease: float = perplexity_settings.job_lease
+        self._heartbeat_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def aclose(self) -> None:
+        """Cancel all workers and release their leases.
+
+        Unfinished jobs are resumed by the next manager that claims them.
+        """
+        tasks = list(self._workers)
+        if self._heartbeat_task is not None:
+            tasks.append(self._heartbeat_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
+        self._heartbeat_task = None
+        self._jobs.clear()
+        if self._engine is not None:
+            try:
+                await asyncio.to_thread(self._release_leases)
+            except Exception:
+                logger.exception("Failed to release Perplexity job leases")
+
+    async def submit(
+        self, request: PerplexityDeepResearchRequest, *, owner_id: uuid.UUID
+    ) -> PerplexityJob:
+        """Queue a deep research request to run in the background.
+
+        Args:
+            request: Deep research request with query and optional parameters.
+            owner_id: ID of the user submitting the job.
+
+        Returns:
+            The pending PerplexityJob.
+
+        Raises:
+            PerplexityAPIError: If the API key is not configured (401) or
+                the job queue is full (503).
+            AdmissionError: If the user already has the maximum number of
+                unfinished jobs (429).
+        """
+        if not settings.perplexity.api_key:
+            raise PerplexityAPIError.invalid_api_key(
+                message="Perplexity API key is not configured."
+            )
+        if self._queue.full():
+            raise PerplexityAPIError.job_queue_full(
+                details={"queue_size": self._queue.maxsize}
+            )
+
+        job = PerplexityJob(uuid.uuid4().hex, owner_id=owner_id, request=request)
+        await self._admit(job)
+        self._enqueue(job)
+        return job
+
+    async def _admit(self, job: PerplexityJob) -> None:
+        """Record a new job unless its owner has too many unfinished ones.
+
+        With a database engine the count and the insert run in one
+        transaction holding a lock on the owner's user row, so concurrent
+        submits from any worker process cannot all pass the check. Without
+        one, nothing awaits between the count and the caller's _enqueue().
+
+        Raises:
+            AdmissionError: If the user already has the maximum number of
+                unfinished jobs (429).
+        """
+        limit = settings.perplexity.max_active_jobs_per_user
+        if self._engine is not None:
+            admitted = await asyncio.to_thread(self._create_record, job, limit)
+        else:
+            admitted = (
+                sum(
+                    other.owner_id == job.owner_id and not other.done.is_set()
+                    for other in self._jobs.values()
+                )
+                < limit
+            )
+        if not admitted:
+            raise AdmissionError.job_limit_exceeded(
+                provider="perplexity",
+                limit=limit,
+                retry_after=_JOB_LIMIT_RETRY_AFTER,
+            )
+
+    async def get(
+        self, job_id: str, *, owner_id: uuid.UUID | None = None
+    ) -> PerplexityJob:
+        """Return a job from memory, or from the database once expired.
+
+        Args:
+            job_id: The job ID returned by submit().
+            owner_id: Only return the job if it belongs to this user. None
+                skips the ownership check (superusers).
+
+        Returns:
+            The PerplexityJob with its current status and result.
+
+        Raises:
+            PerplexityAPIError: If the job does not exist or belongs to
+                another user (404).
+        """
+        job = self._jobs.get(job_id)
+        if job is None and self._engine is not None:
+            job = await asyncio.to_thread(self._load_record, job_id)
+        if job is None or (owner_id is not None and job.owner_id != owner_id):
+            raise PerplexityAPIError.job_not_found(details={"job_id": job_id})
+        return job
+
+    async def wait(self, job_id: str) -> PerplexityJob:
+        """Wait until a job reaches a terminal status.
+
+        Args:
+            job_id: The job ID returned by submit().
+
+        Returns:
+            The finished PerplexityJob.
+
+        Raises:
+            PerplexityAPIError: If the job does not exist.
+        """
+        job = await self.get(job_id)
+        await job.done.wait()
+        return job
+
+    async def resume(self) -> int:
+        """Claim and re-queue unfinished jobs whose lease has expired.
+
+        These are jobs of a process that stopped, or of a worker process
+        that stopped renewing its leases. The upstream call of a job that
+        was running cannot be reattached, so such jobs are run again from
+        their stored request. Only as many jobs are claimed as the queue
+        has room for. Does nothing without a database engine or a
+        Perplexity API key.
+
+        Returns:
+            Number of jobs re-queued.
+        """
+        if self._engine is None or not settings.perplexity.api_key:
+            return 0
+        self._ensure_workers()
+        free_slots = self._queue.maxsize - self._queue.qsize()
+        if free_slots <= 0:
+            return 0
+        try:
+            jobs = await asyncio.to_thread(self._claim_records, free_slots)
+        except Exception:
+            logger.exception("Failed to claim unfinished Perplexity jobs")
+            return 0
+        for job in jobs:
+            job.status = PerplexityJobStatus.PENDING
+            self._enqueue(job)
+        if jobs:
+            logger.info("Resumed %d unfinished Perplexity jobs", len(jobs))
+        return len(jobs)
+
+    def _enqueue(self, job: PerplexityJob) -> None:
+        """Track a job and hand it to the worker pool."""
+        self._ensure_workers()
+        self._jobs[job.job_id] = job
+        self._queue.put_nowait(job)
+
+    def _ensure_workers(self) -> None:
+        """Start the worker pool and lease heartbeat on first use."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+            ]
+        if self._engine is not None and self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        """Renew the leases of unfinished jobs and take over expired ones."""
+        clear_deadline()
+        while True:
+            await asyncio.sleep(self._lease / 3)
+            job_ids = [
+                job_id for job_id, job in self._jobs.items() if not job.done.is_set()
+            ]
+            if job_ids:
+                try:
+                    await asyncio.to_thread(self._renew_leases, job_ids)
+                except Exception:
+                    logger.exception("Failed to renew Perplexity job leases")
+            await self.resume()
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time until cancelled."""
+        # Workers start inside a request but must not inherit its deadline
+        clear_deadline()
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception:
+                logger.exception("Perplexity job %s crashed", job.job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: PerplexityJob) -> None:
+        """Run one job's deep research call and record the outcome."""
+        job.status = PerplexityJobStatus.IN_PROGRESS
+        await self._persist(job, {"status": job.status.value})
+        try:
+            service = PerplexityService(
+                client=self._client, rate_limiter=self._rate_limiter
+            )
+            while job.result is None:
+                try:
+                    job.result = await service.deep_research(job.request)
+                except AdmissionError as exc:
+                    # Queued work can wait for quota; nobody is blocked on it
+                    await asyncio.sleep(exc.retry_after)
+            job.status = PerplexityJobStatus.COMPLETED
+        except PerplexityAPIError as exc:
+            job.error = ErrorResponse(
+                error_code=exc.error_code, message=exc.message, details=exc.details
+            )
+            job.status = PerplexityJobStatus.FAILED
+        except Exception as exc:
+            logger.exception("Unexpected error in Perplexity job %s", job.job_id)
+            job.error = ErrorResponse(
+                error_code=PerplexityErrorCode.PERPLEXITY_API_ERROR,
+                message="Unexpected error while running research job.",
+                details={"original_error": str(exc)},
+            )
+            job.status = PerplexityJobStatus.FAILED
+
+        job.completed_at = utc_now()
+        # Persist first so waiters never find a stale record in the database
+        await self._persist(
+            job,
+            {
+                "status": job.status.value,
+                "result": job.result.model_dump(mode="json") if job.result else None,
+                "error_message": job.error.message if job.error else None,
+                "lease_owner": None,
+                "lease_expires_at": None,
+            },
+        )
+        job.done.set()
+        # Keep finished state around for readers, then rely on the database
+        asyncio.get_running_loop().call_later(
+            self._retention, self._expire, job.job_id, job
+        )
+
+    async def _persist(self, job: PerplexityJob, job_data: dict[str, Any]) -> None:
+        """Write job changes to the database without blocking the loop.
+
+        Persistence failures are logged and never fail the job.
+        """
+        if self._engine is None:
+            return
+        try:
+            await asyncio.to_thread(self._update_record, job.job_id, job_data)
+        except Exception:
+            logger.exception("Failed to persist Perplexity job %s", job.job_id)
+
+    def _create_record(self, job: PerplexityJob, limit: int) -> bool:
+        with Session(self._engine) as session:
+            db_job = crud.create_research_job_within_limit(
+                session=session,
+                interaction_id=job.job_id,
+                owner_id=job.owner_id,
+                request=job.request.model_dump(mode="json"),
+                status=job.status.value,
+                provider="perplexity",
+                terminal_statuses=[status.value for status in _TERMINAL_STATUSES],
+                limit=limit,
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+            return db_job is not None
+
+    def _update_record(self, job_id: str, job_data: dict[str, Any]) -> None:
+        with Session(self._engine) as session:
+            db_job = crud.get_research_job(session=session, interaction_id=job_id)
+            if db_job is not None:
+                crud.update_research_job(
+                    session=session, db_job=db_job, job_data=job_data
+                )
+
+    def _load_record(self, job_id: str) -> PerplexityJob | None:
+        with Session(self._engine) as session:
+            db_job = crud.get_research_job(session=session, interaction_id=job_id)
+            if db_job is None or db_job.provider != "perplexity":
+                return None
+            return PerplexityJob.from_record(db_job)
+
+    def _claim_records(self, limit: int) -> list[PerplexityJob]:
+        with Session(self._engine) as session:
+            db_jobs = crud.claim_research_jobs(
+                session=session,
+                provider="perplexity",
+                terminal_statuses=[status.value for status in _TERMINAL_STATUSES],
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+                limit=limit,
+            )
+            return [PerplexityJob.from_record(db_job) for db_job in db_jobs]
+
+    def _renew_leases(self, job_ids: list[str]) -> None:
+        with Session(self._engine) as session:
+            crud.renew_research_job_leases(
+                session=session,
+                interaction_ids=job_ids,
+                lease_owner=self._lease_owner,
+                lease_expires_at=self._lease_expiry(),
+            )
+
+    def _release_leases(self) -> None:
+        with Session(self._engine) as session:
+            crud.release_research_job_leases(
+                session=session, lease_owner=self._lease_owner
+            )
+
+    def _lease_expiry(self) -> datetime:
+        """Return when a lease taken or renewed now runs out."""
+        return utc_now() + timedelta(seconds=self._lease)
+
+    def _expire(self, job_id: str, job: PerplexityJob) -> None:
+        """Drop a finished job's in-memory state if it has not been replaced."""
+        if self._jobs.get(job_id) is job:
+            del self._jobs[job_id]
@@ -4,18 +4,125 @@ This module provides the TavilyService class which encapsulates all interactions
 with the Tavily Python SDK. It manages the AsyncTavilyClient lifecycle and
 provides async methods for search, extract, crawl, and URL mapping operations.
 
+A single TavilyService is created by the application lifespan and shared by
+all requests, so the underlying connection pool and response cache are
+reused across calls.
+
 Usage:
     from app.services.tavily import TavilyService
 
     service = TavilyService()
     results = await service.search("python web scraping")
+    await service.aclose()
 """
 
+import asyncio
+import json
+import logging
+import zlib
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
+from urllib.parse import urlsplit
 
+import httpx
 from tavily import AsyncTavilyClient  # type: ignore[import-untyped]
-
+from tavily.errors import (  # type: ignore[import-untyped]
+    BadRequestError,
+    ForbiddenError,
+    InvalidAPIKeyError,
+    UsageLimitExceededError,
+)
+from tavily.errors import TimeoutError as TavilyTimeoutError
+
+from app.core.cache import (
+    CacheBackend,
+    CacheStatus,
+    create_cache_backend,
+    make_cache_key,
+    set_cache_status,
+)
+from app.core.circuit_breaker import (
+    CircuitOpenError,
+    circuit_breakers,
+    is_upstream_failure,
+)
 from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, bound
+from app.core.deadline import expired as deadline_expired
+from app.core.exceptions import TavilyAPIError
+from app.core.hedging import HedgePolicy
+from app.core.http_utils import create_pooled_client
+from app.core.ratelimit import RateLimiter
+from app.core.retry import create_retry_policy
+from app.core.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _is_upstream_failure(outcome: object) -> bool | None:
+    """Classify Tavily SDK outcomes for the circuit breaker."""
+    if isinstance(outcome, TavilyTimeoutError):
+        # A timeout cut short by the request deadline is not the upstream's
+        return None if deadline_expired() else True
+    if isinstance(
+        outcome,
+        BadRequestError | ForbiddenError | InvalidAPIKeyError | UsageLimitExceededError,
+    ):
+        # The API answered, so it is up
+        return False
+    return is_upstream_failure(outcome)
+
+
+def _extract_cache_key(url: str) -> str:
+    """Build the cache key for a single extracted URL."""
+    return make_cache_key("tavily:extract:url", {"url": url})
+
+
+def _url_match_key(url: str) -> str:
+    """Reduce a URL to the parts an upstream rewrite leaves intact.
+
+    Scheme and host case, the fragment and a trailing slash are ignored.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    return f"{key}?{parts.query}" if parts.query else key
+
+
+def _match_extract_results(
+    urls: list[str], response: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    """Map upstream extract results to the requested URLs they answer.
+
+    Upstream may report a result under a different URL than requested,
+    e.g. after normalization or a redirect. Results are matched on the
+    exact URL first, then on _url_match_key. The remaining results are
+    paired in order with the requested URLs that neither matched nor
+    failed, if their counts agree, since upstream answers in request order.
+
+    Returns:
+        The results keyed by requested URL, and the results left unmatched.
+    """
+    results: list[dict[str, Any]] = response.get("results", [])
+    failed = {item.get("url") for item in response.get("failed_results", [])}
+    matched: dict[str, dict[str, Any]] = {}
+    unmatched: list[dict[str, Any]] = []
+    by_key = {_url_match_key(url): url for url in urls}
+    for item in results:
+        url = (
+            item["url"]
+            if item["url"] in urls
+            else by_key.get(_url_match_key(item["url"]))
+        )
+        if url is not None and url not in matched:
+            matched[url] = item
+        else:
+            unmatched.append(item)
+    remaining = [url for url in urls if url not in matched and url not in failed]
+    if unmatched and len(unmatched) == len(remaining):
+        matched.update(zip(remaining, unmatched, strict=True))
+        unmatched = []
+    return matched, unmatched
 
 
 class TavilyService:
@@ -27,44 +134,254 @@ class TavilyService:
     - crawl: Site crawling with depth control
     - map_urls: Sitemap generation for domains
 
-    The service initializes an AsyncTavilyClient using configuration from
-    TavilySettings (api_key, timeout, proxy).
+    The service owns a pooled httpx.AsyncClient built from TavilySettings
+    (api_key, timeout, proxy, pool limits, http2) and hands it to the
+    AsyncTavilyClient, so connections are kept alive between requests.
+    Search responses are cached (TTL + LRU) keyed on the canonical request
+    and extract results are cached per URL,
+    and concurrent identical search/extract calls share one upstream request.
+    Every upstream call first takes a token from the rate limiter bucket of
+    its endpoint type, if a limiter is given. Search, extract and map calls
+    are retried after transient failures; crawl is too costly to repeat.
+    While the Tavily circuit breaker is open, calls fail fast with a 503.
+    Each endpoint type has its own connect, read and pool timeouts, and no
+    call waits past the request deadline.
+    With search hedging enabled, a basic search that is slower than the
+    configured latency percentile gets one identical backup request.
+    Call aclose() when the service is no longer needed.
 
     Attributes:
+        _http_client: The pooled httpx.AsyncClient used by the SDK.
         _client: The underlying AsyncTavilyClient instance.
-        _timeout: Default timeout for API requests in seconds.
+        _timeout: Default timeout for endpoints without an entry in _timeouts.
+        _timeouts: Connect, read and pool timeouts by endpoint type.
+        _cache: Response cache backend, or None when caching is disabled.
+        _search_cache_ttl: TTL in seconds for cached search responses.
+        _extract_cache_ttl: Default TTL in seconds for cached extract results.
+        _extract_cache_domain_ttls: Per-domain TTL overrides for extract results.
+        _extract_cache_compress: Whether cached extract results are compressed.
+        _extract_chunk_size: Maximum URLs sent in one upstream extract call.
+        _extract_max_concurrency: Maximum extract chunks in flight at once.
+        _inflight: Coalesces concurrent identical search and extract calls.
+        _rate_limiter: Client-side limiter for the Tavily quota, or None.
+        _retry: Retry policy for search, extract and map calls.
+        _search_hedge: Hedge policy for basic searches, or None when disabled.
     """
 
-    def __init__(self) -> None:
-        """Initialize TavilyService with configured AsyncTavilyClient.
+    def __init__(self, rate_limiter: RateLimiter | None = None) -> None:
+        """Initialize TavilyService with a pooled AsyncTavilyClient.
 
         Reads configuration from settings.tavily:
         - api_key: Required Tavily API key
         - timeout: Request timeout in seconds (default: 60)
+        - timeouts: Connect, read and pool timeouts by endpoint type
         - proxy: Optional HTTP proxy URL
+        - max_connections, max_keepalive_connections, keepalive_expiry:
+          Connection pool limits
+        - http2: Whether to negotiate HTTP/2
+        - cache_backend, cache_max_entries, search_cache_ttl: Response cache
+        - extract_cache_ttl, extract_cache_domain_ttls, extract_cache_compress:
+          Per-URL extract result cache
+        - extract_chunk_size, extract_max_concurrency: Extract fan-out
 
-        The proxy string is converted to the dict format expected by
-        AsyncTavilyClient ({"http": url, "https": url}).
+        Args:
+            rate_limiter: Optional limiter consulted before each upstream call
+                with the endpoint type ("search", "extract", "crawl", "map").
         """
         tavily_settings = settings.tavily
 
-        # Convert proxy string to dict format if provided
-        proxies: dict[str, str] | None = None
-        if tavily_settings.proxy:
-            proxies = {
-                "http": tavily_settings.proxy,
-                "https": tavily_settings.proxy,
-            }
-
         # Store timeout for use in service methods
         self._timeout: int = tavily_settings.timeout
+        self._timeouts = tavily_settings.timeouts
+
+        # Pooled HTTP client shared by every SDK call made through this service
+        self._http_client: httpx.AsyncClient = create_pooled_client(
+            timeout_seconds=tavily_settings.timeout,
+            max_connections=tavily_settings.max_connections,
+            max_keepalive_connections=tavily_settings.max_keepalive_connections,
+            keepalive_expiry=tavily_settings.keepalive_expiry,
+            http2=tavily_settings.http2,
+            proxy=tavily_settings.proxy,
+        )
+
+        # The SDK sends one flat timeout per call; split it per endpoint type
+        self._http_client.event_hooks = {"request": [self._apply_phase_timeouts]}
 
-        # Initialize the async client
+        # Initialize the async client on top of the pooled HTTP client
         self._client: AsyncTavilyClient = AsyncTavilyClient(
             api_key=tavily_settings.api_key,
-            proxies=proxies,
+            client=self._http_client,
         )
 
+        # Response cache shared by all requests served by this service
+        self._cache: CacheBackend | None = None
+        if tavily_settings.cache_backend != "none":
+            self._cache = create_cache_backend(
+                tavily_settings.cache_backend,
+                max_entries=tavily_settings.cache_max_entries,
+                redis_url=settings.REDIS_URL,
+            )
+        self._search_cache_ttl: int = tavily_settings.search_cache_ttl
+        self._extract_cache_ttl: int = tavily_settings.extract_cache_ttl
+        self._extract_cache_domain_ttls: dict[str, int] = {
+            domain.lower().lstrip("."): ttl
+            for domain, ttl in tavily_settings.extract_cache_domain_ttls.items()
+        }
+        self._extract_cache_compress: bool = tavily_settings.extract_cache_compress
+
+        # Upstream-sized fan-out for large extract URL lists
+        self._extract_chunk_size: int = tavily_settings.extract_chunk_size
+        self._extract_max_concurrency: int = tavily_settings.extract_max_concurrency
+
+        # Coalesces identical upstream calls that are in flight concurrently
+        self._inflight: SingleFlight[dict[str, Any]] = SingleFlight()
+
+        self._rate_limiter: RateLimiter | None = rate_limiter
+
+        # Retries transient failures of the idempotent endpoints
+        self._retry = create_retry_policy("tavily")
+
+        # Optional backup requests for basic searches stuck in the latency tail
+        self._search_hedge: HedgePolicy | None = None
+        if tavily_settings.search_hedging:
+            self._search_hedge = HedgePolicy(
+                percentile=tavily_settings.search_hedge_percentile,
+                initial_delay=tavily_settings.search_hedge_initial_delay,
+                budget_ratio=tavily_settings.search_hedge_budget,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and cache, releasing their resources."""
+        await self._http_client.aclose()
+        if self._cache is not None:
+            await self._cache.aclose()
+
+    def _read_timeout(self, endpoint: str) -> float:
+        """Return the configured read timeout of the endpoint type."""
+        config = self._timeouts.get(endpoint)
+        return config.read if config is not None else self._timeout
+
+    async def _apply_phase_timeouts(self, request: httpx.Request) -> None:
+        """Apply the endpoint type's connect and pool timeouts to a request.
+
+        The SDK passes a single timeout (the read timeout, already capped by
+        the request deadline) that httpx would use for every phase.
+        """
+        config = self._timeouts.get(request.url.path.strip("/"))
+        if config is None:
+            return
+        timeout = dict(request.extensions.get("timeout", {}))
+        for phase, limit in (("connect", config.connect), ("pool", config.pool)):
+            current = timeout.get(phase)
+            timeout[phase] = limit if current is None else min(current, limit)
+        request.extensions["timeout"] = timeout
+
+    async def _throttle(self, endpoint: str) -> None:
+        """Take a rate limit token for one upstream call to the endpoint."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire("tavily", endpoint)
+
+    async def _call(
+        self,
+        endpoint: str,
+        send: Callable[..., Awaitable[dict[str, Any]]],
+        *,
+        timeout: float,
+        retry: bool = True,
+        hedge: HedgePolicy | None = None,
+    ) -> dict[str, Any]:
+        """Make one upstream call, rate limited and retried when idempotent.
+
+        Each attempt, including retries and hedges, takes its own rate limit
+        token and is called with the timeout keyword, capped by the time
+        left until the request deadline. With a hedge policy, each attempt
+        may send a backup request. The call as a whole goes through the
+        Tavily circuit breaker.
+
+        Raises:
+            TavilyAPIError: If the circuit breaker is open (503) or the
+                request deadline has passed (504).
+        """
+
+        async def throttled_send() -> dict[str, Any]:
+            await self._throttle(endpoint)
+            return await send(timeout=bound(timeout))
+
+        async def attempt() -> dict[str, Any]:
+            if hedge is None:
+                return await throttled_send()
+            return await hedge.call(f"tavily.{endpoint}", throttled_send)
+
+        async def attempts() -> dict[str, Any]:
+            if not retry:
+                return await attempt()
+            return await self._retry.call(endpoint, attempt)
+
+        try:
+            return await circuit_breakers["tavily"].call(
+                attempts, is_failure=_is_upstream_failure
+            )
+        except CircuitOpenError as exc:
+            raise TavilyAPIError.service_unavailable(
+                details={"retry_after": exc.retry_after}
+            ) from exc
+        except DeadlineExceeded as exc:
+            raise TavilyAPIError.request_timeout(
+                message="Request deadline exceeded before Tavily answered.",
+                details={"original_error": str(exc)},
+            ) from exc
+
+    async def _cache_get(self, key: str) -> dict[str, Any] | None:
+        """Read and decode a cached response, treating cache errors as misses."""
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.get(key)
+        except Exception:
+            logger.warning("Tavily cache read failed", exc_info=True)
+            return None
+        if cached is None:
+            return None
+        # Plain entries are JSON objects; anything else is zlib-compressed
+        if not cached.startswith(b"{"):
+            cached = zlib.decompress(cached)
+        result: dict[str, Any] = json.loads(cached)
+        return result
+
+    async def _cache_set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ttl: float,
+        *,
+        compress: bool = False,
+    ) -> None:
+        """Encode and store a response, ignoring cache errors."""
+        if self._cache is None:
+            return
+        encoded = json.dumps(value).encode("utf-8")
+        if compress:
+            encoded = zlib.compress(encoded)
+        try:
+            await self._cache.set(key, encoded, ttl)
+        except Exception:
+            logger.warning("Tavily cache write failed", exc_info=True)
+
+    def _extract_ttl_for(self, url: str) -> int:
+        """Return the cache TTL for an extracted URL.
+
+        The most specific entry in extract_cache_domain_ttls whose domain
+        equals the URL host or is a parent of it wins; otherwise the default
+        extract_cache_ttl applies.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        labels = host.split(".")
+        for i in range(len(labels)):
+            ttl = self._extract_cache_domain_ttls.get(".".join(labels[i:]))
+            if ttl is not None:
+                return ttl
+        return self._extract_cache_ttl
+
     async def search(
         self,
         query: str,
@@ -99,6 +416,12 @@ class TavilyService:
                 Example: ["pinterest.com", "facebook.com"]. Default: None.
             timeout: Request timeout in seconds. Uses configured default if None.
 
+        Responses are served from the response cache when an identical
+        request (same query, options and domain sets) was answered within
+        search_cache_ttl seconds. The outcome is recorded via set_cache_status.
+        Concurrent identical requests that miss the cache share one upstream
+        call.
+
         Returns:
             dict containing search results with keys:
             - query: The original search query
@@ -106,22 +429,59 @@ class TavilyService:
             - answer: AI-generated answer (if include_answer=True)
             - images: List of image objects (if include_images=True)
         """
-        effective_timeout = timeout if timeout is not None else self._timeout
-
-        result: dict[str, Any] = await self._client.search(
-            query=query,
-            search_depth=search_depth,
-            topic=topic,
-            max_results=max_results,
-            include_images=include_images,
-            include_image_descriptions=include_image_descriptions,
-            include_answer=include_answer,
-            include_raw_content=include_raw_content,
-            include_domains=include_domains,
-            exclude_domains=exclude_domains,
-            timeout=effective_timeout,
+        effective_timeout = (
+            timeout if timeout is not None else self._read_timeout("search")
+        )
+
+        cache_key = make_cache_key(
+            "tavily:search",
+            {
+                "query": query.strip(),
+                "search_depth": search_depth,
+                "topic": topic,
+                "max_results": max_results,
+                "include_images": include_images,
+                "include_image_descriptions": include_image_descriptions,
+                "include_answer": include_answer,
+                "include_raw_content": include_raw_content,
+                "include_domains": sorted(d.lower() for d in include_domains or []),
+                "exclude_domains": sorted(d.lower() for d in exclude_domains or []),
+            },
         )
-        return result
+
+        if self._cache is None:
+            set_cache_status(CacheStatus.BYPASS)
+        else:
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                set_cache_status(CacheStatus.HIT)
+                return cached
+            set_cache_status(CacheStatus.MISS)
+
+        async def fetch() -> dict[str, Any]:
+            result: dict[str, Any] = await self._call(
+                "search",
+                partial(
+                    self._client.search,
+                    query=query,
+                    search_depth=search_depth,
+                    topic=topic,
+                    max_results=max_results,
+                    include_images=include_images,
+                    include_image_descriptions=include_image_descriptions,
+                    include_answer=include_answer,
+                    include_raw_content=include_raw_content,
+                    include_domains=include_domains,
+                    exclude_domains=exclude_domains,
+                ),
+                timeout=effective_timeout,
+                # Advanced searches cost more credits and are slow by design
+                hedge=self._search_hedge if search_depth == "basic" else None,
+            )
+            await self._cache_set(cache_key, result, self._search_cache_ttl)
+            return result
+
+        return await self._inflight.do(cache_key, fetch)
 
     async def extract(
         self,
@@ -139,6 +499,16 @@ class TavilyService:
                 Example: "https://example.com" or ["https://a.com", "https://b.com"]
             timeout: Request timeout in seconds. Uses configured default if None.
 
+        Results are cached per requested URL, so only URLs without a fresh
+        cached result are sent upstream; cached and fresh results are merged
+        back in the requested order and upstream failed_results are
+        preserved. A result that upstream reports under another URL (e.g.
+        after a redirect) is cached under the URL it answers. TTLs can be
+        overridden per domain. The outcome is recorded via
+        set_cache_status. Missing URLs are split into chunks of at most
+        extract_chunk_size and extracted concurrently, so a chunk that fails
+        or times out only fails its own URLs.
+
         Returns:
             dict containing extraction results with keys:
             - results: List of extraction result objects, each containing:
@@ -146,13 +516,121 @@ class TavilyService:
                 - raw_content: Extracted text content
                 - images: List of image URLs found (if any)
         """
-        effective_timeout = timeout if timeout is not None else self._timeout
+        effective_timeout = (
+            timeout if timeout is not None else self._read_timeout("extract")
+        )
+        url_list = list(dict.fromkeys([urls] if isinstance(urls, str) else urls))
+
+        cached_results: dict[str, dict[str, Any]] = {}
+        if self._cache is None:
+            set_cache_status(CacheStatus.BYPASS)
+        else:
+            for url in url_list:
+                cached = await self._cache_get(_extract_cache_key(url))
+                if cached is not None:
+                    cached_results[url] = cached
+            if len(cached_results) == len(url_list):
+                set_cache_status(CacheStatus.HIT)
+            elif cached_results:
+                set_cache_status(CacheStatus.PARTIAL)
+            else:
+                set_cache_status(CacheStatus.MISS)
+
+        missing = [url for url in url_list if url not in cached_results]
+        if not missing:
+            return {
+                "results": [cached_results[url] for url in url_list],
+                "failed_results": [],
+            }
 
-        result: dict[str, Any] = await self._client.extract(
-            urls=urls,
-            timeout=effective_timeout,
+        chunks = [
+            missing[i : i + self._extract_chunk_size]
+            for i in range(0, len(missing), self._extract_chunk_size)
+        ]
+        if len(chunks) == 1:
+            fresh = await self._extract_chunk(chunks[0], effective_timeout)
+            if not cached_results:
+                return fresh
+        else:
+            fresh = await self._extract_chunks(chunks, effective_timeout)
+
+        # Merge cached and fresh results back into the requested order
+        fresh_by_url, unmatched = _match_extract_results(missing, fresh)
+        merged: list[dict[str, Any]] = []
+        for url in url_list:
+            if url in cached_results:
+                merged.append(cached_results[url])
+            elif url in fresh_by_url:
+                merged.append(fresh_by_url[url])
+        # Keep results that answer no requested URL rather than drop them
+        merged.extend(unmatched)
+        return {**fresh, "results": merged}
+
+    async def _extract_chunk(self, urls: list[str], timeout: float) -> dict[str, Any]:
+        """Extract one upstream-sized chunk of URLs and cache its results.
+
+        Concurrent calls for the same chunk share one upstream request.
+        """
+
+        async def fetch() -> dict[str, Any]:
+            result: dict[str, Any] = await self._call(
+                "extract",
+                partial(
+                    self._client.extract,
+                    urls=urls,
+                ),
+                timeout=timeout,
+            )
+            # Cache under the requested URL, which is what lookups use
+            matched, _ = _match_extract_results(urls, result)
+            for url, item in matched.items():
+                await self._cache_set(
+                    _extract_cache_key(url),
+                    item,
+                    self._extract_ttl_for(url),
+                    compress=self._extract_cache_compress,
+                )
+            return result
+
+        request_key = make_cache_key("tavily:extract", {"urls": urls})
+        return await self._inflight.do(request_key, fetch)
+
+    async def _extract_chunks(
+        self, chunks: list[list[str]], timeout: float
+    ) -> dict[str, Any]:
+        """Extract several chunks concurrently and combine their responses.
+
+        At most extract_max_concurrency chunks are in flight at once. A chunk
+        that raises (e.g. times out) is reported as failed_results for its
+        own URLs only; the error is re-raised only if every chunk failed.
+        """
+        semaphore = asyncio.Semaphore(self._extract_max_concurrency)
+
+        async def run(chunk: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._extract_chunk(chunk, timeout)
+
+        outcomes = await asyncio.gather(
+            *(run(chunk) for chunk in chunks), return_exceptions=True
         )
-        return result
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if len(errors) == len(outcomes):
+            raise errors[0]
+
+        results: list[dict[str, Any]] = []
+        failed_results: list[dict[str, Any]] = []
+        for chunk, outcome in zip(chunks, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Tavily extract chunk of %d URLs failed: %s", len(chunk), outcome
+                )
+                failed_results.extend(
+                    {"url": url, "error": str(outcome)} for url in chunk
+                )
+            else:
+                results.extend(outcome.get("results", []))
+                failed_results.extend(outcome.get("failed_results", []))
+        return {"results": results, "failed_results": failed_results}
 
     async def crawl(
         self,
@@ -195,17 +673,24 @@ class TavilyService:
             - results: List of crawled page objects with content
             - total_pages: Number of pages crawled
         """
-        effective_timeout = timeout if timeout is not None else self._timeout
-
-        result: dict[str, Any] = await self._client.crawl(
-            url=url,
-            max_depth=max_depth,
-            max_breadth=max_breadth,
-            limit=limit,
-            instructions=instructions,
-            select_paths=select_paths,
-            select_domains=select_domains,
+        effective_timeout = (
+            timeout if timeout is not None else self._read_timeout("crawl")
+        )
+
+        result: dict[str, Any] = await self._call(
+            "crawl",
+            partial(
+                self._client.crawl,
+                url=url,
+                max_depth=max_depth,
+                max_breadth=max_breadth,
+                limit=limit,
+                instructions=instructions,
+                select_paths=select_paths,
+                select_domains=select_domains,
+            ),
             timeout=effective_timeout,
+            retry=False,
         )
         return result
 
@@ -252,16 +737,22 @@ class TavilyService:
             - urls: List of discovered URL strings
             - total_urls: Number of URLs discovered
         """
-        effective_timeout = timeout if timeout is not None else self._timeout
-
-        result: dict[str, Any] = await self._client.map(
-            url=url,
-            max_depth=max_depth,
-            max_breadth=max_breadth,
-            limit=limit,
-            instructions=instructions,
-            select_paths=select_paths,
-            select_domains=select_domains,
+        effective_timeout = (
+            timeout if timeout is not None else self._read_timeout("map")
+        )
+
+        result: dict[str, Any] = await self._call(
+            "map",
+            partial(
+                self._client.map,
+                url=url,
+                max_depth=max_depth,
+                max_breadth=max_breadth,
+                limit=limit,
+                instructions=instructions,
+                select_paths=select_paths,
+                select_domains=select_domains,
+            ),
             timeout=effective_timeout,
         )
         return result
@@ -0,0 +1,102 @@
+"""Tests for the Gemini deep research event stream route.
+
+The route is served by a GeminiJobSupervisor whose upstream polls go to an
+httpx.MockTransport, so stream behaviour on upstream failures is covered
+without network access.
+"""
+
+import json
+from collections.abc import Generator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_gemini_supervisor
+from app.core.config import settings
+from app.main import app
+from app.services.gemini_jobs import GeminiJobSupervisor
+from tests.utils.gemini import ScriptedGemini, create_poll_response
+
+
+@pytest.fixture(autouse=True)
+def gemini_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure fast polls and no retries inside a poll."""
+    monkeypatch.setattr(settings.gemini, "min_poll_interval", 0.01)
+    monkeypatch.setattr(settings.gemini, "max_poll_interval", 0.02)
+    monkeypatch.setattr(settings, "RETRY_MAX_ATTEMPTS", 1)
+
+
+@pytest.fixture
+def client_with_scripted_gemini(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[Any, None, None]:
+    """Create test clients whose supervisor polls a scripted Gemini."""
+    clients: list[tuple[TestClient, GeminiJobSupervisor]] = []
+
+    def create(script: ScriptedGemini) -> TestClient:
+        supervisor = GeminiJobSupervisor(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(script))
+        )
+        app.dependency_overrides[get_gemini_supervisor] = lambda: supervisor
+        client = TestClient(app)
+        client.__enter__()
+        # Set after startup, so the app's own supervisor resumes no stored jobs
+        monkeypatch.setattr(settings.gemini, "api_key", "test-key")
+        clients.append((client, supervisor))
+        return client
+
+    yield create
+    for client, supervisor in clients:
+        # Pollers run on the client's event loop
+        client.portal.call(supervisor.aclose)
+        client.__exit__(None, None, None)
+    app.dependency_overrides.clear()
+
+
+def parse_events(body: str) -> list[tuple[str, dict[str, Any]]]:
+    """Split a server-sent event stream into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_events_stream_reports_transient_error_and_continues(
+    client_with_scripted_gemini: Any, superuser_token_headers: dict[str, str]
+) -> None:
+    script = ScriptedGemini(
+        [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json=create_poll_response("completed", "e1")),
+        ]
+    )
+    client = client_with_scripted_gemini(script)
+
+    response = client.get(
+        f"{settings.API_V1_STR}/gemini/deep-research/job-1/events",
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    events = parse_events(response.text)
+    assert events[0][0] == "error"
+    assert "HTTP 503" in events[0][1]["message"]
+    assert events[-1][1]["status"] == "completed"
+    assert len(script.requests) == 2
+
+
+def test_events_stream_maps_unknown_interaction_to_status(
+    client_with_scripted_gemini: Any, superuser_token_headers: dict[str, str]
+) -> None:
+    script = ScriptedGemini([httpx.Response(404, text="not found")])
+    client = client_with_scripted_gemini(script)
+
+    response = client.get(
+        f"{settings.API_V1_STR}/gemini/deep-research/job-1/events",
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 404
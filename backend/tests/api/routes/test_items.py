@@ -1,10 +1,15 @@
 import uuid
+from datetime import datetime
 
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from app import crud
 from app.core.config import settings
+from app.models import Item, ItemCreate, UserUpdate
 from tests.utils.item import create_random_item
+from tests.utils.user import create_random_user, user_authentication_headers
+from tests.utils.utils import random_lower_string
 
 
 def test_create_item(
@@ -79,6 +84,95 @@ def test_read_items(
     assert len(content["data"]) >= 2
 
 
+def create_user_with_items(
+    client: TestClient, db: Session, count: int
+) -> tuple[dict[str, str], list[Item]]:
+    password = random_lower_string()
+    user = create_random_user(db)
+    crud.update_user(session=db, db_user=user, user_in=UserUpdate(password=password))
+    items = [
+        crud.create_item(
+            session=db,
+            item_in=ItemCreate(title=random_lower_string()),
+            owner_id=user.id,
+        )
+        for _ in range(count)
+    ]
+    items.sort(key=lambda item: (item.created_at, item.id), reverse=True)
+    headers = user_authentication_headers(
+        client=client, email=user.email, password=password
+    )
+    return headers, items
+
+
+def test_read_items_with_cursor(client: TestClient, db: Session) -> None:
+    headers, items = create_user_with_items(client, db, count=5)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/", headers=headers, params={"limit": 2}
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == 5
+    assert content["prev_cursor"] is None
+
+    seen = [item["id"] for item in content["data"]]
+    while content["next_cursor"]:
+        response = client.get(
+            f"{settings.API_V1_STR}/items/",
+            headers=headers,
+            params={"limit": 2, "cursor": content["next_cursor"]},
+        )
+        assert response.status_code == 200
+        content = response.json()
+        assert content["count"] is None
+        seen += [item["id"] for item in content["data"]]
+
+    assert seen == [str(item.id) for item in items]
+
+
+def test_read_items_with_prev_cursor(client: TestClient, db: Session) -> None:
+    headers, items = create_user_with_items(client, db, count=4)
+    first_page = client.get(
+        f"{settings.API_V1_STR}/items/", headers=headers, params={"limit": 2}
+    ).json()
+    second_page = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=headers,
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    ).json()
+    assert second_page["next_cursor"] is None
+
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=headers,
+        params={
+            "limit": 2,
+            "cursor": second_page["prev_cursor"],
+            "include_count": True,
+        },
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["data"] == first_page["data"]
+    assert content["count"] == 4
+    assert content["prev_cursor"] is None
+    assert [item["id"] for item in content["data"]] == [
+        str(item.id) for item in items[:2]
+    ]
+
+
+def test_read_items_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
 def test_update_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -95,6 +189,7 @@ def test_update_item(
     assert content["description"] == data["description"]
     assert content["id"] == str(item.id)
     assert content["owner_id"] == str(item.owner_id)
+    assert datetime.fromisoformat(content["updated_at"]) > item.updated_at
 
 
 def test_update_item_not_found(
@@ -2,14 +2,18 @@
 
 This module contains comprehensive tests for all Tavily endpoints:
 - POST /tavily/search - Web search functionality
+- POST /tavily/search/batch - Concurrent multi-query search
 - POST /tavily/extract - URL content extraction
 - POST /tavily/crawl - Website crawling
+- POST /tavily/crawl/stream - Streaming website crawling
 - POST /tavily/map - URL mapping/sitemap generation
 
 Tests use mocked TavilyService to ensure fast, deterministic execution.
 Integration tests with real API calls are marked with @pytest.mark.integration.
 """
 
+import json
+import uuid
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -18,8 +22,11 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api.deps import get_tavily_service
+from app.core.cache import CacheStatus, set_cache_status
 from app.core.config import settings
 from app.main import app
+from app.models import User
+from app.services.tavily import TavilyService
 
 # =============================================================================
 # Mock Response Factories
@@ -197,6 +204,30 @@ class TestSearchEndpoint:
         assert data["query"] == query
         assert data["answer"] is not None
 
+    def test_search_reports_cache_status_header(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test search exposes the service cache outcome in X-Cache."""
+        query = "cached query"
+
+        def cached_search(**_kwargs: Any) -> dict[str, Any]:
+            set_cache_status(CacheStatus.HIT)
+            return create_mock_search_response(query=query)
+
+        mock_tavily_service.search.side_effect = cached_search
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search",
+            headers=superuser_token_headers,
+            json={"query": query},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "HIT"
+
     def test_search_unauthenticated(
         self,
         client_with_mock_tavily: TestClient,
@@ -317,6 +348,135 @@ class TestSearchEndpoint:
         assert data["error_code"] == "tavily_api_error"
 
 
+# =============================================================================
+# Batch Search Endpoint Tests
+# =============================================================================
+
+
+class TestSearchBatchEndpoint:
+    """Tests for POST /tavily/search/batch endpoint."""
+
+    @staticmethod
+    def _search_or_fail(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["query"] == "failing query":
+            raise Exception("Rate limit exceeded")
+        return create_mock_search_response(query=kwargs["query"])
+
+    def test_search_batch_returns_results_in_order(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test batch results keep request order and isolate failures."""
+        mock_tavily_service.search.side_effect = self._search_or_fail
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={
+                "searches": [
+                    {"query": "first"},
+                    {"query": "failing query"},
+                    {"query": "third", "max_results": 3},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert results[0]["response"]["query"] == "first"
+        assert results[1]["response"] is None
+        assert results[1]["error"]["error_code"] == "rate_limit_exceeded"
+        assert results[2]["response"]["query"] == "third"
+        assert mock_tavily_service.search.call_count == 3
+
+    def test_search_batch_streams_ndjson(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streaming mode emits one JSON result per line."""
+        mock_tavily_service.search.side_effect = self._search_or_fail
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={
+                "searches": [{"query": "first"}, {"query": "failing query"}],
+                "stream": True,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1]
+
+    def test_search_batch_reports_malformed_result(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test a malformed upstream result becomes an error entry."""
+
+        def search_or_malformed(**kwargs: Any) -> dict[str, Any]:
+            if kwargs["query"] == "malformed":
+                return {"answer": "missing query and results"}
+            return create_mock_search_response(query=kwargs["query"])
+
+        mock_tavily_service.search.side_effect = search_or_malformed
+
+        for stream in (False, True):
+            response = client_with_mock_tavily.post(
+                f"{settings.API_V1_STR}/tavily/search/batch",
+                headers=superuser_token_headers,
+                json={
+                    "searches": [{"query": "first"}, {"query": "malformed"}],
+                    "stream": stream,
+                },
+            )
+
+            assert response.status_code == 200
+            if stream:
+                lines = [json.loads(line) for line in response.text.splitlines()]
+                results = sorted(lines, key=lambda line: line["index"])
+            else:
+                results = response.json()["results"]
+            assert results[0]["response"]["query"] == "first"
+            assert results[1]["response"] is None
+            assert results[1]["error"]["error_code"] == "invalid_request"
+
+    def test_search_batch_empty_list(
+        self,
+        client_with_mock_tavily: TestClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test batch with no searches returns 422."""
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={"searches": []},
+        )
+
+        assert response.status_code == 422
+
+    def test_search_batch_unauthenticated(
+        self,
+        client_with_mock_tavily: TestClient,
+    ) -> None:
+        """Test batch search without auth headers returns 401."""
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            json={"searches": [{"query": "test"}]},
+        )
+
+        assert response.status_code == 401
+
+
 # =============================================================================
 # Extract Endpoint Tests
 # =============================================================================
@@ -375,6 +535,30 @@ class TestExtractEndpoint:
         assert len(data["results"]) == 3
         assert data["failed_results"] == []
 
+    def test_extract_reports_cache_status_header(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test extract exposes a partial per-URL cache hit in X-Cache."""
+        urls = ["https://example1.com/page", "https://example2.com/page"]
+
+        def partially_cached_extract(**_kwargs: Any) -> dict[str, Any]:
+            set_cache_status(CacheStatus.PARTIAL)
+            return create_mock_extract_response(urls)
+
+        mock_tavily_service.extract.side_effect = partially_cached_extract
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/extract",
+            headers=superuser_token_headers,
+            json={"urls": urls},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "PARTIAL"
+
     def test_extract_unauthenticated(
         self,
         client_with_mock_tavily: TestClient,
@@ -601,6 +785,96 @@ class TestCrawlEndpoint:
         data = response.json()
         assert data["error_code"] == "rate_limit_exceeded"
 
+    def test_crawl_stream_ndjson(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streaming crawl emits one CrawlResult per NDJSON line."""
+        url = "https://example.com"
+        mock_tavily_service.crawl.return_value = create_mock_crawl_response(
+            url=url, num_pages=3
+        )
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl/stream",
+            headers=superuser_token_headers,
+            json={"url": url},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        pages = [json.loads(line) for line in response.text.splitlines()]
+        assert [p["url"] for p in pages] == [f"{url}/page{i}" for i in range(1, 4)]
+
+    def test_crawl_stream_sse(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streaming crawl emits SSE page events and a done event."""
+        mock_tavily_service.crawl.return_value = create_mock_crawl_response(num_pages=2)
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl/stream",
+            headers={**superuser_token_headers, "Accept": "text/event-stream"},
+            json={"url": "https://example.com"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [e for e in response.text.split("\n\n") if e]
+        assert [e.split("\n")[0] for e in events] == [
+            "event: page",
+            "event: page",
+            "event: done",
+        ]
+        assert json.loads(events[-1].split("data: ")[1])["total_pages"] == 2
+
+    def test_crawl_stream_reports_invalid_page_and_continues(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streaming crawl emits an error record for an invalid page."""
+        crawl_response = create_mock_crawl_response(num_pages=3)
+        del crawl_response["results"][1]["url"]
+        mock_tavily_service.crawl.return_value = crawl_response
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl/stream",
+            headers=superuser_token_headers,
+            json={"url": "https://example.com"},
+        )
+
+        assert response.status_code == 200
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[0]["url"] == "https://example.com/page1"
+        assert records[1]["error_code"] == "tavily_api_error"
+        assert records[1]["details"]["errors"][0]["loc"] == ["url"]
+        assert records[2]["url"] == "https://example.com/page3"
+
+    def test_crawl_stream_error_before_streaming(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streaming crawl maps upstream errors to status codes."""
+        mock_tavily_service.crawl.side_effect = Exception("rate limit exceeded")
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl/stream",
+            headers=superuser_token_headers,
+            json={"url": "https://example.com"},
+        )
+
+        assert response.status_code == 429
+        assert response.json()["error_code"] == "rate_limit_exceeded"
+
 
 # =============================================================================
 # Map Endpoint Tests
@@ -722,6 +996,50 @@ class TestMapEndpoint:
         assert data["error_code"] == "tavily_api_error"
 
 
+# =============================================================================
+# Service Lifecycle Tests
+# =============================================================================
+
+
+class TestTavilyServiceLifecycle:
+    """Tests for the app-scoped TavilyService created by the lifespan."""
+
+    @pytest.fixture
+    def lifespan_client(self) -> Generator[TestClient, None, None]:
+        """Run a lifespan of its own; other clients in this module close theirs."""
+        with TestClient(app) as client:
+            yield client
+
+    def test_service_is_shared_across_requests(
+        self, lifespan_client: TestClient
+    ) -> None:
+        """Test the dependency returns the same pooled service every time."""
+        request = MagicMock()
+        request.app = app
+        current_user = User(
+            id=uuid.uuid4(), email="lifecycle@example.com", hashed_password="x"
+        )
+
+        async def resolve() -> TavilyService:
+            dependency = get_tavily_service(request, current_user)
+            service = await anext(dependency)
+            await dependency.aclose()
+            return service
+
+        first = lifespan_client.portal.call(resolve)
+        second = lifespan_client.portal.call(resolve)
+
+        assert isinstance(first, TavilyService)
+        assert first is second
+
+    def test_service_uses_pooled_http_client(self, lifespan_client: TestClient) -> None:
+        """Test the SDK client is bound to the service's pooled HTTP client."""
+        service: TavilyService = app.state.tavily_service
+
+        assert service._client._client is service._http_client
+        assert not service._http_client.is_closed
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
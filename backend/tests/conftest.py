@@ -1,17 +1,39 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core import auth_cache
+from app.core.circuit_breaker import circuit_breakers
 from app.core.config import settings
-from app.core.db import engine, init_db
+from app.core.db import async_engine, engine, init_db
 from app.main import app
 from app.models import Item, User
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers() -> Generator[None, None, None]:
+    yield
+    for breaker in circuit_breakers.values():
+        breaker.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_cache() -> Generator[None, None, None]:
+    yield
+    auth_cache.token_cache.clear()
+    auth_cache.user_cache.clear()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
@@ -24,6 +46,14 @@ def db() -> Generator[Session, None, None]:
         session.commit()
 
 
+@pytest.fixture
+async def async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+    # Pooled connections are bound to the event loop of this test
+    await async_engine.dispose()
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
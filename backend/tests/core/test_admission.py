@@ -0,0 +1,84 @@
+"""Unit tests for the upstream admission control limiter."""
+
+import asyncio
+
+import pytest
+
+from app.core.admission import ConcurrencyLimiter
+from app.core.metrics import metrics
+from app.exceptions.admission import AdmissionError
+
+pytestmark = pytest.mark.anyio
+
+
+def create_limiter(queue_timeout: float = 0.0) -> ConcurrencyLimiter:
+    return ConcurrencyLimiter(
+        limits={"perplexity": (3, 2)}, queue_timeout=queue_timeout, retry_after=7
+    )
+
+
+async def test_per_user_limit_rejects_with_retry_after() -> None:
+    limiter = create_limiter()
+
+    async with limiter.acquire("perplexity", "alice"):
+        async with limiter.acquire("perplexity", "alice"):
+            with pytest.raises(AdmissionError) as exc_info:
+                async with limiter.acquire("perplexity", "alice"):
+                    pass
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 7
+    assert exc_info.value.details == {"provider": "perplexity", "scope": "user"}
+
+
+async def test_provider_limit_applies_across_users() -> None:
+    limiter = create_limiter()
+
+    async with limiter.acquire("perplexity", "alice"):
+        async with limiter.acquire("perplexity", "alice"):
+            async with limiter.acquire("perplexity", "bob"):
+                with pytest.raises(AdmissionError) as exc_info:
+                    async with limiter.acquire("perplexity", "carol"):
+                        pass
+
+    assert exc_info.value.details == {"provider": "perplexity", "scope": "provider"}
+
+
+async def test_slots_released_after_block() -> None:
+    limiter = create_limiter()
+
+    for _ in range(5):
+        async with limiter.acquire("perplexity", "alice"):
+            pass
+
+    assert limiter._user_slots == {}
+
+
+async def test_queue_timeout_waits_for_free_slot() -> None:
+    limiter = create_limiter(queue_timeout=1.0)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.acquire("perplexity", "alice"):
+            await release.wait()
+
+    holders = [asyncio.create_task(hold()) for _ in range(2)]
+    await asyncio.sleep(0)
+    asyncio.get_running_loop().call_later(0.01, release.set)
+
+    async with limiter.acquire("perplexity", "alice"):
+        pass
+    await asyncio.gather(*holders)
+
+
+async def test_queue_timeout_expires() -> None:
+    limiter = create_limiter(queue_timeout=0.01)
+    metrics.reset()
+
+    async with limiter.acquire("perplexity", "alice"):
+        async with limiter.acquire("perplexity", "alice"):
+            with pytest.raises(AdmissionError):
+                async with limiter.acquire("perplexity", "alice"):
+                    pass
+
+    assert metrics.counter("admission.rejected", provider="perplexity", scope="user")
@@ -0,0 +1,54 @@
+"""Unit tests for the token and user caches behind get_current_user."""
+
+import time
+
+import pytest
+
+from app.core import auth_cache
+from app.core.auth_cache import TTLCache, cache_token, get_cached_token
+from app.core.config import settings
+from app.models import TokenPayload
+
+
+def test_entries_expire_after_ttl() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10)
+
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=2)
+
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_token_is_not_cached_past_its_expiry() -> None:
+    auth_cache.token_cache.clear()
+    payload = TokenPayload(sub="user-id")
+
+    cache_token("fresh", payload, expires_at=time.time() + 3600)
+    cache_token("expired", payload, expires_at=time.time() - 1)
+
+    assert get_cached_token("fresh") == payload
+    assert get_cached_token("expired") is None
+
+
+def test_zero_ttl_disables_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth_cache.token_cache.clear()
+    monkeypatch.setattr(settings, "AUTH_CACHE_TTL", 0.0)
+
+    cache_token("token", TokenPayload(sub="user-id"), expires_at=None)
+
+    assert get_cached_token("token") is None
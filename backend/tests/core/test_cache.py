@@ -0,0 +1,50 @@
+"""Unit tests for response cache utilities."""
+
+import time
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend, make_cache_key
+
+
+def test_make_cache_key_is_order_independent() -> None:
+    first = make_cache_key("ns", {"query": "q", "topic": "general"})
+    second = make_cache_key("ns", {"topic": "general", "query": "q"})
+    assert first == second
+    assert first.startswith("ns:")
+
+
+def test_make_cache_key_differs_by_namespace() -> None:
+    assert make_cache_key("a", {"query": "q"}) != make_cache_key("b", {"query": "q"})
+
+
+@pytest.mark.anyio
+async def test_memory_cache_get_set() -> None:
+    cache = MemoryCacheBackend(max_entries=2)
+    assert await cache.get("missing") is None
+    await cache.set("key", b"value", ttl=60)
+    assert await cache.get("key") == b"value"
+
+
+@pytest.mark.anyio
+async def test_memory_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = MemoryCacheBackend(max_entries=2)
+    now = time.monotonic()
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now)
+    await cache.set("key", b"value", ttl=10)
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now + 11)
+    assert await cache.get("key") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCacheBackend(max_entries=2)
+    await cache.set("a", b"1", ttl=60)
+    await cache.set("b", b"2", ttl=60)
+    # Touch "a" so "b" becomes the least recently used entry
+    assert await cache.get("a") == b"1"
+    await cache.set("c", b"3", ttl=60)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1"
+    assert await cache.get("c") == b"3"
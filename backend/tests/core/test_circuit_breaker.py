@@ -0,0 +1,106 @@
+"""Unit tests for the upstream circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.exceptions.admission import AdmissionError
+
+pytestmark = pytest.mark.anyio
+
+
+async def respond(status_code: int) -> httpx.Response:
+    return httpx.Response(status_code)
+
+
+async def fail_to_connect() -> httpx.Response:
+    raise httpx.ConnectError("connection refused")
+
+
+async def open_breaker(breaker: CircuitBreaker, failures: int = 3) -> None:
+    for _ in range(failures):
+        await breaker.call(lambda: respond(503))
+
+
+async def test_consecutive_failures_open_the_circuit() -> None:
+    breaker = CircuitBreaker("tavily", failure_threshold=3, recovery_timeout=60)
+
+    await open_breaker(breaker)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await breaker.call(lambda: respond(200))
+    assert exc_info.value.retry_after == 60
+    assert breaker.snapshot()["state"] == "open"
+
+
+async def test_success_resets_the_failure_count() -> None:
+    breaker = CircuitBreaker("tavily", failure_threshold=3)
+
+    for _ in range(2):
+        await breaker.call(lambda: respond(502))
+    await breaker.call(lambda: respond(200))
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await breaker.call(fail_to_connect)
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_client_errors_and_local_rejections_do_not_count() -> None:
+    breaker = CircuitBreaker("tavily", failure_threshold=1)
+
+    async def rejected() -> httpx.Response:
+        raise AdmissionError.rate_limit_exceeded("tavily", "search", retry_after=1)
+
+    await breaker.call(lambda: respond(400))
+    with pytest.raises(AdmissionError):
+        await breaker.call(rejected)
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_half_open_probe_success_closes_the_circuit() -> None:
+    breaker = CircuitBreaker("tavily", failure_threshold=3, recovery_timeout=0.01)
+    await open_breaker(breaker)
+    await asyncio.sleep(0.02)
+
+    response = await breaker.call(lambda: respond(200))
+
+    assert response.status_code == 200
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_half_open_probe_failure_reopens_the_circuit() -> None:
+    breaker = CircuitBreaker("tavily", failure_threshold=3, recovery_timeout=0.01)
+    await open_breaker(breaker)
+    await asyncio.sleep(0.02)
+
+    await breaker.call(lambda: respond(503))
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_half_open_admits_limited_probes() -> None:
+    breaker = CircuitBreaker(
+        "tavily", failure_threshold=3, recovery_timeout=0.01, half_open_max_calls=1
+    )
+    await open_breaker(breaker)
+    await asyncio.sleep(0.02)
+    release = asyncio.Event()
+
+    async def slow_probe() -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200)
+
+    probe = asyncio.create_task(breaker.call(slow_probe))
+    await asyncio.sleep(0)
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(lambda: respond(200))
+
+    release.set()
+    await probe
+    assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,26 @@
+"""Unit tests for settings that keep deprecated environment names."""
+
+import pytest
+
+from app.core.config import GeminiSettings
+
+
+def test_gemini_poll_interval_is_alias_of_max_poll_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GEMINI_POLL_INTERVAL", "10")
+
+    assert GeminiSettings().max_poll_interval == 10
+
+
+def test_gemini_max_poll_attempts_sets_poll_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GEMINI_POLL_INTERVAL", "10")
+    monkeypatch.setenv("GEMINI_MAX_POLL_ATTEMPTS", "360")
+
+    assert GeminiSettings().poll_deadline == 3600
+
+    monkeypatch.setenv("GEMINI_POLL_DEADLINE", "600")
+
+    assert GeminiSettings().poll_deadline == 600
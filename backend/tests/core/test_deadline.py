@@ -0,0 +1,82 @@
+"""Unit tests for request deadlines and per-operation upstream timeouts."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import deadline
+from app.core.circuit_breaker import is_upstream_failure
+from app.core.config import UpstreamTimeouts
+from app.core.deadline import DeadlineExceeded, DeadlineMiddleware, operation_timeout
+
+TIMEOUTS = {"poll": UpstreamTimeouts(connect=2, read=30, pool=3)}
+
+
+@contextmanager
+def request_deadline(timeout: float) -> Iterator[None]:
+    """Run the block with a deadline, without leaking it to other tests."""
+    deadline.set_deadline(timeout)
+    try:
+        yield
+    finally:
+        deadline.clear_deadline()
+
+
+def test_operation_timeout_splits_phases() -> None:
+    timeout = operation_timeout(TIMEOUTS, "poll", default=120)
+
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (
+        2,
+        30,
+        30,
+        3,
+    )
+
+
+def test_unconfigured_operation_uses_default() -> None:
+    timeout = operation_timeout(TIMEOUTS, "cancel", default=120)
+
+    assert (timeout.connect, timeout.read, timeout.pool) == (120, 120, 120)
+
+
+def test_deadline_caps_every_phase() -> None:
+    with request_deadline(1.0):
+        timeout = operation_timeout(TIMEOUTS, "poll", default=120)
+
+    assert timeout.read is not None and timeout.read <= 1.0
+    assert timeout.connect is not None and timeout.connect <= 1.0
+    assert timeout.pool is not None and timeout.pool <= 1.0
+
+
+def test_expired_deadline_fails_before_the_call() -> None:
+    with request_deadline(-1.0), pytest.raises(DeadlineExceeded):
+        operation_timeout(TIMEOUTS, "poll", default=120)
+
+
+def test_timeouts_after_the_deadline_do_not_trip_the_breaker() -> None:
+    error = httpx.ReadTimeout("timed out")
+
+    assert is_upstream_failure(error) is True
+    with request_deadline(-1.0):
+        assert is_upstream_failure(error) is None
+
+
+def test_middleware_sets_deadline_from_header() -> None:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/")
+    async def endpoint() -> dict[str, float | None]:
+        return {"remaining": deadline.remaining()}
+
+    client = TestClient(app)
+
+    remaining = client.get("/", headers={"X-Request-Timeout": "5"}).json()
+    assert 0 < remaining["remaining"] <= 5
+    assert client.get("/").json() == {"remaining": None}
+    invalid = client.get("/", headers={"X-Request-Timeout": "soon"}).json()
+    assert invalid == {"remaining": None}
@@ -0,0 +1,153 @@
+"""Unit tests for hedged upstream calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from app.core.hedging import HedgePolicy
+from app.core.metrics import metrics
+
+pytestmark = pytest.mark.anyio
+
+
+def outcome_count(outcome: str) -> float:
+    return metrics.counter("hedge.calls", operation="search", outcome=outcome)
+
+
+async def test_fast_call_is_not_hedged() -> None:
+    metrics.reset()
+    policy = HedgePolicy(initial_delay=0.5, budget_ratio=1.0)
+    calls = 0
+
+    async def fast() -> str:
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await policy.call("search", fast) == "ok"
+    assert calls == 1
+    assert outcome_count("not_needed") == 1
+
+
+async def test_slow_primary_loses_to_hedge_and_is_cancelled() -> None:
+    metrics.reset()
+    policy = HedgePolicy(initial_delay=0.01, budget_ratio=1.0)
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def first_slow() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "primary"
+        return "hedge"
+
+    assert await policy.call("search", first_slow) == "hedge"
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+    assert outcome_count("hedge_won") == 1
+
+
+async def test_exhausted_budget_awaits_the_primary() -> None:
+    metrics.reset()
+    policy = HedgePolicy(initial_delay=0.01, budget_ratio=0.0)
+    calls = 0
+
+    async def slow() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.03)
+        return "primary"
+
+    assert await policy.call("search", slow) == "primary"
+    assert calls == 1
+    assert outcome_count("budget_exhausted") == 1
+
+
+async def test_failed_primary_falls_back_to_hedge() -> None:
+    policy = HedgePolicy(initial_delay=0.01, budget_ratio=1.0)
+    calls = 0
+
+    async def primary_fails() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.03)
+            raise ConnectionError("reset")
+        await asyncio.sleep(0.05)
+        return "hedge"
+
+    assert await policy.call("search", primary_fails) == "hedge"
+
+
+async def test_both_failing_raises_the_primary_error() -> None:
+    policy = HedgePolicy(initial_delay=0.01, budget_ratio=1.0)
+    calls = 0
+
+    async def always_fails() -> str:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        await asyncio.sleep(0.03)
+        raise ConnectionError(f"attempt {attempt}")
+
+    with pytest.raises(ConnectionError, match="attempt 1"):
+        await policy.call("search", always_fails)
+
+
+async def test_hedge_and_cancelled_primary_record_own_latencies() -> None:
+    policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+    calls = 0
+
+    async def first_slow() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10 if calls == 1 else 0.01)
+        return "ok"
+
+    assert await policy.call("search", first_slow) == "ok"
+
+    # The hedge is timed from its own start; the cancelled primary is
+    # censored at no less than the hedge delay
+    hedge_latency, primary_latency = policy._latencies
+    assert hedge_latency < 0.05
+    assert primary_latency >= 0.05
+
+
+async def test_delay_holds_under_slow_tail() -> None:
+    policy = HedgePolicy(
+        percentile=90, initial_delay=0.02, budget_ratio=1.0, min_samples=10
+    )
+
+    def make_call(slow: bool) -> Callable[[], Awaitable[str]]:
+        attempts = 0
+
+        async def call() -> str:
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(10 if slow and attempts == 1 else 0.001)
+            return "ok"
+
+        return call
+
+    # One call in five has a primary far slower than the hedge delay
+    for i in range(40):
+        await policy.call("search", make_call(slow=i % 5 == 0))
+
+    # Without censored samples the fast hedges would pull p90 down to ~1ms
+    assert policy.delay() >= 0.02
+
+
+def test_delay_tracks_latency_percentile() -> None:
+    policy = HedgePolicy(percentile=90, initial_delay=2.0, min_samples=10)
+    assert policy.delay() == 2.0
+
+    policy._latencies.extend(float(i) for i in range(1, 11))
+
+    assert policy.delay() == 9.0
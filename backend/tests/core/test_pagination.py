@@ -0,0 +1,36 @@
+"""Unit tests for keyset pagination cursors."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import Cursor, InvalidCursorError
+
+
+def test_cursor_round_trips() -> None:
+    cursor = Cursor(
+        created_at=datetime(2026, 10, 17, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        id=uuid.uuid4(),
+        direction="prev",
+    )
+
+    encoded = cursor.encode()
+
+    assert "=" not in encoded
+    assert Cursor.decode(encoded) == cursor
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "not-a-cursor",
+        "",
+        Cursor(datetime.now(timezone.utc), uuid.uuid4()).encode()[:-4],
+        # Valid base64 JSON with an unknown direction
+        "eyJjIjoiMjAyNi0xMC0xN1QwMDowMDowMCIsImkiOiIwIiwiZCI6InVwIn0",
+    ],
+)
+def test_invalid_cursor_is_rejected(value: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode(value)
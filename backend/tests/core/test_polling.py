@@ -0,0 +1,62 @@
+"""Unit tests for the adaptive poll policies."""
+
+import random
+
+import pytest
+
+from app.core.polling import (
+    BackoffPollPolicy,
+    ExponentialPollPolicy,
+    FibonacciPollPolicy,
+)
+
+
+def test_exponential_policy_doubles_up_to_cap() -> None:
+    policy = ExponentialPollPolicy(min_interval=1, max_interval=10)
+
+    intervals = [policy.next_interval(new_event=False) for _ in range(6)]
+
+    assert intervals == [1, 2, 4, 8, 10, 10]
+
+
+def test_fibonacci_policy_grows_gently() -> None:
+    policy = FibonacciPollPolicy(min_interval=1, max_interval=10)
+
+    intervals = [policy.next_interval(new_event=False) for _ in range(7)]
+
+    assert intervals == [1, 2, 3, 5, 8, 10, 10]
+
+
+def test_new_event_resets_to_min_interval() -> None:
+    policy = ExponentialPollPolicy(min_interval=1, max_interval=10)
+    for _ in range(5):
+        policy.next_interval(new_event=False)
+
+    assert policy.next_interval(new_event=True) == 1
+    assert policy.next_interval(new_event=False) == 2
+
+
+def test_jitter_stays_within_bounds() -> None:
+    policy = ExponentialPollPolicy(
+        min_interval=4, max_interval=8, jitter=0.5, rng=random.Random(0)
+    )
+
+    intervals = [policy.next_interval(new_event=True) for _ in range(50)]
+
+    assert all(2 <= interval <= 6 for interval in intervals)
+    assert len(set(intervals)) > 1
+
+
+def test_jitter_never_exceeds_cap() -> None:
+    policy = ExponentialPollPolicy(
+        min_interval=1, max_interval=4, jitter=0.5, rng=random.Random(0)
+    )
+
+    intervals = [policy.next_interval(new_event=False) for _ in range(50)]
+
+    assert max(intervals) <= 4
+
+
+def test_backoff_policy_requires_a_schedule() -> None:
+    with pytest.raises(TypeError):
+        BackoffPollPolicy(min_interval=1, max_interval=10)  # type: ignore[abstract]
@@ -0,0 +1,94 @@
+"""Unit tests for the client-side token-bucket rate limiter."""
+
+import time
+
+import pytest
+
+from app.core.metrics import metrics
+from app.core.ratelimit import MemoryTokenBucketBackend, RateLimiter
+from app.exceptions.admission import AdmissionError, AdmissionErrorCode
+
+pytestmark = pytest.mark.anyio
+
+
+def create_limiter(
+    requests_per_minute: float = 60, burst: int = 2, max_wait: float = 0.0
+) -> RateLimiter:
+    return RateLimiter(
+        MemoryTokenBucketBackend(),
+        limits={("tavily", "search"): (requests_per_minute, burst)},
+        max_wait=max_wait,
+    )
+
+
+async def test_burst_is_admitted_then_rejected_with_retry_after() -> None:
+    limiter = create_limiter()
+
+    await limiter.acquire("tavily", "search")
+    await limiter.acquire("tavily", "search")
+    with pytest.raises(AdmissionError) as exc_info:
+        await limiter.acquire("tavily", "search")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.error_code == AdmissionErrorCode.RATE_LIMIT_EXCEEDED
+    assert exc_info.value.retry_after == 1
+    assert exc_info.value.details == {"provider": "tavily", "endpoint": "search"}
+
+
+async def test_endpoints_have_separate_buckets() -> None:
+    limiter = RateLimiter(
+        MemoryTokenBucketBackend(),
+        limits={("tavily", "search"): (60, 1), ("tavily", "crawl"): (60, 1)},
+        max_wait=0.0,
+    )
+
+    await limiter.acquire("tavily", "search")
+    await limiter.acquire("tavily", "crawl")
+    with pytest.raises(AdmissionError):
+        await limiter.acquire("tavily", "search")
+
+
+async def test_unconfigured_endpoint_is_not_limited() -> None:
+    limiter = create_limiter(burst=1)
+
+    for _ in range(10):
+        await limiter.acquire("tavily", "map")
+
+
+async def test_empty_bucket_waits_for_refill() -> None:
+    metrics.reset()
+    # 600 requests per minute refills one token every 0.1s
+    limiter = create_limiter(requests_per_minute=600, burst=1, max_wait=1.0)
+
+    await limiter.acquire("tavily", "search")
+    started_at = time.monotonic()
+    await limiter.acquire("tavily", "search")
+
+    assert time.monotonic() - started_at >= 0.05
+    assert (
+        metrics.counter("ratelimit.delayed", provider="tavily", endpoint="search") == 1
+    )
+
+
+async def test_waiting_callers_queue_behind_each_other() -> None:
+    backend = MemoryTokenBucketBackend()
+
+    first = await backend.take("k", rate=10, capacity=1, max_wait=1.0)
+    second = await backend.take("k", rate=10, capacity=1, max_wait=1.0)
+    third = await backend.take("k", rate=10, capacity=1, max_wait=1.0)
+
+    assert first == (True, 0.0)
+    assert second[0] and second[1] == pytest.approx(0.1, abs=0.01)
+    assert third[0] and third[1] == pytest.approx(0.2, abs=0.01)
+
+
+async def test_rejected_call_does_not_consume_a_token() -> None:
+    backend = MemoryTokenBucketBackend()
+
+    await backend.take("k", rate=10, capacity=1, max_wait=0.0)
+    reserved, _ = await backend.take("k", rate=10, capacity=1, max_wait=0.0)
+    assert not reserved
+
+    reserved, wait = await backend.take("k", rate=10, capacity=1, max_wait=1.0)
+    assert reserved
+    assert wait == pytest.approx(0.1, abs=0.01)
@@ -0,0 +1,198 @@
+"""Unit tests for upstream retry policies and the retry budget."""
+
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from app.core.metrics import metrics
+from app.core.retry import (
+    UNPROCESSED_RETRY_EXCEPTIONS,
+    UNPROCESSED_RETRY_STATUSES,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def create_policy(
+    delays: list[float], budget: RetryBudget | None = None, **kwargs: object
+) -> RetryPolicy:
+    """Create a policy that records its delays instead of sleeping."""
+
+    async def sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    return RetryPolicy(
+        "gemini",
+        max_attempts=3,
+        base_delay=0.01,
+        max_delay=10.0,
+        budget=budget or RetryBudget(ratio=0.0, min_retries=100, window=60.0),
+        sleep=sleep,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def scripted(*outcomes: httpx.Response | Exception) -> Callable[[], Awaitable[object]]:
+    """Return a call that yields the given responses or raises the exceptions."""
+    remaining = list(outcomes)
+
+    async def call() -> object:
+        outcome = remaining.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call
+
+
+async def test_retries_transient_status_then_succeeds() -> None:
+    metrics.reset()
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    response = await policy.call(
+        "poll", scripted(httpx.Response(503), httpx.Response(502), httpx.Response(200))
+    )
+
+    assert response.status_code == 200
+    assert len(delays) == 2
+    assert (
+        metrics.counter(
+            "retry.attempts", provider="gemini", operation="poll", reason="503"
+        )
+        == 1
+    )
+
+
+async def test_retry_after_sets_the_minimum_delay() -> None:
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    await policy.call(
+        "poll",
+        scripted(
+            httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)
+        ),
+    )
+
+    assert delays == [3.0]
+
+
+async def test_retry_after_beyond_max_delay_is_not_retried() -> None:
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    response = await policy.call(
+        "poll", scripted(httpx.Response(429, headers={"Retry-After": "120"}))
+    )
+
+    assert response.status_code == 429
+    assert delays == []
+
+
+async def test_last_failed_response_returned_after_max_attempts() -> None:
+    metrics.reset()
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    response = await policy.call(
+        "poll", scripted(*(httpx.Response(503) for _ in range(3)))
+    )
+
+    assert response.status_code == 503
+    assert len(delays) == 2
+    assert metrics.counter("retry.exhausted", provider="gemini", operation="poll") == 1
+
+
+async def test_network_errors_are_retried_and_reraised() -> None:
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    with pytest.raises(httpx.ReadError):
+        await policy.call(
+            "poll", scripted(*(httpx.ReadError("reset") for _ in range(3)))
+        )
+
+    assert len(delays) == 2
+
+
+async def test_client_errors_are_not_retried() -> None:
+    delays: list[float] = []
+    policy = create_policy(delays)
+
+    response = await policy.call("poll", scripted(httpx.Response(404)))
+
+    assert response.status_code == 404
+    assert delays == []
+
+
+async def test_sdk_status_errors_are_classified_by_response() -> None:
+    delays: list[float] = []
+    policy = create_policy(delays)
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+    error = httpx.HTTPStatusError(
+        "bad gateway", request=request, response=httpx.Response(502, request=request)
+    )
+
+    result = await policy.call("search", scripted(error, httpx.Response(200)))
+
+    assert isinstance(result, httpx.Response)
+    assert len(delays) == 1
+
+
+async def test_unprocessed_policy_does_not_retry_bad_gateway() -> None:
+    delays: list[float] = []
+    policy = create_policy(
+        delays,
+        retry_statuses=UNPROCESSED_RETRY_STATUSES,
+        retry_exceptions=UNPROCESSED_RETRY_EXCEPTIONS,
+    )
+
+    response = await policy.call("deep_research", scripted(httpx.Response(502)))
+    assert response.status_code == 502
+
+    with pytest.raises(httpx.ReadError):
+        await policy.call("deep_research", scripted(httpx.ReadError("reset")))
+
+    assert delays == []
+
+
+async def test_budget_stops_retries_during_outage() -> None:
+    metrics.reset()
+    delays: list[float] = []
+    budget = RetryBudget(ratio=0.0, min_retries=2, window=60.0)
+    policy = create_policy(delays, budget=budget)
+
+    for _ in range(3):
+        await policy.call("poll", scripted(*(httpx.Response(503) for _ in range(3))))
+
+    # The first call spends both retries, the others fail on the first attempt
+    assert len(delays) == 2
+    assert (
+        metrics.counter("retry.budget_exhausted", provider="gemini", operation="poll")
+        == 2
+    )
+
+
+def test_budget_grows_with_traffic() -> None:
+    budget = RetryBudget(ratio=0.5, min_retries=0, window=60.0)
+
+    assert not budget.try_spend()
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_parse_retry_after_forms() -> None:
+    assert parse_retry_after(httpx.Response(503)) is None
+    assert parse_retry_after(httpx.Response(503, headers={"Retry-After": "7"})) == 7.0
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert parse_retry_after(httpx.Response(503, headers={"Retry-After": past})) == 0.0
+    assert (
+        parse_retry_after(httpx.Response(503, headers={"Retry-After": "soon"})) is None
+    )
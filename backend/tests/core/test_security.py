@@ -0,0 +1,38 @@
+"""Unit tests for password hashing in the process pool."""
+
+from collections.abc import Generator
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.security import (
+    get_password_hash_async,
+    shutdown_password_executor,
+    verify_and_update_password,
+    verify_password_async,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def password_executor() -> Generator[None, None, None]:
+    yield
+    shutdown_password_executor()
+
+
+async def test_hash_and_verify_in_process_pool() -> None:
+    hashed = await get_password_hash_async("correct horse")
+
+    assert await verify_password_async("correct horse", hashed)
+    assert not await verify_password_async("battery staple", hashed)
+
+
+def test_outdated_rounds_are_rehashed() -> None:
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("pw")
+
+    verified, new_hash = verify_and_update_password("pw", old_hash)
+    assert verified
+    assert new_hash is not None
+    assert verify_and_update_password("pw", new_hash) == (True, None)
+    assert verify_and_update_password("wrong", old_hash) == (False, None)
@@ -0,0 +1,106 @@
+"""Unit tests for in-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_execution() -> None:
+    inflight: SingleFlight[str] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(inflight.do("key", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 5
+    assert calls == 1
+    assert len(inflight) == 0
+
+
+async def test_different_keys_run_separately() -> None:
+    inflight: SingleFlight[str] = SingleFlight()
+
+    async def fetch_a() -> str:
+        return "a"
+
+    async def fetch_b() -> str:
+        return "b"
+
+    results = await asyncio.gather(inflight.do("a", fetch_a), inflight.do("b", fetch_b))
+    assert results == ["a", "b"]
+
+
+async def test_errors_propagate_to_all_waiters() -> None:
+    inflight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        raise ValueError("upstream failed")
+
+    waiters = [asyncio.create_task(inflight.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(inflight) == 0
+
+
+async def test_cancelling_one_waiter_keeps_shared_call() -> None:
+    inflight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(inflight.do("key", fetch))
+    second = asyncio.create_task(inflight.do("key", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await second == "result"
+
+
+async def test_cancelling_all_waiters_cancels_shared_call() -> None:
+    inflight: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "result"
+
+    first = asyncio.create_task(inflight.do("key", fetch))
+    second = asyncio.create_task(inflight.do("key", fetch))
+    await started.wait()
+
+    first.cancel()
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert len(inflight) == 0
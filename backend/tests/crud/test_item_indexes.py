@@ -0,0 +1,142 @@
+"""Query-plan regression tests for the item list queries.
+
+Seeds enough items that a sequential scan is clearly worse, then checks
+that Postgres answers each list query of GET /items from the expected
+index. The seed data is rolled back afterwards.
+"""
+
+import uuid
+from collections.abc import Generator
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, insert, tuple_
+from sqlmodel import col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.core.db import engine
+from app.models import Item, User, utc_now
+
+OWNERS = 40
+ITEMS_PER_OWNER = 500
+CONTENT_TYPES = ["search", "extract", "crawl", "map"]
+
+
+@pytest.fixture(scope="module")
+def seeded() -> Generator[tuple[Connection, uuid.UUID], None, None]:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        owner_ids = [uuid.uuid4() for _ in range(OWNERS)]
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "id": owner_id,
+                    "email": f"{owner_id}@example.com",
+                    "hashed_password": "x",
+                    "is_active": True,
+                    "is_superuser": False,
+                }
+                for owner_id in owner_ids
+            ],
+        )
+        now = utc_now()
+        items = []
+        for owner_index, owner_id in enumerate(owner_ids):
+            for index in range(ITEMS_PER_OWNER):
+                n = owner_index * ITEMS_PER_OWNER + index
+                # One item in a hundred is a Gemini deep research result
+                content_type = "gemini" if n % 100 == 0 else CONTENT_TYPES[n % 4]
+                created_at = now - timedelta(seconds=n)
+                items.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "owner_id": owner_id,
+                        "title": f"item {n}",
+                        "content_type": content_type,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+        connection.execute(insert(Item), items)
+        connection.exec_driver_sql("ANALYZE item")
+        yield connection, owner_ids[0]
+        transaction.rollback()
+
+
+def newest_first(statement: SelectOfScalar[Item]) -> SelectOfScalar[Item]:
+    order = (col(Item.created_at).desc(), col(Item.id).desc())
+    # One page plus the row that tells whether there is another
+    return statement.order_by(*order).limit(101)
+
+
+def used_indexes(connection: Connection, statement: Any) -> set[str]:
+    """Return the names of the indexes in the plan of a statement."""
+    compiled = statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    indexes = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            indexes.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return indexes
+
+
+def test_owner_list_uses_owner_index(seeded: tuple[Connection, uuid.UUID]) -> None:
+    connection, owner_id = seeded
+    statement = newest_first(select(Item).where(col(Item.owner_id) == owner_id))
+
+    assert "ix_item_owner_id_created_at_id" in used_indexes(connection, statement)
+
+
+def test_owner_next_page_uses_owner_index(
+    seeded: tuple[Connection, uuid.UUID],
+) -> None:
+    connection, owner_id = seeded
+    statement = newest_first(
+        select(Item).where(
+            col(Item.owner_id) == owner_id,
+            tuple_(col(Item.created_at), col(Item.id))
+            < tuple_(utc_now() - timedelta(seconds=250), uuid.uuid4()),
+        )
+    )
+
+    assert "ix_item_owner_id_created_at_id" in used_indexes(connection, statement)
+
+
+def test_owner_list_by_content_type_uses_composite_index(
+    seeded: tuple[Connection, uuid.UUID],
+) -> None:
+    connection, owner_id = seeded
+    statement = newest_first(
+        select(Item).where(
+            col(Item.owner_id) == owner_id, col(Item.content_type) == "crawl"
+        )
+    )
+
+    assert "ix_item_owner_id_content_type_created_at_id" in used_indexes(
+        connection, statement
+    )
+
+
+def test_list_of_all_owners_uses_created_at_index(
+    seeded: tuple[Connection, uuid.UUID],
+) -> None:
+    connection, _ = seeded
+    statement = newest_first(select(Item))
+
+    assert "ix_item_created_at_id" in used_indexes(connection, statement)
+
+
+def test_rare_content_type_list_uses_partial_index(
+    seeded: tuple[Connection, uuid.UUID],
+) -> None:
+    connection, _ = seeded
+    statement = newest_first(select(Item).where(col(Item.content_type) == "gemini"))
+
+    assert "ix_item_gemini_created_at_id" in used_indexes(connection, statement)
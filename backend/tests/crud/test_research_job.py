@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import utc_now
+from tests.utils.user import create_random_user
+from tests.utils.utils import random_lower_string
+
+
+def test_create_research_job(db: Session) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    request = {"query": "history of rust"}
+    job = crud.create_research_job(
+        session=db,
+        interaction_id=interaction_id,
+        owner_id=user.id,
+        request=request,
+        status="pending",
+    )
+    assert job.interaction_id == interaction_id
+    assert job.owner_id == user.id
+    assert job.provider == "gemini"
+    assert job.request == request
+    assert job.last_event_id is None
+
+
+def test_get_research_job(db: Session) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    crud.create_research_job(
+        session=db,
+        interaction_id=interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="pending",
+    )
+    job = crud.get_research_job(session=db, interaction_id=interaction_id)
+    assert job
+    assert job.interaction_id == interaction_id
+    assert crud.get_research_job(session=db, interaction_id="missing") is None
+
+
+def test_update_research_job(db: Session) -> None:
+    user = create_random_user(db)
+    job = crud.create_research_job(
+        session=db,
+        interaction_id=random_lower_string(),
+        owner_id=user.id,
+        request={"query": "q"},
+        status="pending",
+    )
+    created_at = job.updated_at
+    job = crud.update_research_job(
+        session=db,
+        db_job=job,
+        job_data={"status": "in_progress", "last_event_id": "e1"},
+    )
+    assert job.status == "in_progress"
+    assert job.last_event_id == "e1"
+    assert job.updated_at >= created_at
+
+
+def test_get_active_research_jobs(db: Session) -> None:
+    user = create_random_user(db)
+    running = crud.create_research_job(
+        session=db,
+        interaction_id=random_lower_string(),
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+    )
+    finished = crud.create_research_job(
+        session=db,
+        interaction_id=random_lower_string(),
+        owner_id=user.id,
+        request={"query": "q"},
+        status="completed",
+    )
+    jobs = crud.get_active_research_jobs(
+        session=db,
+        provider="gemini",
+        terminal_statuses=["completed", "failed", "cancelled"],
+    )
+    interaction_ids = {job.interaction_id for job in jobs}
+    assert running.interaction_id in interaction_ids
+    assert finished.interaction_id not in interaction_ids
+
+
+def test_claim_research_job_keeps_live_lease(db: Session) -> None:
+    user = create_random_user(db)
+    job = crud.create_research_job(
+        session=db,
+        interaction_id=random_lower_string(),
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+        lease_owner="first",
+        lease_expires_at=utc_now() + timedelta(minutes=1),
+    )
+    terminal_statuses = ["completed", "failed", "cancelled"]
+
+    held = crud.claim_research_job(
+        session=db,
+        interaction_id=job.interaction_id,
+        terminal_statuses=terminal_statuses,
+        lease_owner="second",
+        lease_expires_at=utc_now() + timedelta(minutes=1),
+    )
+    assert held and held.lease_owner == "first"
+
+    crud.update_research_job(
+        session=db,
+        db_job=job,
+        job_data={"lease_expires_at": utc_now() - timedelta(seconds=1)},
+    )
+    taken_over = crud.claim_research_job(
+        session=db,
+        interaction_id=job.interaction_id,
+        terminal_statuses=terminal_statuses,
+        lease_owner="second",
+        lease_expires_at=utc_now() + timedelta(minutes=1),
+    )
+    assert taken_over and taken_over.lease_owner == "second"
+
+
+def test_count_active_research_jobs(db: Session) -> None:
+    user = create_random_user(db)
+    for status in ["pending", "in_progress", "completed"]:
+        crud.create_research_job(
+            session=db,
+            interaction_id=random_lower_string(),
+            owner_id=user.id,
+            request={"query": "q"},
+            status=status,
+        )
+    count = crud.count_active_research_jobs(
+        session=db,
+        provider="gemini",
+        owner_id=user.id,
+        terminal_statuses=["completed", "failed", "cancelled"],
+    )
+    assert count == 2
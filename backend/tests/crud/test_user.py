@@ -1,5 +1,8 @@
+import pytest
 from fastapi.encoders import jsonable_encoder
+from passlib.context import CryptContext
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import crud
 from app.core.security import verify_password
@@ -16,6 +19,17 @@ def test_create_user(db: Session) -> None:
     assert hasattr(user, "hashed_password")
 
 
+@pytest.mark.anyio
+async def test_create_user_async(async_db: AsyncSession) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user_in = UserCreate(email=email, password=password)
+    user = await crud.create_user_async(session=async_db, user_create=user_in)
+    assert user.email == email
+    assert verify_password(password, user.hashed_password)
+    assert await crud.get_user_by_email_async(session=async_db, email=email) == user
+
+
 def test_authenticate_user(db: Session) -> None:
     email = random_email()
     password = random_lower_string()
@@ -33,6 +47,52 @@ def test_not_authenticate_user(db: Session) -> None:
     assert user is None
 
 
+@pytest.mark.anyio
+async def test_authenticate_user_async(db: Session, async_db: AsyncSession) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user_in = UserCreate(email=email, password=password)
+    user = crud.create_user(session=db, user_create=user_in)
+    authenticated_user = await crud.authenticate_async(
+        session=async_db, email=email, password=password
+    )
+    assert authenticated_user
+    assert user.email == authenticated_user.email
+
+
+@pytest.mark.anyio
+async def test_not_authenticate_user_async(async_db: AsyncSession) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user = await crud.authenticate_async(
+        session=async_db, email=email, password=password
+    )
+    assert user is None
+
+
+@pytest.mark.anyio
+async def test_authenticate_rehashes_outdated_hash(
+    db: Session, async_db: AsyncSession
+) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user = crud.create_user(
+        session=db, user_create=UserCreate(email=email, password=password)
+    )
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash(password)
+    user.hashed_password = old_hash
+    db.add(user)
+    db.commit()
+
+    authenticated_user = await crud.authenticate_async(
+        session=async_db, email=email, password=password
+    )
+
+    assert authenticated_user
+    assert authenticated_user.hashed_password != old_hash
+    assert verify_password(password, authenticated_user.hashed_password)
+
+
 def test_check_if_user_is_active(db: Session) -> None:
     email = random_email()
     password = random_lower_string()
@@ -89,3 +149,21 @@ def test_update_user(db: Session) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+@pytest.mark.anyio
+async def test_update_user_async(db: Session, async_db: AsyncSession) -> None:
+    password = random_lower_string()
+    email = random_email()
+    user_in = UserCreate(email=email, password=password)
+    user = crud.create_user(session=db, user_create=user_in)
+    db_user = await async_db.get(User, user.id)
+    assert db_user
+    new_password = random_lower_string()
+    user_in_update = UserUpdate(password=new_password, full_name="Async User")
+    await crud.update_user_async(
+        session=async_db, db_user=db_user, user_in=user_in_update
+    )
+    db.refresh(user)
+    assert user.full_name == "Async User"
+    assert verify_password(new_password, user.hashed_password)
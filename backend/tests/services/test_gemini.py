@@ -0,0 +1,119 @@
+"""Unit tests for GeminiService polling behaviour.
+
+Gemini responses are served by an httpx.MockTransport so these tests cover
+the wait loop, poll policy and metrics without network access.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core import deadline
+from app.core.config import UpstreamTimeouts, settings
+from app.core.metrics import metrics
+from app.core.polling import ExponentialPollPolicy
+from app.exceptions.gemini import GeminiAPIError
+from app.schemas.gemini import GeminiInteractionStatus
+from app.services.gemini import GeminiService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def gemini_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure an API key and start from an empty metrics registry."""
+    monkeypatch.setattr(settings.gemini, "api_key", "test-key")
+    metrics.reset()
+
+
+def create_service(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> GeminiService:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return GeminiService(client=client)
+
+
+class RecordingPolicy(ExponentialPollPolicy):
+    """Exponential policy that records the new_event flags it receives."""
+
+    def __init__(self) -> None:
+        super().__init__(min_interval=0.001, max_interval=0.002)
+        self.new_events: list[bool] = []
+
+    def next_interval(self, *, new_event: bool) -> float:
+        self.new_events.append(new_event)
+        return super().next_interval(new_event=new_event)
+
+
+async def test_policy_told_about_new_events() -> None:
+    responses: list[dict[str, Any]] = [
+        {"status": "in_progress", "event_id": "e1"},
+        {"status": "in_progress", "event_id": "e1"},
+        {"status": "in_progress", "event_id": "e2"},
+        {"status": "completed", "event_id": "e3", "outputs": [{"text": "done"}]},
+    ]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=responses[len(requests) - 1])
+
+    service = create_service(handler)
+    policy = RecordingPolicy()
+
+    result = await service.wait_for_completion("job-1", policy=policy)
+
+    assert result.status == GeminiInteractionStatus.COMPLETED
+    assert policy.new_events == [True, False, True]
+    snapshot = metrics.snapshot()["distributions"]
+    assert snapshot["gemini.polls_per_job{outcome=completed}"]["sum"] == 4
+
+
+async def test_deadline_stops_waiting() -> None:
+    service = create_service(
+        lambda _request: httpx.Response(200, json={"status": "in_progress"})
+    )
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await service.wait_for_completion(
+            "job-1", policy=RecordingPolicy(), deadline=0.01
+        )
+
+    assert exc_info.value.error_code == "polling_timeout"
+    snapshot = metrics.snapshot()["distributions"]
+    assert snapshot["gemini.polls_per_job{outcome=timeout}"]["count"] == 1
+
+
+async def test_poll_uses_operation_timeouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        settings.gemini, "timeouts", {"poll": UpstreamTimeouts(connect=2, read=9)}
+    )
+    timeouts: list[dict[str, float]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"status": "in_progress"})
+
+    await create_service(handler).poll_research("job-1")
+
+    assert timeouts == [{"connect": 2, "read": 9, "write": 9, "pool": 5}]
+
+
+async def test_expired_deadline_times_out_without_calling_upstream() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "in_progress"})
+
+    deadline.set_deadline(-1.0)
+    try:
+        with pytest.raises(GeminiAPIError) as exc_info:
+            await create_service(handler).poll_research("job-1")
+    finally:
+        deadline.clear_deadline()
+
+    assert exc_info.value.error_code == "request_timeout"
+    assert requests == []
@@ -0,0 +1,416 @@
+"""Unit tests for the Gemini background job supervisor.
+
+Gemini polls are served by an httpx.MockTransport that replays a scripted
+sequence of responses, so these tests cover polling, fan-out and error
+handling without network access.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+from app.exceptions.admission import AdmissionError
+from app.exceptions.gemini import GeminiAPIError
+from app.models import utc_now
+from app.schemas.gemini import (
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
+from app.services.gemini_jobs import GeminiJobSupervisor
+from tests.utils.gemini import ScriptedGemini, create_poll_response
+from tests.utils.user import create_random_user
+from tests.utils.utils import random_lower_string
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def gemini_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure an API key and fast poll intervals for the supervisor."""
+    monkeypatch.setattr(settings.gemini, "api_key", "test-key")
+    monkeypatch.setattr(settings.gemini, "min_poll_interval", 0.01)
+    monkeypatch.setattr(settings.gemini, "max_poll_interval", 0.02)
+
+
+@pytest.fixture
+async def supervisor_factory() -> AsyncGenerator[Any, None]:
+    """Create supervisors backed by scripted Gemini responses."""
+    supervisors: list[GeminiJobSupervisor] = []
+
+    def create(
+        script: ScriptedGemini, engine: Engine | None = None
+    ) -> GeminiJobSupervisor:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(script))
+        supervisor = GeminiJobSupervisor(client=client, engine=engine)
+        supervisors.append(supervisor)
+        return supervisor
+
+    yield create
+    for supervisor in supervisors:
+        await supervisor.aclose()
+
+
+async def test_wait_returns_completed_result(supervisor_factory: Any) -> None:
+    script = ScriptedGemini(
+        [
+            httpx.Response(200, json=create_poll_response("in_progress", "e1")),
+            httpx.Response(200, json=create_poll_response("in_progress", "e2")),
+            httpx.Response(200, json=create_poll_response("completed", "e3")),
+        ]
+    )
+    supervisor = supervisor_factory(script)
+
+    result = await supervisor.wait("job-1")
+
+    assert result.status == GeminiInteractionStatus.COMPLETED
+    assert len(script.requests) == 3
+    # Each poll resumes from the last event seen
+    assert script.requests[2].url.params["last_event_id"] == "e2"
+
+
+async def test_watchers_share_one_poller(supervisor_factory: Any) -> None:
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("completed", "e1"))]
+    )
+    supervisor = supervisor_factory(script)
+
+    first = await supervisor.get_status("job-1")
+    second = await supervisor.get_status("job-1")
+    await supervisor.wait("job-1")
+
+    assert first == second
+    assert len(script.requests) == 1
+
+
+async def test_subscribe_yields_updates_until_done(supervisor_factory: Any) -> None:
+    script = ScriptedGemini(
+        [
+            httpx.Response(200, json=create_poll_response("in_progress", "e1")),
+            httpx.Response(200, json=create_poll_response("completed", "e2")),
+        ]
+    )
+    supervisor = supervisor_factory(script)
+
+    statuses = [update.status async for update in supervisor.subscribe("job-1")]
+
+    assert statuses[-1] == GeminiInteractionStatus.COMPLETED
+
+
+async def test_subscribe_skips_event_already_received(
+    supervisor_factory: Any,
+) -> None:
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("completed", "e1"))]
+    )
+    supervisor = supervisor_factory(script)
+    await supervisor.wait("job-1")
+
+    replayed = [update async for update in supervisor.subscribe("job-1", "e1")]
+
+    assert replayed == []
+
+
+async def test_subscribe_resumes_untracked_job_from_event(
+    supervisor_factory: Any,
+) -> None:
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("completed", "e5"))]
+    )
+    supervisor = supervisor_factory(script)
+
+    updates = [update async for update in supervisor.subscribe("job-1", "e4")]
+
+    assert [update.event_id for update in updates] == ["e5"]
+    assert script.requests[0].url.params["last_event_id"] == "e4"
+
+
+async def test_transient_errors_are_retried(supervisor_factory: Any) -> None:
+    script = ScriptedGemini(
+        [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json=create_poll_response("completed", "e1")),
+        ]
+    )
+    supervisor = supervisor_factory(script)
+
+    result = await supervisor.wait("job-1")
+
+    assert result.status == GeminiInteractionStatus.COMPLETED
+    assert len(script.requests) == 2
+
+
+async def test_get_status_reports_transient_error_without_waiting(
+    supervisor_factory: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "RETRY_MAX_ATTEMPTS", 1)
+    script = ScriptedGemini(
+        [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json=create_poll_response("in_progress", "e1")),
+        ]
+    )
+    supervisor = supervisor_factory(script)
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await asyncio.wait_for(supervisor.get_status("job-1"), timeout=1)
+    assert "HTTP 503" in exc_info.value.message
+
+    async def recovered() -> GeminiDeepResearchResultResponse:
+        while True:
+            try:
+                return await supervisor.get_status("job-1")
+            except GeminiAPIError:
+                await asyncio.sleep(0.01)
+
+    result = await asyncio.wait_for(recovered(), timeout=1)
+    assert result.status == GeminiInteractionStatus.IN_PROGRESS
+
+
+async def test_unknown_interaction_fails_job(supervisor_factory: Any) -> None:
+    script = ScriptedGemini([httpx.Response(404, text="not found")])
+    supervisor = supervisor_factory(script)
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await supervisor.get_status("missing")
+
+    assert exc_info.value.status_code == 404
+    assert len(script.requests) == 1
+
+
+async def test_failed_job_raises_on_wait(supervisor_factory: Any) -> None:
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("failed", "e1"))]
+    )
+    supervisor = supervisor_factory(script)
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await supervisor.wait("job-1")
+
+    assert exc_info.value.error_code == "research_failed"
+
+
+async def test_tracked_job_is_persisted(supervisor_factory: Any, db: Session) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    script = ScriptedGemini(
+        [
+            httpx.Response(200, json=create_poll_response("in_progress", "e1")),
+            httpx.Response(200, json=create_poll_response("completed", "e2")),
+        ]
+    )
+    supervisor = supervisor_factory(script, engine=engine)
+
+    await supervisor.track(
+        interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="pending",
+    )
+    await supervisor.wait(interaction_id)
+
+    with Session(engine) as session:
+        db_job = crud.get_research_job(session=session, interaction_id=interaction_id)
+    assert db_job
+    assert db_job.owner_id == user.id
+    assert db_job.status == "completed"
+    assert db_job.last_event_id == "e2"
+    assert db_job.result and db_job.result["outputs"]
+
+
+async def test_resume_continues_from_stored_event(
+    supervisor_factory: Any, db: Session
+) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    crud.create_research_job(
+        session=db,
+        interaction_id=interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+    )
+    db_job = crud.get_research_job(session=db, interaction_id=interaction_id)
+    assert db_job
+    crud.update_research_job(
+        session=db, db_job=db_job, job_data={"last_event_id": "e7"}
+    )
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("completed", "e8"))]
+    )
+    supervisor = supervisor_factory(script, engine=engine)
+
+    assert await supervisor.resume() >= 1
+    result = await supervisor.wait(interaction_id)
+
+    assert result.status == GeminiInteractionStatus.COMPLETED
+    resumed = [
+        request for request in script.requests if interaction_id in request.url.path
+    ]
+    assert resumed[0].url.params["last_event_id"] == "e7"
+
+
+async def test_two_supervisors_resume_a_job_once(
+    supervisor_factory: Any, db: Session
+) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    crud.create_research_job(
+        session=db,
+        interaction_id=interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+    )
+    scripts = [
+        ScriptedGemini(
+            [httpx.Response(200, json=create_poll_response("completed", "e1"))]
+        )
+        for _ in range(2)
+    ]
+    supervisors = [supervisor_factory(script, engine=engine) for script in scripts]
+
+    await asyncio.gather(*(supervisor.resume() for supervisor in supervisors))
+    results = await asyncio.gather(
+        *(supervisor.wait(interaction_id) for supervisor in supervisors)
+    )
+
+    assert all(r.status == GeminiInteractionStatus.COMPLETED for r in results)
+    polls = [
+        request
+        for script in scripts
+        for request in script.requests
+        if interaction_id in request.url.path
+    ]
+    assert len(polls) == 1
+
+
+async def test_job_leased_elsewhere_is_read_from_record(
+    supervisor_factory: Any, db: Session
+) -> None:
+    user = create_random_user(db)
+    interaction_id = random_lower_string()
+    db_job = crud.create_research_job(
+        session=db,
+        interaction_id=interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+        lease_owner="other-worker",
+        lease_expires_at=utc_now() + timedelta(minutes=1),
+    )
+    crud.update_research_job(
+        session=db, db_job=db_job, job_data={"last_event_id": "e3"}
+    )
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("completed", "e4"))]
+    )
+    supervisor = supervisor_factory(script, engine=engine)
+
+    status = await supervisor.get_status(interaction_id)
+    assert status.status == GeminiInteractionStatus.IN_PROGRESS
+    assert status.event_id == "e3"
+
+    # The other worker process finishes the job
+    result = create_poll_response("completed", "e4")
+    crud.update_research_job(
+        session=db,
+        db_job=db_job,
+        job_data={"status": "completed", "last_event_id": "e4", "result": result},
+    )
+    finished = await asyncio.wait_for(supervisor.wait(interaction_id), timeout=1)
+
+    assert finished.status == GeminiInteractionStatus.COMPLETED
+    assert finished.outputs
+    assert script.requests == []
+
+
+async def test_reserve_counts_unfinished_jobs(
+    supervisor_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.gemini, "max_active_jobs_per_user", 1)
+    user = create_random_user(db)
+    script = ScriptedGemini(
+        [httpx.Response(200, json=create_poll_response("in_progress", "e1"))]
+    )
+    supervisor = supervisor_factory(script, engine=engine)
+    interaction_id = random_lower_string()
+    reservation = await supervisor.reserve(user.id, request={"query": "q"})
+    await supervisor.track(
+        interaction_id,
+        owner_id=user.id,
+        request={"query": "q"},
+        status="in_progress",
+        reservation=reservation,
+    )
+
+    with pytest.raises(AdmissionError) as exc_info:
+        await supervisor.reserve(user.id, request={"query": "q"})
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.error_code == "job_limit_exceeded"
+    # The reserved slot's placeholder became the job's record
+    with Session(engine) as session:
+        assert not crud.get_research_job(session=session, interaction_id=reservation)
+        assert crud.get_research_job(session=session, interaction_id=interaction_id)
+    other = await supervisor.reserve(create_random_user(db).id, request={})
+    await supervisor.release(other)
+
+
+async def test_concurrent_reservations_respect_job_limit(
+    supervisor_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.gemini, "max_active_jobs_per_user", 2)
+    user = create_random_user(db)
+    # Two worker processes sharing the table
+    supervisors = [
+        supervisor_factory(ScriptedGemini([]), engine=engine) for _ in range(2)
+    ]
+
+    outcomes = await asyncio.gather(
+        *(
+            supervisors[i % 2].reserve(user.id, request={"query": "q"})
+            for i in range(6)
+        ),
+        return_exceptions=True,
+    )
+
+    reservations = [outcome for outcome in outcomes if isinstance(outcome, str)]
+    assert len(reservations) == 2
+    assert all(
+        isinstance(outcome, AdmissionError)
+        for outcome in outcomes
+        if not isinstance(outcome, str)
+    )
+    # A released slot can be reserved again
+    await supervisors[0].release(reservations[0])
+    reservations[0] = await supervisors[0].reserve(user.id, request={"query": "q"})
+    for reservation in reservations:
+        await supervisors[0].release(reservation)
+
+
+async def test_resume_deletes_abandoned_reservation(
+    supervisor_factory: Any, db: Session
+) -> None:
+    user = create_random_user(db)
+    stopped = supervisor_factory(ScriptedGemini([]), engine=engine)
+    reservation = await stopped.reserve(user.id, request={"query": "q"})
+    # The process stops before its interaction started
+    await stopped.aclose()
+    script = ScriptedGemini([])
+    supervisor = supervisor_factory(script, engine=engine)
+
+    await supervisor.resume()
+
+    with Session(engine) as session:
+        assert not crud.get_research_job(session=session, interaction_id=reservation)
+    assert reservation not in supervisor._jobs
+    assert script.requests == []
@@ -0,0 +1,134 @@
+"""Unit tests for PerplexityService streaming.
+
+Requests are served by an httpx.MockTransport so these tests exercise SSE
+parsing, accumulation and error mapping without network access.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.exceptions.perplexity import PerplexityAPIError
+from app.schemas.perplexity import PerplexityDeepResearchRequest
+from app.services.perplexity import PerplexityService, PerplexityStreamAccumulator
+
+pytestmark = [pytest.mark.anyio, pytest.mark.usefixtures("perplexity_api_key")]
+
+
+@pytest.fixture
+def perplexity_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure a Perplexity API key so the service can be constructed."""
+    monkeypatch.setattr(settings.perplexity, "api_key", "test-key")
+
+
+def create_chunk(content: str, **extra: Any) -> dict[str, Any]:
+    """Create a streamed chat.completion.chunk object."""
+    return {
+        "id": "resp-1",
+        "model": "sonar-pro",
+        "created": 1700000000,
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": {"content": content}}],
+        **extra,
+    }
+
+
+def create_sse_body(chunks: list[dict[str, Any]]) -> str:
+    """Encode chunks as an SSE body terminated by the [DONE] sentinel."""
+    events = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
+    return "".join(events) + "data: [DONE]\n\n"
+
+
+def create_service(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> PerplexityService:
+    """Create a PerplexityService whose client is served by handler."""
+    return PerplexityService(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+CHUNKS = [
+    create_chunk("Hello", citations=["https://a.com"]),
+    create_chunk(" world", citations=["https://a.com"]),
+    {
+        **create_chunk("!", citations=["https://a.com", "https://b.com"]),
+        "usage": {"prompt_tokens": 3, "completion_tokens": 3, "total_tokens": 6},
+    },
+]
+
+
+async def test_stream_deep_research_yields_chunks() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, text=create_sse_body(CHUNKS))
+
+    service = create_service(handler)
+    request = PerplexityDeepResearchRequest(query="test")
+
+    chunks = [chunk async for chunk in service.stream_deep_research(request)]
+
+    assert chunks == CHUNKS
+
+
+async def test_stream_deep_research_maps_http_errors() -> None:
+    service = create_service(lambda _request: httpx.Response(429, text="slow down"))
+    request = PerplexityDeepResearchRequest(query="test")
+
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        async for _chunk in service.stream_deep_research(request):
+            pass
+
+    assert exc_info.value.status_code == 429
+
+
+async def test_open_circuit_fails_fast_with_503() -> None:
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500, text="upstream down")
+
+    service = create_service(handler)
+    request = PerplexityDeepResearchRequest(query="test")
+    threshold = settings.perplexity.circuit_failure_threshold
+
+    for _ in range(threshold + 1):
+        with pytest.raises(PerplexityAPIError) as exc_info:
+            async for _chunk in service.stream_deep_research(request):
+                pass
+
+    assert len(calls) == threshold
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.error_code == "service_unavailable"
+
+
+async def test_deep_research_with_stream_accumulates_response() -> None:
+    service = create_service(
+        lambda _request: httpx.Response(200, text=create_sse_body(CHUNKS))
+    )
+    request = PerplexityDeepResearchRequest(query="test", stream=True)
+
+    response = await service.deep_research(request)
+
+    assert response.choices[0].message.content == "Hello world!"
+    assert response.citations == ["https://a.com", "https://b.com"]
+    assert response.usage is not None
+    assert response.usage.total_tokens == 6
+
+
+def test_accumulator_keeps_choices_separate() -> None:
+    accumulator = PerplexityStreamAccumulator()
+    accumulator.add(create_chunk("a"))
+    accumulator.add(
+        {"choices": [{"index": 1, "delta": {"content": "b"}, "finish_reason": "stop"}]}
+    )
+
+    choices = accumulator.to_dict()["choices"]
+
+    assert [c["message"]["content"] for c in choices] == ["a", "b"]
+    assert choices[1]["finish_reason"] == "stop"
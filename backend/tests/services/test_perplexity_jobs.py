@@ -0,0 +1,312 @@
+"""Unit tests for the Perplexity background job manager.
+
+Perplexity calls are served by an httpx.MockTransport so these tests cover
+queueing, the worker pool bound and result retrieval without network access.
+"""
+
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+from app.exceptions.admission import AdmissionError
+from app.exceptions.perplexity import PerplexityAPIError
+from app.models import utc_now
+from app.schemas.perplexity import PerplexityDeepResearchRequest, PerplexityJobStatus
+from app.services.perplexity_jobs import PerplexityJob, PerplexityJobManager
+from tests.utils.user import create_random_user
+
+pytestmark = pytest.mark.anyio
+
+RESPONSE: dict[str, Any] = {
+    "id": "resp-1",
+    "model": "sonar-deep-research",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Report"}}],
+}
+
+
+@pytest.fixture(autouse=True)
+def perplexity_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure an API key and a small worker pool."""
+    monkeypatch.setattr(settings.perplexity, "api_key", "test-key")
+    monkeypatch.setattr(settings.perplexity, "job_workers", 2)
+    monkeypatch.setattr(settings.perplexity, "job_queue_size", 3)
+
+
+@pytest.fixture
+async def manager_factory() -> AsyncGenerator[Any, None]:
+    """Create job managers whose client is served by a handler."""
+    managers: list[PerplexityJobManager] = []
+
+    def create(
+        handler: Callable[[httpx.Request], Any], engine: Engine | None = None
+    ) -> PerplexityJobManager:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        manager = PerplexityJobManager(client=client, engine=engine)
+        managers.append(manager)
+        return manager
+
+    yield create
+    for manager in managers:
+        await manager.aclose()
+
+
+def create_request() -> PerplexityDeepResearchRequest:
+    return PerplexityDeepResearchRequest(query="history of rust")
+
+
+async def test_submit_returns_pending_job_and_completes(manager_factory: Any) -> None:
+    manager = manager_factory(lambda _request: httpx.Response(200, json=RESPONSE))
+    owner_id = uuid.uuid4()
+
+    job = await manager.submit(create_request(), owner_id=owner_id)
+    assert job.status == PerplexityJobStatus.PENDING
+
+    finished = await manager.wait(job.job_id)
+    assert finished.status == PerplexityJobStatus.COMPLETED
+    assert finished.result is not None
+    assert finished.result.choices[0].message.content == "Report"
+
+
+async def test_upstream_error_fails_job(manager_factory: Any) -> None:
+    manager = manager_factory(lambda _request: httpx.Response(429, text="slow down"))
+
+    job = await manager.submit(create_request(), owner_id=uuid.uuid4())
+    finished = await manager.wait(job.job_id)
+
+    assert finished.status == PerplexityJobStatus.FAILED
+    assert finished.error is not None
+    assert finished.error.error_code == "rate_limit_exceeded"
+
+
+async def test_worker_pool_bounds_concurrency(manager_factory: Any) -> None:
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return httpx.Response(200, json=RESPONSE)
+
+    manager = manager_factory(handler)
+    jobs = [
+        await manager.submit(create_request(), owner_id=uuid.uuid4()) for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.gather(*(manager.wait(job.job_id) for job in jobs))
+
+    assert peak == 2
+
+
+async def test_full_queue_rejects_submit(manager_factory: Any) -> None:
+    release = asyncio.Event()
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json=RESPONSE)
+
+    manager = manager_factory(handler)
+    # Two jobs occupy the workers, three more fill the queue
+    for _ in range(5):
+        await manager.submit(create_request(), owner_id=uuid.uuid4())
+        await asyncio.sleep(0)
+
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        await manager.submit(create_request(), owner_id=uuid.uuid4())
+
+    assert exc_info.value.status_code == 503
+    release.set()
+
+
+async def test_get_hides_other_users_jobs(manager_factory: Any) -> None:
+    manager = manager_factory(lambda _request: httpx.Response(200, json=RESPONSE))
+    job = await manager.submit(create_request(), owner_id=uuid.uuid4())
+
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        await manager.get(job.job_id, owner_id=uuid.uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+async def test_finished_job_readable_from_database(
+    manager_factory: Any, db: Session
+) -> None:
+    user = create_random_user(db)
+    manager = manager_factory(
+        lambda _request: httpx.Response(200, json=RESPONSE), engine=engine
+    )
+    job = await manager.submit(create_request(), owner_id=user.id)
+    await manager.wait(job.job_id)
+    # Simulate the in-memory state having expired
+    manager._jobs.clear()
+
+    stored = await manager.get(job.job_id, owner_id=user.id)
+
+    assert stored.status == PerplexityJobStatus.COMPLETED
+    assert stored.result is not None
+    with Session(engine) as session:
+        db_job = crud.get_research_job(session=session, interaction_id=job.job_id)
+    assert db_job
+    assert db_job.provider == "perplexity"
+
+
+def create_stored_job(
+    db: Session,
+    lease_owner: str | None = None,
+    lease_expires_at: datetime | None = None,
+) -> str:
+    """Store an unfinished job as a stopped process would have left it."""
+    user = create_random_user(db)
+    job_id = uuid.uuid4().hex
+    crud.create_research_job(
+        session=db,
+        interaction_id=job_id,
+        owner_id=user.id,
+        request=create_request().model_dump(mode="json"),
+        status=PerplexityJobStatus.IN_PROGRESS.value,
+        provider="perplexity",
+        lease_owner=lease_owner,
+        lease_expires_at=lease_expires_at,
+    )
+    return job_id
+
+
+async def test_two_managers_resume_a_job_once(
+    manager_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Leave room to claim every unfinished job left by earlier tests
+    monkeypatch.setattr(settings.perplexity, "job_queue_size", 100)
+    job_id = create_stored_job(db)
+    first, second = (
+        manager_factory(
+            lambda _request: httpx.Response(200, json=RESPONSE), engine=engine
+        )
+        for _ in range(2)
+    )
+
+    await asyncio.gather(first.resume(), second.resume())
+
+    claimed_by = [manager for manager in (first, second) if job_id in manager._jobs]
+    assert len(claimed_by) == 1
+
+
+async def test_resume_takes_over_only_expired_leases(
+    manager_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.perplexity, "job_queue_size", 100)
+    expired_id = create_stored_job(
+        db, lease_owner="stopped", lease_expires_at=utc_now() - timedelta(seconds=1)
+    )
+    held_id = create_stored_job(
+        db, lease_owner="running", lease_expires_at=utc_now() + timedelta(minutes=1)
+    )
+    manager = manager_factory(
+        lambda _request: httpx.Response(200, json=RESPONSE), engine=engine
+    )
+
+    await manager.resume()
+    finished = await manager.wait(expired_id)
+
+    assert finished.status == PerplexityJobStatus.COMPLETED
+    assert held_id not in manager._jobs
+    with Session(engine) as session:
+        done = crud.get_research_job(session=session, interaction_id=expired_id)
+        held = crud.get_research_job(session=session, interaction_id=held_id)
+    assert done and done.lease_owner is None
+    assert held and held.lease_owner == "running"
+
+
+async def test_submit_over_active_job_limit_is_refused(
+    manager_factory: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.perplexity, "max_active_jobs_per_user", 1)
+    release = asyncio.Event()
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json=RESPONSE)
+
+    manager = manager_factory(handler)
+    owner_id = uuid.uuid4()
+    job = await manager.submit(create_request(), owner_id=owner_id)
+
+    with pytest.raises(AdmissionError) as exc_info:
+        await manager.submit(create_request(), owner_id=owner_id)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.error_code == "job_limit_exceeded"
+    assert exc_info.value.retry_after > 0
+    # Other users are unaffected, and finishing a job frees the slot
+    await manager.submit(create_request(), owner_id=uuid.uuid4())
+    release.set()
+    await manager.wait(job.job_id)
+    await manager.submit(create_request(), owner_id=owner_id)
+
+
+async def test_active_job_limit_counts_stored_jobs(
+    manager_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.perplexity, "max_active_jobs_per_user", 1)
+    user = create_random_user(db)
+    # A job of this user run by another worker process
+    crud.create_research_job(
+        session=db,
+        interaction_id=uuid.uuid4().hex,
+        owner_id=user.id,
+        request=create_request().model_dump(mode="json"),
+        status=PerplexityJobStatus.IN_PROGRESS.value,
+        provider="perplexity",
+        lease_owner="other-worker",
+        lease_expires_at=utc_now() + timedelta(minutes=1),
+    )
+    manager = manager_factory(
+        lambda _request: httpx.Response(200, json=RESPONSE), engine=engine
+    )
+
+    with pytest.raises(AdmissionError):
+        await manager.submit(create_request(), owner_id=user.id)
+
+
+async def test_concurrent_submits_respect_active_job_limit(
+    manager_factory: Any, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.perplexity, "max_active_jobs_per_user", 2)
+    user = create_random_user(db)
+    release = asyncio.Event()
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json=RESPONSE)
+
+    # Two worker processes sharing the table
+    managers = [manager_factory(handler, engine=engine) for _ in range(2)]
+
+    outcomes = await asyncio.gather(
+        *(managers[i % 2].submit(create_request(), owner_id=user.id) for i in range(6)),
+        return_exceptions=True,
+    )
+
+    jobs = [outcome for outcome in outcomes if isinstance(outcome, PerplexityJob)]
+    assert len(jobs) == 2
+    assert all(
+        isinstance(outcome, AdmissionError)
+        for outcome in outcomes
+        if not isinstance(outcome, PerplexityJob)
+    )
+    release.set()
+    for job in jobs:
+        await managers[0 if job.job_id in managers[0]._jobs else 1].wait(job.job_id)
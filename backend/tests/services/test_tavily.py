@@ -0,0 +1,379 @@
+"""Unit tests for TavilyService behaviour around the Tavily SDK.
+
+The AsyncTavilyClient is replaced with AsyncMock methods so these tests
+exercise caching and request handling in the service layer only.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache import CacheStatus, get_cache_status
+from app.core.hedging import HedgePolicy
+from app.core.ratelimit import MemoryTokenBucketBackend, RateLimiter
+from app.exceptions.admission import AdmissionError
+from app.services.tavily import TavilyService
+
+
+def create_search_result(query: str = "test query") -> dict[str, Any]:
+    """Create a minimal search response matching Tavily API structure."""
+    return {
+        "query": query,
+        "results": [
+            {
+                "url": "https://example.com",
+                "title": "Example",
+                "content": "Example content",
+                "score": 0.9,
+            }
+        ],
+    }
+
+
+def create_extract_result(
+    urls: list[str], failed: list[str] | None = None
+) -> dict[str, Any]:
+    """Create an extract response matching Tavily API structure."""
+    return {
+        "results": [
+            {"url": url, "raw_content": f"Content of {url}", "images": []}
+            for url in urls
+            if url not in (failed or [])
+        ],
+        "failed_results": [
+            {"url": url, "error": "Failed to fetch"} for url in failed or []
+        ],
+    }
+
+
+@pytest.fixture
+async def tavily_service() -> AsyncGenerator[TavilyService, None]:
+    """Create a TavilyService whose SDK client is mocked."""
+    service = TavilyService()
+    service._client = MagicMock()
+    service._client.search = AsyncMock(
+        side_effect=lambda **kw: create_search_result(kw["query"])
+    )
+    service._client.extract = AsyncMock(
+        side_effect=lambda **kw: create_extract_result(kw["urls"])
+    )
+    yield service
+    await service.aclose()
+
+
+@pytest.mark.anyio
+class TestSearchCache:
+    """Tests for the search response cache."""
+
+    async def test_repeated_search_served_from_cache(
+        self, tavily_service: TavilyService
+    ) -> None:
+        first = await tavily_service.search("python")
+        assert get_cache_status() == CacheStatus.MISS
+
+        second = await tavily_service.search("python")
+        assert get_cache_status() == CacheStatus.HIT
+
+        assert first == second
+        tavily_service._client.search.assert_called_once()
+
+    async def test_domain_order_and_case_share_cache_entry(
+        self, tavily_service: TavilyService
+    ) -> None:
+        await tavily_service.search("python", include_domains=["b.com", "A.com"])
+        await tavily_service.search("python", include_domains=["a.com", "b.com"])
+
+        assert get_cache_status() == CacheStatus.HIT
+        tavily_service._client.search.assert_called_once()
+
+    async def test_different_options_miss_cache(
+        self, tavily_service: TavilyService
+    ) -> None:
+        await tavily_service.search("python")
+        await tavily_service.search("python", search_depth="advanced")
+
+        assert get_cache_status() == CacheStatus.MISS
+        assert tavily_service._client.search.call_count == 2
+
+    async def test_errors_are_not_cached(self, tavily_service: TavilyService) -> None:
+        tavily_service._client.search.side_effect = Exception("upstream down")
+
+        with pytest.raises(Exception, match="upstream down"):
+            await tavily_service.search("python")
+
+        tavily_service._client.search.side_effect = None
+        tavily_service._client.search.return_value = create_search_result("python")
+        await tavily_service.search("python")
+
+        assert get_cache_status() == CacheStatus.MISS
+        assert tavily_service._client.search.call_count == 2
+
+
+@pytest.mark.anyio
+class TestExtractCache:
+    """Tests for the per-URL extract result cache."""
+
+    async def test_only_missing_urls_sent_upstream(
+        self, tavily_service: TavilyService
+    ) -> None:
+        await tavily_service.extract("https://b.com")
+        result = await tavily_service.extract(
+            ["https://a.com", "https://b.com", "https://c.com"]
+        )
+
+        assert get_cache_status() == CacheStatus.PARTIAL
+        last_call = tavily_service._client.extract.call_args
+        assert last_call.kwargs["urls"] == ["https://a.com", "https://c.com"]
+        assert [r["url"] for r in result["results"]] == [
+            "https://a.com",
+            "https://b.com",
+            "https://c.com",
+        ]
+
+    async def test_fully_cached_request_skips_upstream(
+        self, tavily_service: TavilyService
+    ) -> None:
+        await tavily_service.extract(["https://a.com", "https://b.com"])
+        result = await tavily_service.extract(["https://b.com", "https://a.com"])
+
+        assert get_cache_status() == CacheStatus.HIT
+        tavily_service._client.extract.assert_called_once()
+        assert [r["url"] for r in result["results"]] == [
+            "https://b.com",
+            "https://a.com",
+        ]
+
+    async def test_failed_results_preserved_and_not_cached(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._client.extract.side_effect = lambda **kw: create_extract_result(
+            kw["urls"], failed=["https://bad.com"]
+        )
+        await tavily_service.extract("https://a.com")
+        result = await tavily_service.extract(["https://a.com", "https://bad.com"])
+
+        assert result["failed_results"] == [
+            {"url": "https://bad.com", "error": "Failed to fetch"}
+        ]
+        await tavily_service.extract("https://bad.com")
+        assert tavily_service._client.extract.call_count == 3
+
+    async def test_domain_ttl_override_matches_subdomains(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._extract_cache_domain_ttls = {"example.com": 0}
+
+        assert tavily_service._extract_ttl_for("https://docs.example.com/a") == 0
+        assert (
+            tavily_service._extract_ttl_for("https://other.com")
+            == tavily_service._extract_cache_ttl
+        )
+
+        await tavily_service.extract("https://example.com")
+        await tavily_service.extract("https://example.com")
+        assert tavily_service._client.extract.call_count == 2
+
+    async def test_results_cached_under_requested_url(
+        self, tavily_service: TavilyService
+    ) -> None:
+        redirects = {"https://a.com": "https://www.a.com/home"}
+        tavily_service._client.extract.side_effect = lambda **kw: create_extract_result(
+            [redirects.get(url, f"{url}/") for url in kw["urls"]]
+        )
+
+        first = await tavily_service.extract(["https://a.com", "https://b.com"])
+        second = await tavily_service.extract(["https://b.com", "https://a.com"])
+
+        assert get_cache_status() == CacheStatus.HIT
+        tavily_service._client.extract.assert_called_once()
+        assert [r["url"] for r in second["results"]] == [
+            "https://b.com/",
+            "https://www.a.com/home",
+        ]
+        assert first["results"] == second["results"][::-1]
+
+    async def test_compressed_entries_round_trip(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._extract_cache_compress = True
+
+        first = await tavily_service.extract("https://a.com")
+        second = await tavily_service.extract("https://a.com")
+
+        assert get_cache_status() == CacheStatus.HIT
+        assert first["results"] == second["results"]
+
+
+@pytest.mark.anyio
+class TestExtractChunking:
+    """Tests for splitting large extract URL lists into concurrent chunks."""
+
+    async def test_large_list_split_into_chunks(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._extract_chunk_size = 2
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        result = await tavily_service.extract(urls)
+
+        chunk_sizes = sorted(
+            len(c.kwargs["urls"]) for c in tavily_service._client.extract.call_args_list
+        )
+        assert chunk_sizes == [1, 2, 2]
+        assert [r["url"] for r in result["results"]] == urls
+
+    async def test_failed_chunk_only_fails_its_urls(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._extract_chunk_size = 2
+
+        def extract_or_timeout(**kwargs: Any) -> dict[str, Any]:
+            if "https://slow.com" in kwargs["urls"]:
+                raise TimeoutError("Request timed out")
+            return create_extract_result(kwargs["urls"])
+
+        tavily_service._client.extract.side_effect = extract_or_timeout
+
+        result = await tavily_service.extract(
+            ["https://a.com", "https://b.com", "https://slow.com", "https://c.com"]
+        )
+
+        assert [r["url"] for r in result["results"]] == [
+            "https://a.com",
+            "https://b.com",
+        ]
+        assert [f["url"] for f in result["failed_results"]] == [
+            "https://slow.com",
+            "https://c.com",
+        ]
+
+    async def test_all_chunks_failing_raises(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._extract_chunk_size = 1
+        tavily_service._client.extract.side_effect = Exception("upstream down")
+
+        with pytest.raises(Exception, match="upstream down"):
+            await tavily_service.extract(["https://a.com", "https://b.com"])
+
+
+@pytest.mark.anyio
+class TestInflightCoalescing:
+    """Tests for coalescing concurrent identical upstream calls."""
+
+    async def test_concurrent_searches_share_upstream_call(
+        self, tavily_service: TavilyService
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_search(**kwargs: Any) -> dict[str, Any]:
+            await release.wait()
+            return create_search_result(kwargs["query"])
+
+        tavily_service._client.search.side_effect = slow_search
+        waiters = [
+            asyncio.create_task(tavily_service.search("python")) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters)
+        assert results[0] == results[1] == results[2]
+        tavily_service._client.search.assert_called_once()
+
+    async def test_concurrent_extracts_share_upstream_call(
+        self, tavily_service: TavilyService
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_extract(**kwargs: Any) -> dict[str, Any]:
+            await release.wait()
+            return {"results": [{"url": u, "raw_content": "x"} for u in kwargs["urls"]]}
+
+        tavily_service._client.extract = AsyncMock(side_effect=slow_extract)
+        waiters = [
+            asyncio.create_task(tavily_service.extract(["https://example.com"]))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        await asyncio.gather(*waiters)
+        tavily_service._client.extract.assert_called_once()
+
+
+@pytest.mark.anyio
+class TestRateLimiting:
+    """Tests for the client-side rate limiter in front of upstream calls."""
+
+    async def test_exhausted_bucket_rejects_before_upstream_call(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._rate_limiter = RateLimiter(
+            MemoryTokenBucketBackend(),
+            limits={("tavily", "search"): (60, 1)},
+            max_wait=0.0,
+        )
+
+        await tavily_service.search("python")
+        with pytest.raises(AdmissionError):
+            await tavily_service.search("rust")
+
+        tavily_service._client.search.assert_called_once()
+
+    async def test_cache_hits_do_not_consume_tokens(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._rate_limiter = RateLimiter(
+            MemoryTokenBucketBackend(),
+            limits={("tavily", "search"): (60, 1)},
+            max_wait=0.0,
+        )
+
+        await tavily_service.search("python")
+        await tavily_service.search("python")
+
+        assert get_cache_status() == CacheStatus.HIT
+
+
+@pytest.mark.anyio
+class TestSearchHedging:
+    """Tests for hedged basic searches."""
+
+    async def test_slow_basic_search_is_hedged(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._search_hedge = HedgePolicy(initial_delay=0.01, budget_ratio=1)
+        calls = 0
+
+        async def first_call_hangs(**kw: Any) -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return create_search_result(kw["query"])
+
+        tavily_service._client.search.side_effect = first_call_hangs
+
+        result = await tavily_service.search("python")
+
+        assert result["query"] == "python"
+        assert tavily_service._client.search.call_count == 2
+
+    async def test_advanced_search_is_not_hedged(
+        self, tavily_service: TavilyService
+    ) -> None:
+        tavily_service._search_hedge = HedgePolicy(initial_delay=0.01, budget_ratio=1)
+
+        async def slow(**kw: Any) -> dict[str, Any]:
+            await asyncio.sleep(0.03)
+            return create_search_result(kw["query"])
+
+        tavily_service._client.search.side_effect = slow
+
+        await tavily_service.search("python", search_depth="advanced")
+
+        tavily_service._client.search.assert_called_once()
@@ -0,0 +1,27 @@
+from typing import Any
+
+import httpx
+
+
+def create_poll_response(status: str, event_id: str | None = None) -> dict[str, Any]:
+    """Create a poll response matching the Gemini interactions API."""
+    response: dict[str, Any] = {"status": status}
+    if event_id:
+        response["event_id"] = event_id
+    if status == "completed":
+        response["outputs"] = [{"text": "Final report"}]
+    return response
+
+
+class ScriptedGemini:
+    """Serve scripted poll responses and count upstream requests."""
+
+    def __init__(self, responses: list[httpx.Response]) -> None:
+        self.responses = responses
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        # Repeat the last response once the script is exhausted
+        index = min(len(self.requests), len(self.responses)) - 1
+        return self.responses[index]